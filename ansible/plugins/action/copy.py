@@ -100,7 +100,13 @@ class ActionModule(ActionBase):
             lmode = "0%03o" % stat.S_IMODE(os.stat(source_full).st_mode)
 
         # Attempt to get remote file info
-        dest_status = self._execute_remote_stat(dest, all_vars=task_vars, follow=True, checksum=force)
+        # (using the GCfg files index, which spares reading unchanged - tracked and linked - files)
+        status_module_args = dict((k, v) for k, v in self._task.args.items() if k in ("root", "dest"))
+        status_module_args.update({"dest": dest, "force": force, "_checksum_only": True})
+        dest_status = self._execute_module(module_name="gcfg.gcfg.copy", module_args=status_module_args, task_vars=task_vars)
+        if dest_status.get("failed"):
+            result.update(dest_status)
+            return result
 
         if dest_status["exists"] and dest_status["isdir"]:
             # The dest is a directory.
@@ -127,12 +133,12 @@ class ActionModule(ActionBase):
         # Define a remote directory that we will copy the file to.
         tmp_src = self._connection._shell.join_path(self._connection._shell.tmpdir, "source")
 
-        # Transfer the file
+        # Transfer the file (unless its content is unchanged)
         remote_path = None
-        if not raw:
-            remote_path = self._transfer_file(source_full, tmp_src)
-        else:
+        if raw:
             self._transfer_file(source_full, dest)
+        elif content_changed:
+            remote_path = self._transfer_file(source_full, tmp_src)
 
         # FIXME: I don't think this is needed when PIPELINING=0 because the source is created
         # world readable.  Access to the directory itself is controlled via fixup_perms2() as
@@ -152,7 +158,7 @@ class ActionModule(ActionBase):
         # Run the copy module
 
         new_module_args = _create_remote_copy_args(self._task.args)
-        new_module_args.update({"src": tmp_src, "_content_changed": content_changed})
+        new_module_args.update({"src": tmp_src if remote_path else None, "_content_changed": content_changed})
         if not self._task.args.get("checksum"):
             new_module_args["checksum"] = local_checksum
 
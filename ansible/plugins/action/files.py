@@ -0,0 +1,74 @@
+# (c) 2021, Cédric Dufour <http://cedric.dufour.name>
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible.module_utils.six import string_types
+from ansible.plugins.action import ActionBase
+
+
+def _normalize_items(items):
+    """Return the given items as a list of dictionaries (with the 'path' key)"""
+    if isinstance(items, string_types):
+        items = [items]
+    elif isinstance(items, Mapping):
+        if "path" in items:
+            items = [items]
+        else:
+            # (path => options mapping)
+            items = [dict(options or {}, path=path) for (path, options) in items.items()]
+    normalized = []
+    for item in items:
+        if isinstance(item, string_types):
+            item = {"path": item}
+        elif not isinstance(item, Mapping):
+            raise AnsibleActionFail(f"Invalid item (expected path or dictionary); {item}")
+        normalized.append(dict(item))
+    return normalized
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        if task_vars is None:
+            task_vars = dict()
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        try:
+            module_args = self._task.args.copy()
+            if module_args.get("items") is None:
+                raise AnsibleActionFail("items is required")
+            module_args["items"] = _normalize_items(module_args["items"])
+
+            result.update(self._execute_module(module_name="gcfg.gcfg.files", module_args=module_args, task_vars=task_vars))
+
+            # Per-item diffs (for --diff display)
+            if self._play_context.diff and "results" in result:
+                result["diff"] = [r["diff"] for r in result["results"] if r.get("changed") and "diff" in r]
+        except AnsibleActionFail as e:
+            result.update(e.result)
+        finally:
+            self._remove_tmp_path(self._connection._shell.tmpdir)
+
+        return result
@@ -9,9 +9,6 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import os
-import pwd
-import socket
 import sys
 
 from ansible.module_utils.basic import AnsibleModule
@@ -53,9 +50,9 @@ options:
     default: Ansible (gcfg.gcfg)
   email:
     description:
-      - GIT commit author.
+      - GIT commit author email.
+      - Defaults to C(username@hostname) (as seen by "getpwuid" and "gethostbyaddr").
     type: str
-    default: username@hostname (as seen by "getpwuid" and "gethostbyaddr")
 seealso:
   - module: gcfg.gcfg.init
   - module: gcfg.gcfg.file
@@ -125,7 +122,7 @@ def main():
             tag=dict(type="str", required=True),
             message=dict(type="str", required=True),
             author=dict(type="str", default="Ansible (gcfg.gcfg)"),
-            email=dict(type="str", default="{0}@{1}".format(pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0])),
+            email=dict(type="str"),
         ),
         supports_check_mode=True
     )
@@ -153,12 +150,12 @@ def main():
     result = {"root": root}
 
     # (tag)
-    tag_exists = False
     try:
-        if gcfg.git(["tag", "-l", tag], True).strip() == tag:
-            tag_exists = True
+        git = gcfg.getGitBackend()
+        commit_tag = git.tag(tag)
     except Exception as e:
-        module.fail_json(msg=f"[GCfg] Failed to list GIT tag; {str(e)}")
+        module.fail_json(msg=f"[GCfg] Failed to look up GIT tag; {str(e)}")
+    tag_exists = commit_tag is not None
 
     # (commit)
     commit = "unknown"
@@ -168,18 +165,12 @@ def main():
         diff["after"]["tag"] = commit
         if not module.check_mode:
             try:
-                gcfg.git(["add", "--all"], True)
-                gcfg.git(["commit", "--message", message], True)
-                gcfg.git(["tag", tag, "HEAD"], True)
-                commit = gcfg.git(["rev-list", "-n", "1", tag], True).strip()
+                commit = gcfg.checkpoint(message, tag)
                 diff["after"]["tag"] = commit
             except Exception as e:
                 module.fail_json(msg=f"[GCfg] Failed to commit GIT checkpoint; {str(e)}")
     else:
-        try:
-            commit = gcfg.git(["rev-list", "-n", "1", tag], True).strip()
-        except Exception as e:
-            module.fail_json(msg=f"[GCfg] Failed to retrieve GIT commit; {str(e)}")
+        commit = commit_tag
 
     # Done
     result.update({"changed": changed, "diff": diff, "tag": tag, "commit": commit})
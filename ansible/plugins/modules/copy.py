@@ -12,9 +12,7 @@ __metaclass__ = type
 import errno
 import os
 import os.path
-import pwd
 import shutil
-import socket
 import stat
 import sys
 import tempfile
@@ -214,6 +212,8 @@ def _state_ansible2gcfg(state):
         gcfg_state = "symlink"
     elif state == "copy":
         gcfg_state = "copy"
+    elif state == "reflink":
+        gcfg_state = "reflink"
     return gcfg_state
 
 
@@ -227,6 +227,8 @@ def _state_gcfg2ansible(gcfg_state):
         state = "link"
     elif gcfg_state == "copy":
         state = "copy"
+    elif gcfg_state == "reflink":
+        state = "reflink"
     return state
 
 
@@ -270,6 +272,29 @@ def _copy_file(path, src, remote_src, mode):
         module.fail_json(msg="Failed to copy {src} to {path}", traceback=traceback.format_exc())
 
 
+def _exit_checksum(root, path, force):
+    b_path = to_bytes(path, errors="surrogate_or_strict")
+    result = {"dest": path, "changed": False, "exists": os.path.exists(b_path), "isdir": os.path.isdir(b_path), "checksum": None, "checksum_cached": False}
+    if result["exists"] and not result["isdir"] and force and os.access(b_path, os.R_OK):
+        # (GCfg files index, for tracked and linked files; full read only if stat data changed)
+        try:
+            gcfg = GCfgLib(
+                "Ansible (gcfg.gcfg)",
+                None,  # email; default: computed by the library (if/when needed)
+                root,
+            )
+            gcfg.setSilent(True)
+            gcfg.check(False, True)
+            result["checksum"] = gcfg.checksum(path)
+            result["checksum_cached"] = result["checksum"] is not None
+        except Exception:
+            pass
+        # (fallback)
+        if result["checksum"] is None:
+            result["checksum"] = module.sha1(path)
+    module.exit_json(**result)
+
+
 def main():
 
     # Ansible module
@@ -278,7 +303,7 @@ def main():
         # not checking because of daisy chain to file module
         argument_spec=dict(
             root=dict(type="path", default="/etc/gcfg"),
-            state=dict(type="str", choices=["present", "hard", "link", "copy"], default="present"),
+            state=dict(type="str", choices=["present", "hard", "link", "copy", "reflink"], default="present"),
             src=dict(type="path"),
             content=dict(type="str", no_log=True),
             dest=dict(type="path", required=True),
@@ -292,6 +317,7 @@ def main():
             validate=dict(type="str"),
             remote_src=dict(type="bool"),
             _content_changed=dict(type="bool", default=False),  # passed by the controller
+            _checksum_only=dict(type="bool", default=False),  # passed by the controller
         ),
         add_file_common_args=True,
         supports_check_mode=True,
@@ -312,6 +338,7 @@ def main():
     validate = module.params["validate"]
     remote_src = module.params["remote_src"]
     _content_changed = module.params["_content_changed"]
+    _checksum_only = module.params["_checksum_only"]
     # (alias)
     path = dest
     # (<-> attributes)
@@ -328,6 +355,10 @@ def main():
     # Friendly exeception catching
     sys.excepthook = _ansible_excepthook
 
+    # Destination checksum (only)
+    if _checksum_only:
+        _exit_checksum(root, path, force)
+
     # Validation
 
     # (arguments)
@@ -335,11 +366,15 @@ def main():
         module.fail_json(msg=f"'validate' must contain %s: {validate}")
 
     # (source)
-    if not os.path.exists(b_src):
+    # NOTE: the controller omits the source (transfer) when the destination content is unchanged
+    if src is None:
+        if _content_changed or not os.path.exists(b_path):
+            module.fail_json(msg="Source is required")
+    elif not os.path.exists(b_src):
         module.fail_json(msg=f"Source {src} not found")
-    if src.endswith(os.sep) or os.path.isdir(b_src):
+    elif src.endswith(os.sep) or os.path.isdir(b_src):
         module.fail_json(msg=f"Source {src} may not be a directory")
-    if not os.access(b_src, os.R_OK):
+    elif not os.access(b_src, os.R_OK):
         module.fail_json(msg=f"Source {src} not readable")
 
     # (destination)
@@ -364,7 +399,7 @@ def main():
             module.fail_json(msg=f"Destination directory {path_dir} not writable")
 
     # (checksum)
-    if checksum:
+    if checksum and src is not None:
         checksum_src = module.sha1(src)
         if checksum_src != checksum:
             module.fail_json(
@@ -381,7 +416,7 @@ def main():
     try:
         gcfg = GCfgLib(
             "Ansible (gcfg.gcfg)",
-            "{0}@{1}".format(pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0]),
+            None,  # email; default: computed by the library (if/when needed)
             root,
         )
         gcfg.setSilent(True)
@@ -419,7 +454,7 @@ def main():
     gcfg_target_state = _state_ansible2gcfg(state)
 
     # Validation (cont'd)
-    if not gcfg_unchanged and validate:
+    if not gcfg_unchanged and validate and src is not None:
         # make sure temporary file source has proper permissions
         if mode is not None:
             module.set_mode_if_different(src, mode, False)
@@ -489,7 +524,8 @@ def main():
                     module.fail_json(msg=f"[GCfg] Failed to add {path}; {str(e)}")
 
             # Copy (src -> dest)
-            _copy_file(path, src, remote_src, mode)
+            if src is not None:
+                _copy_file(path, src, remote_src, mode)
 
             # Re-link
             if os.path.exists(b_path_git):  # file is already tracked
@@ -545,7 +581,7 @@ def main():
     if changed and not module.check_mode:
         # (GCfg might have altered the state)
         (_, gcfg_target_state) = gcfg.isLinked(path)
-    if gcfg_target_state == "copy" or gcfg_target_state == "hardlink":
+    if gcfg_target_state in ("copy", "reflink", "hardlink"):
         changed = module.set_fs_attributes_if_different(file_params, changed, diff, expand=False)
     if gcfg_current_state is not None:
         file_params["path"] = path_git
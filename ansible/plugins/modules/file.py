@@ -11,8 +11,6 @@ __metaclass__ = type
 
 import os
 import os.path
-import pwd
-import socket
 import sys
 
 from ansible.module_utils.basic import AnsibleModule
@@ -47,12 +45,14 @@ options:
       - If C(hard), file is linked using a hard link (preferred).
       - If C(link), file is linked using a symbolic link (e.g. cron files).
       - If C(copy), file is "linked" using a copy (e.g. across filesystems).
+      - If C(reflink), file is "linked" using a copy-on-write clone (e.g. btrfs, XFS); falls
+        back to C(copy) if the filesystem does not support it.
       - If C(absent), remove the file from GCfg. If the original file is available, it is restored
         in place of the current file. This does NOT delete the original file; use the
         M(ansible.builtin.file) afterwards to do so.
     type: str
     default: present
-    choices: [ present, hard, link, copy, absent ]
+    choices: [ present, hard, link, copy, reflink, absent ]
   path:
     description:
       - Path to the file being managed.
@@ -212,6 +212,8 @@ def _state_ansible2gcfg(state):
         gcfg_state = "symlink"
     elif state == "copy":
         gcfg_state = "copy"
+    elif state == "reflink":
+        gcfg_state = "reflink"
     return gcfg_state
 
 
@@ -225,6 +227,8 @@ def _state_gcfg2ansible(gcfg_state):
         state = "link"
     elif gcfg_state == "copy":
         state = "copy"
+    elif gcfg_state == "reflink":
+        state = "reflink"
     return state
 
 
@@ -235,7 +239,7 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             root=dict(type="path", default="/etc/gcfg"),
-            state=dict(type="str", choices=["present", "hard", "link", "copy", "absent"], default="present"),
+            state=dict(type="str", choices=["present", "hard", "link", "copy", "reflink", "absent"], default="present"),
             path=dict(type="path", required=True),
             backup=dict(type="bool", default=True),
             original=dict(type="path"),
@@ -286,7 +290,7 @@ def main():
     try:
         gcfg = GCfgLib(
             "Ansible (gcfg.gcfg)",
-            "{0}@{1}".format(pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0]),
+            None,  # email; default: computed by the library (if/when needed)
             root,
         )
         gcfg.setSilent(True)
@@ -419,7 +423,7 @@ def main():
     if changed and not module.check_mode:
         # (GCfg might have altered the state)
         (_, gcfg_target_state) = gcfg.isLinked(path)
-    if gcfg_target_state == "copy" or gcfg_target_state == "hardlink":
+    if gcfg_target_state in ("copy", "reflink", "hardlink"):
         changed = module.set_fs_attributes_if_different(file_params, changed, diff, expand=False)
     if gcfg_current_state is not None:
         file_params["path"] = path_git
@@ -0,0 +1,385 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2012, Michael DeHaan <michael.dehaan@gmail.com>
+# Copyright: (c) 2017, Ansible Project
+# Copyright: (c) 2021, Cédric Dufour <http://cedric.dufour.name>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import os.path
+
+from ansible.module_utils.basic import AnsibleModule, FILE_COMMON_ARGUMENTS
+from ansible.module_utils._text import to_bytes
+
+from gcfg import GCfgLib
+
+
+DOCUMENTATION = r'''
+---
+module: files
+version_added: unreleased
+short_description: Manage many remote GCfg-tracked files and their properties (in one run)
+description:
+  - Same as M(gcfg.gcfg.file), for a list of files processed in a single module run, using
+    the GCfg batch operations (gcfg add/flag/unflag/remove, on many files at once).
+  - Per-item options override the module-level ones (which act as defaults).
+options:
+  root:
+    description:
+      - GCfg root directory.
+    type: path
+    default: /etc/gcfg
+  items:
+    description:
+      - Files to manage; each item being either a path or a dictionary with the I(path) key and
+        (optionally) any of the I(state), I(backup), I(original), I(flag), I(unflag) and file
+        attributes (I(owner), I(group), I(mode), etc.) keys, as for M(gcfg.gcfg.file).
+    type: list
+    elements: raw
+    required: yes
+  state:
+    description:
+      - Default state (see M(gcfg.gcfg.file)).
+    type: str
+    default: present
+    choices: [ present, hard, link, copy, reflink, absent ]
+  backup:
+    description:
+      - Default backup (original file) creation (see M(gcfg.gcfg.file)).
+    type: bool
+    default: yes
+  flag:
+    description:
+      - Textual flags to add to all files (in addition to per-item flags).
+    type: list
+  unflag:
+    description:
+      - Textual flags to remove from all files (in addition to per-item flags).
+      - Use C(@ALL) to strip all existing flags (except those specified by I(flag))
+    type: list
+extends_documentation_fragment:
+  - files
+seealso:
+  - module: gcfg.gcfg.file
+author:
+  - Cédric Dufour
+'''
+
+EXAMPLES = r'''
+- name: Track many files at once
+  gcfg.gcfg.files:
+    flag: ["examples"]
+    owner: "root"
+    group: "root"
+    mode: "0644"
+    items:
+      - "/etc/foo.txt"
+      - path: "/etc/bar.txt"
+        mode: "0600"
+      - path: "/etc/baz.txt"
+        state: absent
+'''
+
+RETURN = r'''
+results:
+    description: Result for each item (in the same order)
+    returned: always
+    type: list
+    elements: dict
+    contains:
+        path:
+            description: File/path, equal to the value passed to the item I(path)
+            type: str
+            sample: /etc/foo.txt
+        state:
+            description: State of the target, after execution
+            type: str
+            sample: hard
+        flags:
+            description: Textual flags associated to file (as per I(flag)/I(unflag))
+            type: list
+            sample: ["@ANSIBLE", "examples"]
+        changed:
+            description: Whether the item was changed
+            type: bool
+        failed:
+            description: Whether the item failed
+            type: bool
+        msg:
+            description: Error message (if failed)
+            type: str
+        diff:
+            description: Item changes (before/after)
+            type: dict
+'''
+
+
+ITEM_ARGUMENTS = frozenset(FILE_COMMON_ARGUMENTS.keys()).union(
+    ("path", "state", "backup", "original", "flag", "unflag")
+)
+
+
+def _state_ansible2gcfg(state):
+    gcfg_state = None
+    if state == "hard":
+        gcfg_state = "hardlink"
+    elif state == "link":
+        gcfg_state = "symlink"
+    elif state == "copy":
+        gcfg_state = "copy"
+    elif state == "reflink":
+        gcfg_state = "reflink"
+    return gcfg_state
+
+
+def _state_gcfg2ansible(gcfg_state):
+    state = "present"
+    if gcfg_state is None:
+        state = "absent"
+    elif gcfg_state == "hardlink":
+        state = "hardlink"
+    elif gcfg_state == "symlink":
+        state = "link"
+    elif gcfg_state == "copy":
+        state = "copy"
+    elif gcfg_state == "reflink":
+        state = "reflink"
+    return state
+
+
+def _item_fail(item, msg):
+    item["result"].update({"failed": True, "msg": msg})
+
+
+def _batch_fail(items, results, operation):
+    # Map batch results (path, success, result or error message) back to items
+    for (item, (_, success, message)) in zip(items, results):
+        if not success:
+            _item_fail(item, f"[GCfg] Failed to {operation} {item['path']}; {message}")
+
+
+def main():
+
+    # Ansible module
+    module = AnsibleModule(
+        argument_spec=dict(
+            root=dict(type="path", default="/etc/gcfg"),
+            items=dict(type="list", elements="raw", required=True),
+            state=dict(type="str", choices=["present", "hard", "link", "copy", "reflink", "absent"], default="present"),
+            backup=dict(type="bool", default=True),
+            flag=dict(type="list"),
+            unflag=dict(type="list"),
+        ),
+        add_file_common_args=True,
+        supports_check_mode=True,
+    )
+
+    # (arguments)
+    root = module.params["root"]
+
+    # Items
+    items = []
+    paths = set()
+    for params_item in module.params["items"]:
+        if not isinstance(params_item, dict):
+            params_item = {"path": params_item}
+        unknown = set(params_item.keys()) - ITEM_ARGUMENTS
+        if unknown:
+            module.fail_json(msg=f"Unsupported item parameter(s); {', '.join(sorted(unknown))}")
+        if not params_item.get("path"):
+            module.fail_json(msg="Missing item path")
+        path = os.path.expanduser(str(params_item["path"]))
+        if path in paths:
+            module.fail_json(msg=f"Duplicate item path; {path}")
+        paths.add(path)
+        state = params_item.get("state", module.params["state"])
+        if state not in ("present", "hard", "link", "copy", "reflink", "absent"):
+            module.fail_json(msg=f"Invalid item state; {path} ({state})")
+        params = dict((k, module.params[k]) for k in FILE_COMMON_ARGUMENTS.keys() if k in module.params)
+        params.update((k, v) for (k, v) in params_item.items() if k in FILE_COMMON_ARGUMENTS)
+        params["path"] = path
+        items.append({
+            "path": path,
+            "state": state,
+            "remove": state == "absent",
+            "backup": bool(params_item.get("backup", module.params["backup"])) and state != "absent",
+            "original": params_item.get("original"),
+            "flag": (module.params["flag"] or []) + (params_item.get("flag") or []),
+            "unflag": (module.params["unflag"] or []) + (params_item.get("unflag") or []),
+            "file_params": module.load_file_common_arguments(params),
+            "result": {"path": path, "changed": False, "diff": {"before": {"path": path}, "after": {"path": path}}},
+        })
+
+    # Validation
+    for item in items:
+        b_path = to_bytes(item["path"], errors="surrogate_or_strict")
+        if item["path"].endswith(os.sep) or os.path.isdir(b_path):
+            _item_fail(item, f"Location {item['path']} may not be a directory")
+        elif not item["remove"]:
+            if not os.path.exists(b_path):
+                _item_fail(item, f"Location {item['path']} must exist")
+            elif not os.access(b_path, os.W_OK):
+                _item_fail(item, f"Location {item['path']} not writable")
+
+    # GCfg
+    try:
+        gcfg = GCfgLib(
+            "Ansible (gcfg.gcfg)",
+            None,  # email; default: computed by the library (if/when needed)
+            root,
+        )
+        gcfg.setSilent(True)
+        gcfg.check(False, True)
+    except Exception as e:
+        module.fail_json(msg=f"[GCfg] Failed to check repository; {str(e)}")
+
+    # State
+    items_valid = [item for item in items if not item["result"].get("failed")]
+    try:
+        results = gcfg.statusMany([item["path"] for item in items_valid])
+    except Exception as e:
+        module.fail_json(msg=f"[GCfg] Failed to retrieve files status; {str(e)}")
+    for (item, (_, success, status)) in zip(items_valid, results):
+        if not success:
+            if item["remove"]:
+                # (no such file or parent directory; nothing to remove)
+                status = (False, None, [], None)
+            else:
+                _item_fail(item, f"[GCfg] Failed to retrieve {item['path']} status; {status}")
+                continue
+        (item["unchanged"], item["gcfg_current_state"], item["gcfg_current_flags"], item["path_git"]) = status
+        item["gcfg_target_state"] = _state_ansible2gcfg(item["state"])
+        if not item["remove"] and item["gcfg_current_state"] is None:  # file is untracked
+            b_path = to_bytes(item["path"], errors="surrogate_or_strict")
+            if os.path.islink(b_path):
+                _item_fail(item, f"Location {item['path']} may not be a symbolic link")
+            elif os.stat(b_path).st_nlink > 1:
+                _item_fail(item, f"Location {item['path']} may not be a hard link")
+    items_valid = [item for item in items_valid if not item["result"].get("failed")]
+
+    # Changes
+    items_remove = []
+    dl_items_add = {}
+    dl_items_link = {}
+    dl_items_flag = {}
+    dl_items_unflag = {}
+    for item in items_valid:
+        result = item["result"]
+        diff = result["diff"]
+
+        # (remove)
+        if item["remove"]:
+            if item["gcfg_current_state"] is not None:
+                result["changed"] = True
+                diff["before"]["gcfg"] = "tracked"
+                diff["after"]["gcfg"] = "untracked"
+                items_remove.append(item)
+            continue
+
+        # (flags)
+        gcfg_current_flags = sorted(item["gcfg_current_flags"])
+        if "@ALL" in item["unflag"]:
+            gcfg_target_flags = []
+        else:
+            gcfg_target_flags = [f for f in gcfg_current_flags if f not in item["unflag"]]
+        for f in item["flag"]:
+            if f not in gcfg_target_flags:
+                gcfg_target_flags.append(f)
+        if "@ANSIBLE" not in gcfg_target_flags:
+            gcfg_target_flags.append("@ANSIBLE")
+        gcfg_target_flags.sort()
+        result["flags"] = gcfg_target_flags
+
+        # (add)
+        if item["gcfg_current_state"] is None:  # file is untracked
+            result["changed"] = True
+            diff["before"]["gcfg"] = "untracked"
+            diff["after"]["gcfg"] = "tracked"
+            dl_items_add.setdefault(item["gcfg_target_state"], []).append(item)
+
+        # (link)
+        elif not item["unchanged"] or (item["state"] != "present" and item["gcfg_current_state"] != item["gcfg_target_state"]):
+            result["changed"] = True
+            diff["before"]["state"] = item["gcfg_current_state"]
+            diff["after"]["state"] = item["gcfg_target_state"]
+            dl_items_link.setdefault(item["gcfg_target_state"], []).append(item)
+
+        # (flags)
+        if gcfg_target_flags != gcfg_current_flags:
+            result["changed"] = True
+            diff["before"]["flags"] = gcfg_current_flags
+            diff["after"]["flags"] = gcfg_target_flags
+            for f in gcfg_target_flags:
+                if f not in gcfg_current_flags:
+                    dl_items_flag.setdefault(f, []).append(item)
+            for f in gcfg_current_flags:
+                if f not in gcfg_target_flags:
+                    dl_items_unflag.setdefault(f, []).append(item)
+
+    # GCfg (batch operations)
+    if not module.check_mode:
+        try:
+            if items_remove:
+                _batch_fail(items_remove, gcfg.removeMany([item["path"] for item in items_remove], True), "remove")
+            for (gcfg_target_state, items_add) in dl_items_add.items():
+                originals = {}
+                for item in items_add:
+                    if item["backup"]:
+                        originals[item["path"]] = item["original"] if item["original"] is not None else item["path"]
+                        item["result"]["backup_file"] = gcfg.getRepositoryPath("original", item["path"])
+                _batch_fail(items_add, gcfg.addMany([item["path"] for item in items_add], originals, gcfg_target_state, True), "add")
+            for (gcfg_target_state, items_link) in dl_items_link.items():
+                _batch_fail(items_link, gcfg.linkMany([item["path"] for item in items_link], gcfg_target_state, True), "(re)link")
+            for (f, items_flag) in dl_items_flag.items():
+                items_flag = [item for item in items_flag if not item["result"].get("failed")]
+                _batch_fail(items_flag, gcfg.flagMany([item["path"] for item in items_flag], f, True), "flag")
+            for (f, items_unflag) in dl_items_unflag.items():
+                items_unflag = [item for item in items_unflag if not item["result"].get("failed")]
+                _batch_fail(items_unflag, gcfg.unflagMany([item["path"] for item in items_unflag], f), "unflag")
+        except Exception as e:
+            module.fail_json(msg=f"[GCfg] Failed to update files; {str(e)}", results=[item["result"] for item in items])
+
+    # Attributes
+    items_present = [item for item in items_valid if not item["remove"] and not item["result"].get("failed")]
+    items_changed = [item for item in items_present if item["result"]["changed"]]
+    if items_changed and not module.check_mode:
+        # (GCfg might have altered the state)
+        try:
+            for (item, (_, success, status)) in zip(items_changed, gcfg.statusMany([item["path"] for item in items_changed])):
+                if success:
+                    (_, item["gcfg_target_state"], _, item["path_git"]) = status
+        except Exception as e:
+            module.fail_json(msg=f"[GCfg] Failed to retrieve files status; {str(e)}", results=[item["result"] for item in items])
+    for item in items_present:
+        result = item["result"]
+        file_params = item["file_params"]
+        if item["gcfg_target_state"] is None:  # (state: present, unchanged)
+            item["gcfg_target_state"] = item["gcfg_current_state"]
+        try:
+            if item["gcfg_target_state"] in ("copy", "reflink", "hardlink"):
+                result["changed"] = module.set_fs_attributes_if_different(file_params, result["changed"], result["diff"], expand=False)
+            if item["gcfg_current_state"] is not None:
+                file_params["path"] = item["path_git"]
+                result["changed"] = module.set_fs_attributes_if_different(file_params, result["changed"], result["diff"], expand=False)
+        except Exception as e:
+            _item_fail(item, f"Failed to set {item['path']} attributes; {str(e)}")
+        result["state"] = _state_gcfg2ansible(item["gcfg_target_state"])
+    for item in items:
+        if item["remove"] and not item["result"].get("failed"):
+            item["result"]["state"] = "absent"
+
+    # Done
+    results = [item["result"] for item in items]
+    changed = any(result["changed"] for result in results)
+    failed = [result["path"] for result in results if result.get("failed")]
+    if failed:
+        module.fail_json(msg=f"Failed to manage {len(failed)} file(s); {', '.join(failed)}", changed=changed, results=results)
+    module.exit_json(changed=changed, results=results)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,6 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import os
-import pwd
-import socket
 import sys
 
 from ansible.module_utils.basic import AnsibleModule
@@ -65,9 +62,9 @@ original:
     type: str
     sample: /etc/gcfg/original
 flag:
-    description: Path to GCfg flags sub-directory
+    description: Path to GCfg flags store
     type: str
-    sample: /etc/gcfg/flag
+    sample: /etc/gcfg/flags.db
 '''
 
 
@@ -123,7 +120,7 @@ def main():
     try:
         gcfg = GCfgLib(
             "Ansible (gcfg.gcfg)",
-            "{0}@{1}".format(pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0]),
+            None,  # email; default: computed by the library (if/when needed)
             root,
         )
         gcfg.setSilent(True)
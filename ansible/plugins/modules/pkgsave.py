@@ -9,9 +9,6 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import os
-import pwd
-import socket
 import sys
 import tempfile
 
@@ -108,7 +105,7 @@ def main():
     try:
         gcfg = GCfgLib(
             "Ansible (gcfg.gcfg)",
-            "{0}@{1}".format(pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0]),
+            None,  # email; default: computed by the library (if/when needed)
             root,
         )
         gcfg.setSilent(True)
@@ -120,10 +117,11 @@ def main():
     diff = {"before": {"root": root}, "after": {"root": root}}
     result = {"root": root}
 
-    # (pkglist)
+    # (pkglist; as last saved)
     try:
-        packages_before = gcfg.pkglist().splitlines()
-        packages_before.sort()
+        with open(to_bytes(gcfg.getRepositoryPath("pkglist"), errors="surrogate_or_strict"), "r") as f:
+            packages_before = f.read().splitlines()
+            packages_before.sort()
     except Exception as e:
         module.fail_json(msg=f"[GCfg] Failed to retrieve packages list; {str(e)}")
 
@@ -135,7 +133,10 @@ def main():
         (_, b_pkglist) = tempfile.mkstemp()
         pkglist = to_native(b_pkglist)
     try:
-        gcfg.pkglist(pkglist)
+        if not module.check_mode:
+            gcfg.pkgsave()
+        else:
+            gcfg.pkglist(pkglist)
     except Exception as e:
         module.fail_json(msg=f"[GCfg] Failed to update packages list; {str(e)}")
     try:
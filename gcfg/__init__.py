@@ -20,6 +20,15 @@
 # Constants
 GCFG_VERSION = "%{VERSION}"  # noqa
 
+
 # Dependencies
-from .lib import GCfgLib  # noqa
-from .bin import GCfgBin  # noqa
+# NOTE: classes are imported lazily, such as for the CLI to forward commands to the daemon
+#       without loading the library (for the sake of startup time; see 'gcfg daemon')
+def __getattr__(sName):
+    if sName == "GCfgLib":
+        from .lib import GCfgLib
+        return GCfgLib
+    if sName == "GCfgBin":
+        from .bin import GCfgBin
+        return GCfgBin
+    raise AttributeError("module 'gcfg' has no attribute '%s'" % sName)
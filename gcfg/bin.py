@@ -17,15 +17,14 @@
 # See the GNU General Public License for more details.
 #
 
-import argparse
 import errno
 import os
 import pwd
-import socket
 import sys
-import textwrap
+# NOTE: modules only required when executing commands in-process are imported lazily
+#       (for the sake of startup time, when forwarding commands to the daemon)
 
-from gcfg import GCFG_VERSION, GCfgLib
+from gcfg import GCFG_VERSION
 
 
 # Constants
@@ -33,6 +32,8 @@ GCFG_COMMANDS = {
     "init": "GCfgInit",
     "verify": "GCfgVerify",
     "list": "GCfgList",
+    "reindex": "GCfgReindex",
+    "watch": "GCfgWatch",
     "add": "GCfgAdd",
     "new": "GCfgAdd",
     "copy": "GCfgCopy",
@@ -57,7 +58,20 @@ GCFG_COMMANDS = {
     "pkgdiff": "GCfgPkgDiff",
     "git": "GCfgGit",
     "a2ps": "GCfgA2ps",
+    "daemon": "GCfgDaemon",
 }
+# ... commands never forwarded to the daemon (interactive or long-running; see 'gcfg daemon')
+GCFG_COMMANDS_LOCAL = [
+    "init", "watch", "edit", "git", "daemon",
+]
+# ... commands forwarded to the daemon only when non-interactive (the daemon serving one command at a time,
+#     a pending confirmation prompt would otherwise stall every other client); see 'gcfg daemon'
+GCFG_COMMANDS_INTERACTIVE = [
+    "add", "copy", "move", "remove", "verify", "a2ps",
+]
+GCFG_OPTIONS_NONINTERACTIVE = [
+    "-b", "--batch", "-C", "--check",
+]
 
 
 #------------------------------------------------------------------------------
@@ -69,6 +83,9 @@ class GCfgBin:
     GIT-based Configuration Tracking Utility (GCFG) - Command wrapper
     """
 
+    # (Shared) libraries, per author/email/root; see 'gcfg daemon'
+    _doLibraries = None
+
     #------------------------------------------------------------------------------
     # CONSTRUCTORS / DESTRUCTOR
     #------------------------------------------------------------------------------
@@ -81,6 +98,8 @@ class GCfgBin:
         @param  string  _sSynopsis   Additional help (synopsis)
         """
 
+        import argparse
+
         # Command
         if _sCommand is None:
             _sCommand = sys.argv[0].split(os.sep)[-1]
@@ -101,6 +120,7 @@ class GCfgBin:
         self._addOptionVersion(self._oArgumentParser)
         self._addOptionDebug(self._oArgumentParser)
         self._addOptionSilent(self._oArgumentParser)
+        self._addOptionProfile(self._oArgumentParser)
 
     def _initArguments(self, _lArguments=None, _bAllowUnknownArguments=False):
         """
@@ -154,6 +174,22 @@ class GCfgBin:
             help="mute all informational and warning messages"
         )
 
+    def _addOptionProfile(self, _oArgumentParser):
+        """
+        Adds the '--profile' option to the given argument parser
+        (for the sake of help only; the option is handled - and stripped - before
+        the command arguments are parsed, see 'execute')
+        """
+
+        # Add argument
+        _oArgumentParser.add_argument(
+            "--profile", type=str, metavar="<path>", nargs="?", const="",
+            help="profile the command execution (cProfile statistics, along top memory allocations if "
+                 "GCFG_PROFILE_MEMORY=<count> is set) and save results to <path>.pstats (and <path>.memory), "
+                 "or to a new private sub-directory if <path> is a directory (default: temporary directory); "
+                 "must be specified as --profile=<path>"
+        )
+
     def _addOptionBatch(self, _oArgumentParser):
         """
         Adds the '--batch' option to the given argument parser
@@ -183,7 +219,7 @@ class GCfgBin:
 
         # Add argument
         _oArgumentParser.add_argument(
-            "-L", "--link", type=str, choices=["hardlink", "symlink", "copy"],
+            "-L", "--link", type=str, choices=["hardlink", "symlink", "copy", "reflink"],
             help="force link type"
         )
         # ... legacy support
@@ -200,6 +236,17 @@ class GCfgBin:
             help="force copy (deprecated; use --link instead)"
         )
 
+    def _addOptionJobs(self, _oArgumentParser):
+        """
+        Adds the '--jobs' option to the given argument parser
+        """
+
+        # Add argument
+        _oArgumentParser.add_argument(
+            "-j", "--jobs", type=int, metavar="<jobs>", default=1,
+            help="parallel jobs (0 = CPUs count; default: 1)"
+        )
+
     def _convertLegacyOptions(self, _oArguments):
         if hasattr(_oArguments, "hard") and _oArguments.hard:
             _oArguments.link = "hardlink"
@@ -213,6 +260,7 @@ class GCfgBin:
     #------------------------------------------------------------------------------
 
     def _help(self):
+        import textwrap
         sys.stdout.write(
             textwrap.dedent(r"""
                 commands:
@@ -225,6 +273,15 @@ class GCfgBin:
                   list:
                     List the files in the configuration repository
 
+                  reindex:
+                    Rebuild the files index from the GIT sub-repository
+
+                  watch:
+                    Watch the configuration repository and check changed files in real-time
+
+                  daemon:
+                    Serve commands over a local socket (keeping the configuration repository state warm)
+
                   add (new), copy (cp), move (mv), remove (rm):
                     Add, copy, move or remove a file in the configuration repository
 
@@ -254,15 +311,193 @@ class GCfgBin:
 
                 further help:
                   gcfg <command> --help
+
+                profiling:
+                  gcfg <command> --profile[=<path>] ...
+                  GCFG_TRACE=<path> gcfg <command> ...  (Chrome/Perfetto trace)
             """)
         )
 
     def _getLibrary(self):
-        return GCfgLib(
+        from gcfg import GCfgLib
+        tLibrary = (
             os.getenv("GCFG_AUTHOR", pwd.getpwuid(os.getuid())[0]),
-            os.getenv("GCFG_EMAIL", "%s@%s" % (pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0])),
+            os.getenv("GCFG_EMAIL"),  # default: computed by the library (if/when needed)
             os.getenv("GCFG_ROOT", "/etc/gcfg")
         )
+        if GCfgBin._doLibraries is None:
+            return GCfgLib(*tLibrary)
+        # ... re-use libraries (along their opened databases and GIT coprocesses) within the daemon
+        oGCfgLib = GCfgBin._doLibraries.get(tLibrary)
+        if oGCfgLib is None:
+            oGCfgLib = GCfgLib(*tLibrary)
+            GCfgBin._doLibraries[tLibrary] = oGCfgLib
+        else:
+            oGCfgLib.reset()
+        return oGCfgLib
+
+    def _getSocketPath(self):
+        return os.getenv("GCFG_SOCKET", os.path.join(os.getenv("GCFG_ROOT", "/etc/gcfg"), "gcfgd.sock"))
+
+    def _resolveCommand(self, _sCommand):
+        """
+        Return the given command name, resolving aliases.
+
+        @param  string  _sCommand  Command name (or alias)
+
+        @return string  Command name
+        """
+
+        while GCFG_COMMANDS[_sCommand][:4] != "GCfg":
+            _sCommand = GCFG_COMMANDS[_sCommand]  # alias
+        return _sCommand
+
+    def _getCommand(self, _sCommand):
+        """
+        Return the given command class.
+
+        @param  string  _sCommand  Command name (aliases resolved)
+
+        @return class  Command class
+        """
+
+        return getattr(__import__("gcfg.%s" % _sCommand, fromlist=["gcfg"]), GCFG_COMMANDS[_sCommand])
+
+    def _forward(self, _sCommand, _lArguments):
+        """
+        Forward the given command to the daemon, if running; the standard input/outputs
+        (file descriptors), working directory and environment are passed along.
+
+        @param  string  _sCommand    Command name
+        @param  list    _lArguments  Command arguments
+
+        @return integer  Exit code; None if the daemon is not running (or refused the command)
+        """
+
+        # Daemon
+        sSocket = self._getSocketPath()
+        if os.getenv("GCFG_DAEMON", "1") == "0" or not os.path.exists(sSocket):
+            return None
+
+        # Request
+        import marshal
+        import socket
+        dEnviron = dict(os.environ)
+        dEnviron.setdefault("GCFG_AUTHOR", pwd.getpwuid(os.getuid())[0])
+        byRequest = marshal.dumps({
+            "command": _sCommand,
+            "arguments": _lArguments,
+            "directory": os.getcwd(),
+            "environ": dEnviron,
+        })
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as oSocket:
+            try:
+                oSocket.connect(sSocket)
+                iSent = socket.send_fds(oSocket, [byRequest], [0, 1, 2])
+                oSocket.sendall(byRequest[iSent:])
+                oSocket.shutdown(socket.SHUT_WR)
+            except OSError:
+                return None
+
+            # Response
+            byResponse = b""
+            while True:
+                byRead = oSocket.recv(65536)
+                if byRead == b"":
+                    break
+                byResponse += byRead
+        try:
+            dResponse = marshal.loads(byResponse)
+        except (EOFError, ValueError, TypeError):
+            sys.stderr.write("ERROR[forward]: Daemon terminated unexpectedly; %s\n" % sSocket)
+            return errno.EIO
+        if dResponse.get("refused"):
+            return None
+        return dResponse.get("exit", errno.EIO)
+
+    def _profile(self, _sCommand, _lArguments, _sPath=None):
+        """
+        Execute the given command (in-process), profiling its execution with cProfile
+        and - if GCFG_PROFILE_MEMORY=<count> is set - tracemalloc; statistics are saved
+        to <path>.pstats (and the top <count> memory allocations to <path>.memory),
+        while a one-line summary (wall time and peak RSS) is written to stderr.
+
+        @param  string  _sCommand    Command name
+        @param  list    _lArguments  Command arguments
+        @param  string  _sPath       Results path (prefix) or directory; default: <tmpdir>
+                                     (results being saved in a new, private, 'gcfg-<command>.*/profile'
+                                     sub-directory of the given/default directory)
+
+        @return integer  Exit code
+        """
+
+        import cProfile
+        import resource
+        import tempfile
+        import time
+
+        # Path
+        # NOTE: never use predictable file names in (shared) directories, which may be symlinked elsewhere
+        if not _sPath or os.path.isdir(_sPath):
+            _sPath = os.path.join(tempfile.mkdtemp(prefix="gcfg-%s." % _sCommand, dir=_sPath or None), "profile")
+        elif _sPath[-7:] == ".pstats":
+            _sPath = _sPath[:-7]
+        try:
+            iMemory = int(os.getenv("GCFG_PROFILE_MEMORY", "0"))
+        except ValueError:
+            iMemory = 0
+
+        # Execute command
+        iExit = errno.EIO
+        oProfile = cProfile.Profile()
+        if iMemory > 0:
+            import tracemalloc
+            tracemalloc.start(25)
+        fStart = time.monotonic()
+        oProfile.enable()
+        try:
+            iExit = self._getCommand(_sCommand)().execute(_sCommand, _lArguments)
+        except EnvironmentError as e:
+            iExit = e.errno
+        except SystemExit as e:  # e.g. --help or invalid arguments
+            iExit = e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+        finally:
+            oProfile.disable()
+            fWall = time.monotonic() - fStart
+            if iMemory > 0:
+                oSnapshot = tracemalloc.take_snapshot().filter_traces((
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                ))
+                (iMemoryCurrent, iMemoryPeak) = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+            # ... results
+            lFiles = []
+            try:
+                oProfile.dump_stats(_sPath + ".pstats")
+                lFiles += [_sPath + ".pstats"]
+                if iMemory > 0:
+                    with open(_sPath + ".memory", "w") as oFile:
+                        oFile.write("# traced memory: current=%d peak=%d (bytes)\n" % (iMemoryCurrent, iMemoryPeak))
+                        for oStatistic in oSnapshot.statistics("traceback")[:iMemory]:
+                            oFile.write("size=%d KiB, count=%d\n" % (oStatistic.size // 1024, oStatistic.count))
+                            for sLine in oStatistic.traceback.format(limit=10, most_recent_first=True):
+                                oFile.write("%s\n" % sLine)
+                    lFiles += [_sPath + ".memory"]
+            except OSError as e:
+                sys.stderr.write("ERROR[profile]: Failed to save profiling results; %s\n" % str(e))
+
+            # ... summary (ru_maxrss: KiB)
+            sys.stderr.write(
+                "PROFILE[%s]: exit=%s wall=%.3fs rss_peak=%dKiB rss_peak_children=%dKiB; %s\n" % (
+                    _sCommand, iExit, fWall,
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                    resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+                    ", ".join(lFiles)
+                )
+            )
+        return iExit
 
     #
     # Main
@@ -285,14 +520,8 @@ class GCfgBin:
                     continue
                 lArguments += [s]
 
-            # Instantiate command
-            cCommand = None
-            while cCommand is None:
-                cCommand = GCFG_COMMANDS[sCommand]
-                if cCommand[:4] != "GCfg":
-                    sCommand = cCommand  # alias
-                    cCommand = None
-            oCommand = getattr(__import__("gcfg.%s" % sCommand, fromlist=["gcfg"]), cCommand)
+            # Resolve command
+            sCommand = self._resolveCommand(sCommand)
 
         except (IndexError, KeyError):
             sys.stdout.write("usage: gcfg <command>\n")
@@ -305,8 +534,31 @@ class GCfgBin:
                 sys.stdout.write("error: invalid command\n")
             return errno.EINVAL
 
+        # Profile (always in-process)
+        sProfile = None
+        for s in list(lArguments):
+            if s == "--":
+                break
+            if s == "--profile" or s.startswith("--profile="):
+                sProfile = s[10:]
+                lArguments.remove(s)
+        if sProfile is not None:
+            return self._profile(sCommand, lArguments, sProfile)
+
+        # Forward command (to daemon)
+        # ... unless tracing (see 'GCFG_TRACE'), which requires the library to be initialized in-process
+        # ... or possibly prompting for confirmation (see '--batch')
+        bForward = sCommand not in GCFG_COMMANDS_LOCAL and not os.getenv("GCFG_TRACE")
+        if bForward and sCommand in GCFG_COMMANDS_INTERACTIVE:
+            lOptions = lArguments[:lArguments.index("--")] if "--" in lArguments else lArguments
+            bForward = any(s in GCFG_OPTIONS_NONINTERACTIVE for s in lOptions)
+        if bForward:
+            iExit = self._forward(sCommand, lArguments)
+            if iExit is not None:
+                return iExit
+
         # Execute command
         try:
-            return oCommand().execute(sCommand, lArguments)
+            return self._getCommand(sCommand)().execute(sCommand, lArguments)
         except EnvironmentError as e:
             return e.errno
@@ -0,0 +1,234 @@
+# -*- mode:python; tab-width:4; c-basic-offset:4; intent-tabs-mode:nil; -*-
+# ex: filetype=python tabstop=4 softtabstop=4 shiftwidth=4 expandtab autoindent smartindent
+
+#
+# GIT-based Configuration Tracking Utility (GCFG)
+# Copyright (C) 2015 Cedric Dufour <http://cedric.dufour.name>
+# Author: Cedric Dufour <http://cedric.dufour.name>
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is free software:
+# you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, Version 3.
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is distributed in the hope
+# that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the GNU General Public License for more details.
+#
+
+
+import errno
+import os
+import sys
+import textwrap
+
+from gcfg import GCfgBin
+
+
+#------------------------------------------------------------------------------
+# CLASSES
+#------------------------------------------------------------------------------
+
+class GCfgDaemon(GCfgBin):
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Command 'daemon'
+    """
+
+    #------------------------------------------------------------------------------
+    # CONSTRUCTORS / DESTRUCTOR
+    #------------------------------------------------------------------------------
+
+    def _initArgumentParser(self, _sCommand=None):
+        """
+        Creates the arguments parser (and help generator)
+
+        @param  string  _sCommand  Command name
+        """
+
+        # Parent
+        GCfgBin._initArgumentParser(
+            self,
+            _sCommand,
+            textwrap.dedent(r"""
+                synopsis:
+                  Serve commands over a local (Unix) socket, keeping the configuration repository
+                  state (databases, GIT coprocesses) warm between commands.
+                  While the daemon is running, commands are transparently forwarded to it (along
+                  the standard input/outputs, working directory and environment), unless they are
+                  interactive or long-running (init, watch, edit, git, daemon), may prompt for
+                  confirmation (add, copy, move, remove, verify, a2ps; without --batch or --check),
+                  are profiled/traced (--profile, GCFG_TRACE) or the GCFG_DAEMON environment variable
+                  is set to '0'. Commands are served one at a time.
+                  The socket path defaults to '<root>/gcfgd.sock' (GCFG_SOCKET environment variable).
+            """)
+        )
+
+    #------------------------------------------------------------------------------
+    # METHODS
+    #------------------------------------------------------------------------------
+
+    #
+    # Server
+    #
+
+    def _serve(self, _sSocket):
+        """
+        Serve commands on the given socket (until interrupted).
+
+        @param  string  _sSocket  Socket path
+        """
+
+        import signal
+        import socket
+
+        # Socket
+        oSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            oSocket.connect(_sSocket)
+            oSocket.close()
+            raise EnvironmentError(errno.EADDRINUSE, "Daemon already running; %s" % _sSocket)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        if os.path.exists(_sSocket):
+            os.unlink(_sSocket)
+        iUmask = os.umask(0o077)
+        try:
+            oSocket.bind(_sSocket)
+        finally:
+            os.umask(iUmask)
+        oSocket.listen(16)
+
+        # Serve
+        signal.signal(signal.SIGTERM, lambda iSignal, oFrame: sys.exit(0))
+        GCfgBin._doLibraries = {}
+        try:
+            while True:
+                (oConnection, _) = oSocket.accept()
+                # ... (let the command complete before terminating)
+                signal.pthread_sigmask(signal.SIG_BLOCK, [signal.SIGTERM])
+                with oConnection:
+                    try:
+                        self._handle(oConnection)
+                    except (OSError, ValueError) as e:
+                        sys.stderr.write("ERROR[serve]: Failed to handle request; %s\n" % str(e))
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, [signal.SIGTERM])
+        finally:
+            oSocket.close()
+            os.unlink(_sSocket)
+
+    def _handle(self, _oConnection):
+        """
+        Handle the given client connection (request).
+
+        @param  socket.socket  _oConnection  Client connection
+        """
+
+        import marshal
+        import socket
+        import struct
+
+        # Request
+        # ... only serve the user the daemon runs as
+        (_, iUid, _) = struct.unpack("3i", _oConnection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+        if iUid != os.getuid():
+            _oConnection.sendall(marshal.dumps({"refused": True}))
+            return
+        (byRequest, liFds, _, _) = socket.recv_fds(_oConnection, 65536, 3)
+        try:
+            while True:
+                byRead = _oConnection.recv(65536)
+                if byRead == b"":
+                    break
+                byRequest += byRead
+            dRequest = marshal.loads(byRequest)
+            if len(liFds) != 3:
+                raise ValueError("Missing standard input/outputs")
+        except (EOFError, ValueError, TypeError):
+            for iFd in liFds:
+                os.close(iFd)
+            if not byRequest:
+                return  # (e.g. 'already running' probe)
+            raise ValueError("Invalid request")
+
+        # Execute command (with the client standard input/outputs, working directory and environment)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        liFds_saved = [os.dup(i) for i in (0, 1, 2)]
+        for (i, iFd) in enumerate(liFds):
+            os.dup2(iFd, i)
+            os.close(iFd)
+        # ... fresh (unbuffered-state) standard input/outputs objects, such as for no (read-ahead)
+        #     buffered data to leak from one request to the next
+        tStd_saved = (sys.stdin, sys.stdout, sys.stderr)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", buffering=1, errors="backslashreplace", closefd=False)
+        dEnviron_saved = dict(os.environ)
+        sDirectory_saved = os.getcwd()
+        try:
+            os.environ.clear()
+            os.environ.update(dRequest["environ"])
+            os.chdir(dRequest["directory"])
+            sCommand = self._resolveCommand(dRequest["command"])
+            iExit = self._getCommand(sCommand)().execute(sCommand, dRequest["arguments"])
+        except SystemExit as e:
+            iExit = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except EnvironmentError as e:
+            iExit = e.errno
+        except KeyError:
+            iExit = errno.EINVAL
+        except KeyboardInterrupt:
+            iExit = -2
+        except Exception as e:
+            sys.stderr.write("ERROR[handle]: %s\n" % str(e))
+            iExit = errno.EIO
+        finally:
+            for oStd in (sys.stdin, sys.stdout, sys.stderr):
+                try:
+                    oStd.close()
+                except OSError:
+                    pass
+            (sys.stdin, sys.stdout, sys.stderr) = tStd_saved
+            for (i, iFd) in enumerate(liFds_saved):
+                os.dup2(iFd, i)
+                os.close(iFd)
+            os.chdir(sDirectory_saved)
+            os.environ.clear()
+            os.environ.update(dEnviron_saved)
+
+        # Response
+        _oConnection.sendall(marshal.dumps({"exit": iExit}))
+
+    #
+    # Main
+    #
+
+    def execute(self, _sCommand=None, _lArguments=None):
+        """
+        Executes
+
+        @param  string  _sCommand    Command name
+        @param  list    _lArguments  Command arguments
+
+        @return integer  Exit code; non-zero in case of failure
+        """
+
+        # Arguments
+        self._initArgumentParser(_sCommand)
+        self._initArguments(_lArguments)
+
+        # Handle command
+        oGCfgLib = self._getLibrary()
+        oGCfgLib.setDebug(self._oArguments.debug)
+        oGCfgLib.setSilent(self._oArguments.silent)
+        if not oGCfgLib.check():
+            return errno.EPERM
+        try:
+            self._serve(self._getSocketPath())
+        except EnvironmentError as e:
+            sys.stderr.write("ERROR[daemon]: %s\n" % e.strerror)
+            return e.errno
+        except KeyboardInterrupt:
+            pass
+        return 0
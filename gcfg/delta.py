@@ -18,6 +18,7 @@
 #
 
 import errno
+import sys
 import textwrap
 
 from gcfg import GCfgBin
@@ -50,12 +51,27 @@ class GCfgDelta(GCfgBin):
             textwrap.dedent(r"""
                 synopsis:
                   Show the differences between the given  file and its original content.
+                  With --all, show the differences for all files that have an original
+                  content (in which case the only argument is the comment prefix).
             """)
         )
 
         # Additional arguments
         self._oArgumentParser.add_argument(
-            "file", type=str, metavar="<file>",
+            "-a", "--all", action="store_true",
+            help="show the differences for all files that have an original content"
+        )
+        self._oArgumentParser.add_argument(
+            "-F", "--flag", type=str, metavar="<flag>",
+            help="flag to match when showing the differences for all files"
+        )
+        self._oArgumentParser.add_argument(
+            "--stat", action="store_true",
+            help="show the count of added and removed lines (instead of the differences)"
+        )
+        self._addOptionJobs(self._oArgumentParser)
+        self._oArgumentParser.add_argument(
+            "file", type=str, metavar="<file>", nargs="?",
             help="file to show the differences for"
         )
         self._oArgumentParser.add_argument(
@@ -84,6 +100,14 @@ class GCfgDelta(GCfgBin):
         # Arguments
         self._initArgumentParser(_sCommand)
         self._initArguments(_lArguments)
+        if self._oArguments.all:
+            if self._oArguments.commentPrefix is not None:
+                self._oArgumentParser.error("too many arguments (with --all)")
+            self._oArguments.commentPrefix = self._oArguments.file
+        elif self._oArguments.file is None:
+            self._oArgumentParser.error("the following arguments are required: <file> (unless --all)")
+        elif self._oArguments.flag is not None or self._oArguments.stat:
+            self._oArgumentParser.error("--flag and --stat require --all")
 
         # Handle command
         oGCfgLib = self._getLibrary()
@@ -91,6 +115,18 @@ class GCfgDelta(GCfgBin):
         oGCfgLib.setSilent(self._oArguments.silent)
         if not oGCfgLib.check():
             return errno.EPERM
+        if self._oArguments.all:
+            for (sFile, mDifferences) in oGCfgLib.deltaAll(
+                self._oArguments.flag,
+                self._oArguments.commentPrefix,
+                self._oArguments.stat,
+                self._oArguments.jobs
+            ):
+                if self._oArguments.stat:
+                    sys.stdout.write("%s\t%s\t%s\n" % tuple(["-" if i is None else str(i) for i in mDifferences] + [sFile]))
+                else:
+                    sys.stdout.write(mDifferences)
+            return 0
         oGCfgLib.delta(
             self._oArguments.file,
             self._oArguments.commentPrefix,
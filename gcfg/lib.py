@@ -18,19 +18,1048 @@
 #
 
 import errno
-import inspect
-import subprocess
 import os
 import re
-import shutil
+import stat
+import sqlite3
 import sys
-import tempfile
+import threading
+import time
+# NOTE: modules only required by some commands are imported lazily (for the sake of startup time)
+
+
+# Constants
+# ... files index schema (statements to execute to upgrade to each successive version)
+GCFG_INDEX_SCHEMA = [
+    # 1: tracked files (path being the actual file canonical path; dev/ino/size/mtime_ns/digest relating to the GIT file)
+    [
+        "CREATE TABLE files (path TEXT PRIMARY KEY, link TEXT, dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER, digest TEXT)",
+    ],
+    # 2: stat signature of both GIT and actual files, when last found identical ('copy'/'reflink'-linked files)
+    [
+        "ALTER TABLE files ADD COLUMN signature TEXT",
+    ],
+    # 3: content digest as GIT blob ID (SHA-1 of 'blob <size>\\0<content>'); previous (raw SHA-1) digests are dropped
+    [
+        "UPDATE files SET digest = NULL",
+    ],
+    # 4: content checksum (raw SHA-1, as used by Ansible) of the GIT file, valid as long as its digest is unchanged
+    [
+        "ALTER TABLE files ADD COLUMN checksum TEXT",
+    ],
+    # 5: derived data cache (e.g. packages listing), along the stat signature of the data it was derived from
+    [
+        "CREATE TABLE cache (name TEXT PRIMARY KEY, signature TEXT, data TEXT)",
+    ],
+]
+# ... flags store schema (idem)
+GCFG_FLAG_SCHEMA = [
+    # 1: files flags (path being the actual file canonical path), along flag-to-files inverted index
+    [
+        "CREATE TABLE flags (path TEXT NOT NULL, flag TEXT NOT NULL, PRIMARY KEY (path, flag)) WITHOUT ROWID",
+        "CREATE INDEX flags_flag ON flags (flag, path)",
+    ],
+]
+# ... read-only GIT (sub-)commands (which require neither prior verification nor subsequent reindexing)
+GCFG_GIT_COMMANDS_READONLY = [
+    "archive", "blame", "cat-file", "count-objects", "describe", "diff", "diff-files", "diff-index", "diff-tree",
+    "for-each-ref", "fsck", "grep", "help", "log", "ls-files", "ls-remote", "ls-tree", "merge-base", "name-rev",
+    "rev-list", "rev-parse", "shortlog", "show", "show-branch", "show-ref", "status", "var", "verify-commit",
+    "verify-tag", "version", "whatchanged",
+]
+# ... GIT (sub-)commands which modify the repository but not the working tree (which require no subsequent reindexing)
+GCFG_GIT_COMMANDS_NOWORKTREE = [
+    "add", "branch", "commit", "config", "fetch", "gc", "notes", "push", "remote", "reflog", "repack", "tag",
+    "update-ref",
+]
+# ... reflink (copy-on-write clone) ioctl; see ioctl_ficlone(2): _IOW(0x94, 9, int)
+GCFG_IOCTL_FICLONE = 0x40049409
+# ... packages state (status and extended states; see 'apt-mark showmanual')
+GCFG_PACKAGES_STATUS = "/var/lib/dpkg/status"
+GCFG_PACKAGES_EXTENDED_STATES = "/var/lib/apt/extended_states"
 
 
 #------------------------------------------------------------------------------
 # CLASSES
 #------------------------------------------------------------------------------
 
+class GCfgGitBackend:
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - GIT Backend
+    Objects lookups and reads are performed by long-lived 'git cat-file --batch-check'
+    and 'git cat-file --batch' coprocesses, while status is parsed in a streaming way
+    ('git status --porcelain=v2 -z'); other (porcelain) operations are left to the GIT CLI.
+    """
+
+    #------------------------------------------------------------------------------
+    # CONSTRUCTORS / DESTRUCTOR
+    #------------------------------------------------------------------------------
+
+    def __init__(self, _sDirectory, _fTrace=None):
+        # Properties (arguments)
+        self.__sDirectory = _sDirectory
+        self.__fTrace = _fTrace
+
+        # Properties (internal)
+        self.__doCoprocesses = {}
+        self.__oLock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    #------------------------------------------------------------------------------
+    # METHODS
+    #------------------------------------------------------------------------------
+
+    #
+    # Coprocesses
+    #
+
+    def _coprocess(self, _sMode):
+        """
+        Return the given 'git cat-file' coprocess, (re-)starting it if needs be.
+
+        @param  string  _sMode  Coprocess mode (among: 'batch' or 'batch-check')
+
+        @return subprocess.Popen  Coprocess
+        """
+
+        oPopen = self.__doCoprocesses.get(_sMode)
+        if oPopen is None or oPopen.poll() is not None:
+            import subprocess
+            oPopen = subprocess.Popen(
+                ["git", "cat-file", "--%s" % _sMode],
+                cwd=self.__sDirectory,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            self.__doCoprocesses[_sMode] = oPopen
+        return oPopen
+
+    def _query(self, _sMode, _sObject):
+        """
+        Query the given object from the given 'git cat-file' coprocess.
+
+        @param  string  _sMode    Coprocess mode (among: 'batch' or 'batch-check')
+        @param  string  _sObject  Object name (any revision expression understood by GIT)
+
+        @return tuple(tuple,bytes)  Object (ID, type, size) and content ('batch' mode only); (None, None) if missing
+        """
+
+        if "\n" in _sObject:
+            raise EnvironmentError(errno.EINVAL, "Invalid GIT object name; %s" % _sObject)
+        with self.__oLock:
+            oPopen = self._coprocess(_sMode)
+            try:
+                oPopen.stdin.write(("%s\n" % _sObject).encode(sys.getfilesystemencoding()))
+                oPopen.stdin.flush()
+                lHeader = oPopen.stdout.readline().decode(sys.getfilesystemencoding()).split()
+                if len(lHeader) != 3 or lHeader[-1] in ("missing", "ambiguous"):
+                    if not lHeader:
+                        raise EnvironmentError(errno.EIO, "GIT coprocess terminated unexpectedly")
+                    return (None, None)
+                tObject = (lHeader[0], lHeader[1], int(lHeader[2]))
+                bContent = None
+                if _sMode == "batch":
+                    bContent = oPopen.stdout.read(tObject[2] + 1)[:-1]
+                    if len(bContent) != tObject[2]:
+                        raise EnvironmentError(errno.EIO, "GIT coprocess terminated unexpectedly")
+            except (BrokenPipeError, ValueError):
+                raise EnvironmentError(errno.EIO, "GIT coprocess terminated unexpectedly")
+        return (tObject, bContent)
+
+    def close(self):
+        """
+        Terminate the 'git cat-file' coprocesses.
+        """
+
+        for oPopen in self.__doCoprocesses.values():
+            try:
+                oPopen.stdin.close()
+                oPopen.wait()
+            except (OSError, ValueError):
+                pass
+        self.__doCoprocesses = {}
+
+    #
+    # Objects
+    #
+
+    def info(self, _sObject):
+        """
+        Return the given object ID, type and size.
+
+        @param  string  _sObject  Object name (any revision expression understood by GIT)
+
+        @return tuple(string,string,int)  Object ID, type and size; None if missing
+        """
+
+        return self._query("batch-check", _sObject)[0]
+
+    def read(self, _sObject):
+        """
+        Return the given object type and content.
+
+        @param  string  _sObject  Object name (any revision expression understood by GIT); e.g. 'HEAD:path/to/file'
+
+        @return tuple(string,bytes)  Object type and content; None if missing
+        """
+
+        (tObject, bContent) = self._query("batch", _sObject)
+        if tObject is None:
+            return None
+        return (tObject[1], bContent)
+
+    def tag(self, _sTag):
+        """
+        Return the commit ID the given tag points to.
+
+        @param  string  _sTag  Tag name
+
+        @return string  Commit ID; None if the tag does not exist
+        """
+
+        tObject = self.info("refs/tags/%s^{commit}" % _sTag)
+        if tObject is None:
+            return None
+        return tObject[0]
+
+    #
+    # Status
+    #
+
+    def status(self):
+        """
+        Yield the working tree status, parsed in a streaming way.
+        Status codes are those of 'git status --porcelain' (unmodified being
+        shown as ' '), untracked files being reported individually ('??').
+
+        @return generator  (path, status code) tuples
+        """
+
+        lCommand = ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"]
+        if self.__fTrace is None:
+            yield from self._status(lCommand)
+        else:
+            with self.__fTrace("git", "shell", {"argv": lCommand, "cwd": self.__sDirectory}):
+                yield from self._status(lCommand)
+
+    def _status(self, _lCommand):
+        """
+        Yield the working tree status (see 'status').
+
+        @param  list  _lCommand  GIT status command (as passed to Popen)
+
+        @return generator  (path, status code) tuples
+        """
+
+        import subprocess
+        import tempfile
+        # NOTE: standard error is spooled to a (temporary) file, such as for GIT never to block
+        #       on a full standard error pipe while standard output is being read
+        fStdErr = tempfile.TemporaryFile()
+        oPopen = subprocess.Popen(
+            _lCommand,
+            cwd=self.__sDirectory,
+            stdout=subprocess.PIPE,
+            stderr=fStdErr
+        )
+        try:
+            bBuffer = b""
+            bSkipNext = False
+            while True:
+                bRead = oPopen.stdout.read1(65536)
+                bBuffer += bRead
+                lbEntries = bBuffer.split(b"\0")
+                bBuffer = lbEntries.pop()
+                for bEntry in lbEntries:
+                    # ... original path of renamed/copied entries
+                    if bSkipNext:
+                        bSkipNext = False
+                        continue
+                    sEntry = bEntry.decode(sys.getfilesystemencoding(), "surrogateescape")
+                    if sEntry[:2] == "? ":
+                        yield (sEntry[2:], "??")
+                    elif sEntry[:2] == "! ":
+                        yield (sEntry[2:], "!!")
+                    elif sEntry[:2] in ("1 ", "2 ", "u "):
+                        iFields = {"1": 8, "2": 9, "u": 10}[sEntry[0]]
+                        lFields = sEntry.split(" ", iFields)
+                        yield (lFields[iFields], lFields[1].replace(".", " "))
+                        bSkipNext = sEntry[0] == "2"
+                if bRead == b"":
+                    break
+        finally:
+            oPopen.stdout.close()
+            oPopen.wait()
+            fStdErr.seek(0)
+            bStdErr = fStdErr.read()
+            fStdErr.close()
+        if oPopen.returncode != 0:
+            raise EnvironmentError(oPopen.returncode, bStdErr.decode(sys.stderr.encoding))
+
+
+class GCfgDiff:
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Differences Engine
+    In-process equivalent of 'diff -uN', following GNU diff algorithm (identical ends
+    trimming, confusing lines discarding, Myers O(ND) linear-space comparison with
+    cost-limiting heuristic, changes boundaries shifting) and unified output format.
+    NOTE: the default cost limit is lower than GNU diff's (4096), such as to keep
+    (pure Python) comparison of large and largely differing files linear; output is
+    identical to GNU diff's unless that limit is hit.
+    """
+
+    #------------------------------------------------------------------------------
+    # CONSTRUCTORS / DESTRUCTOR
+    #------------------------------------------------------------------------------
+
+    def __init__(self, _iContext=3, _iCostLimit=256):
+        # Properties (arguments)
+        self.__iContext = _iContext
+        self.__iCostLimit = _iCostLimit
+
+    #------------------------------------------------------------------------------
+    # METHODS
+    #------------------------------------------------------------------------------
+
+    #
+    # Input
+    #
+
+    def _read(self, _sFile, _sCommentPrefix=None):
+        """
+        Return the lines of the given file (empty if missing), stripping commented
+        and empty lines off (as a streaming pass) if a comment prefix is given.
+
+        @param  string  _sFile           File (path)
+        @param  string  _sCommentPrefix  Comment prefix
+
+        @return tuple(list,bool)  Lines (bytes, including line terminator) and binary status
+        """
+
+        if not os.path.exists(_sFile):
+            return ([], False)
+        with open(_sFile, "rb") as fFile:
+            if _sCommentPrefix is None:
+                byContent = fFile.read()
+                return (byContent.splitlines(True), b"\0" in byContent[:65536])
+            # ... (equivalent to: grep -Ev '^[[:space:]]*(<prefix>|$)')
+            reComment = re.compile(b"[ \t\n\v\f\r]*(?:%s|$)" % re.escape(_sCommentPrefix.encode(sys.getfilesystemencoding())))
+            lLines = []
+            bBinary = False
+            for byLine in fFile:
+                if b"\0" in byLine:
+                    bBinary = True
+                if byLine[-1:] == b"\n":
+                    byLine = byLine[:-1]
+                if reComment.match(byLine) is None:
+                    lLines += [byLine + b"\n"]
+        return (lLines, bBinary)
+
+    def _timestamp(self, _sFile):
+        """
+        Return the given file timestamp, as displayed in unified diff headers.
+
+        @param  string  _sFile  File (path)
+
+        @return string  Timestamp
+        """
+
+        try:
+            iTime_ns = os.stat(_sFile).st_mtime_ns
+        except OSError:
+            iTime_ns = 0
+        tTime = time.localtime(iTime_ns // 1000000000)
+        return "%s.%09d %s" % (time.strftime("%Y-%m-%d %H:%M:%S", tTime), iTime_ns % 1000000000, time.strftime("%z", tTime))
+
+    #
+    # Comparison
+    #
+
+    def _discard(self, _lA, _lB, _lChangedA, _lChangedB):
+        """
+        Discard the lines which match no line of the other file (or are part of a run
+        of such lines while matching many lines), flagging them as changed.
+
+        @param  list       _lA         Lines equivalence classes (first file)
+        @param  list       _lB         Lines equivalence classes (second file)
+        @param  bytearray  _lChangedA  Changed lines flags (first file; offset by one)
+        @param  bytearray  _lChangedB  Changed lines flags (second file; offset by one)
+
+        @return tuple(list,list,list,list)  Undiscarded lines and their (real) indexes, for both files
+        """
+
+        # Equivalence classes counts
+        ldCounts = [{}, {}]
+        for (iFile, lE) in enumerate((_lA, _lB)):
+            for iE in lE:
+                ldCounts[iFile][iE] = ldCounts[iFile].get(iE, 0) + 1
+
+        lResults = []
+        for (iFile, lE, lChanged) in ((0, _lA, _lChangedA), (1, _lB, _lChangedB)):
+            dCounts = ldCounts[1 - iFile]
+            iEnd = len(lE)
+
+            # Mark lines matching no line of the other file (1), or many lines (2; provisional)
+            iMany = 5
+            iTem = iEnd // 64
+            while True:
+                iTem >>= 2
+                if iTem <= 0:
+                    break
+                iMany *= 2
+            lDiscards = bytearray(iEnd)
+            for iLine in range(iEnd):
+                iMatches = dCounts.get(lE[iLine], 0)
+                if iMatches == 0:
+                    lDiscards[iLine] = 1
+                elif iMatches > iMany:
+                    lDiscards[iLine] = 2
+
+            # Keep provisional discards only within runs of discards
+            iLine = 0
+            while iLine < iEnd:
+                if lDiscards[iLine] == 2:
+                    lDiscards[iLine] = 0
+                elif lDiscards[iLine] != 0:
+                    iProvisional = 0
+                    iRunLine = iLine
+                    while iRunLine < iEnd and lDiscards[iRunLine] != 0:
+                        if lDiscards[iRunLine] == 2:
+                            iProvisional += 1
+                        iRunLine += 1
+                    while iRunLine > iLine and lDiscards[iRunLine - 1] == 2:
+                        iRunLine -= 1
+                        lDiscards[iRunLine] = 0
+                        iProvisional -= 1
+                    iLength = iRunLine - iLine
+                    if iProvisional * 4 > iLength:
+                        while iRunLine > iLine:
+                            iRunLine -= 1
+                            if lDiscards[iRunLine] == 2:
+                                lDiscards[iRunLine] = 0
+                    else:
+                        iMinimum = 1
+                        iTem = iLength >> 2
+                        while True:
+                            iTem >>= 2
+                            if iTem <= 0:
+                                break
+                            iMinimum <<= 1
+                        iMinimum += 1
+                        iRunLine = 0
+                        iConsecutive = 0
+                        while iRunLine < iLength:
+                            if lDiscards[iLine + iRunLine] != 2:
+                                iConsecutive = 0
+                            else:
+                                iConsecutive += 1
+                                if iMinimum == iConsecutive:
+                                    iRunLine -= iConsecutive
+                                elif iMinimum < iConsecutive:
+                                    lDiscards[iLine + iRunLine] = 0
+                            iRunLine += 1
+                        iConsecutive = 0
+                        for iRunLine in range(iLength):
+                            if iRunLine >= 8 and lDiscards[iLine + iRunLine] == 1:
+                                break
+                            if lDiscards[iLine + iRunLine] == 2:
+                                iConsecutive = 0
+                                lDiscards[iLine + iRunLine] = 0
+                            elif lDiscards[iLine + iRunLine] == 0:
+                                iConsecutive = 0
+                            else:
+                                iConsecutive += 1
+                            if iConsecutive == 3:
+                                break
+                        iLine += iLength - 1
+                        iConsecutive = 0
+                        for iRunLine in range(iLength):
+                            if iRunLine >= 8 and lDiscards[iLine - iRunLine] == 1:
+                                break
+                            if lDiscards[iLine - iRunLine] == 2:
+                                iConsecutive = 0
+                                lDiscards[iLine - iRunLine] = 0
+                            elif lDiscards[iLine - iRunLine] == 0:
+                                iConsecutive = 0
+                            else:
+                                iConsecutive += 1
+                            if iConsecutive == 3:
+                                break
+                iLine += 1
+
+            # Discard lines
+            lUndiscarded = []
+            lIndexes = []
+            for iLine in range(iEnd):
+                if lDiscards[iLine] == 0:
+                    lUndiscarded += [lE[iLine]]
+                    lIndexes += [iLine]
+                else:
+                    lChanged[iLine + 1] = 1
+            lResults += [lUndiscarded, lIndexes]
+
+        return tuple(lResults)
+
+    def _diag(self, _lA, _lB, _iXOff, _iXLim, _iYOff, _iYLim, _bMinimal, _lFD, _lBD, _iOffset, _iTooExpensive):
+        """
+        Find the midpoint of the shortest edit script for the given sequences
+        ranges (Myers "middle snake"), giving up - unless minimal - when too expensive.
+
+        @return tuple(int,int,bool,bool)  Midpoint (X, Y) and whether lower/upper halves must be minimal
+        """
+
+        iMax = len(_lA) + len(_lB) + 1
+        iDMin = _iXOff - _iYLim
+        iDMax = _iXLim - _iYOff
+        iFMid = _iXOff - _iYOff
+        iBMid = _iXLim - _iYLim
+        iFMin = iFMax = iFMid
+        iBMin = iBMax = iBMid
+        bOdd = (iFMid - iBMid) & 1
+        _lFD[iFMid + _iOffset] = _iXOff
+        _lBD[iBMid + _iOffset] = _iXLim
+        iCost = 0
+        while True:
+            iCost += 1
+
+            # Extend the top-down search by an edit step in each diagonal
+            if iFMin > iDMin:
+                iFMin -= 1
+                _lFD[iFMin - 1 + _iOffset] = -1
+            else:
+                iFMin += 1
+            if iFMax < iDMax:
+                iFMax += 1
+                _lFD[iFMax + 1 + _iOffset] = -1
+            else:
+                iFMax -= 1
+            for iD in range(iFMax, iFMin - 1, -2):
+                iTLo = _lFD[iD - 1 + _iOffset]
+                iTHi = _lFD[iD + 1 + _iOffset]
+                iX = iTHi if iTLo < iTHi else iTLo + 1
+                iY = iX - iD
+                while iX < _iXLim and iY < _iYLim and _lA[iX] == _lB[iY]:
+                    iX += 1
+                    iY += 1
+                _lFD[iD + _iOffset] = iX
+                if bOdd and iBMin <= iD <= iBMax and _lBD[iD + _iOffset] <= iX:
+                    return (iX, iY, True, True)
+
+            # Extend the bottom-up search by an edit step in each diagonal
+            if iBMin > iDMin:
+                iBMin -= 1
+                _lBD[iBMin - 1 + _iOffset] = iMax
+            else:
+                iBMin += 1
+            if iBMax < iDMax:
+                iBMax += 1
+                _lBD[iBMax + 1 + _iOffset] = iMax
+            else:
+                iBMax -= 1
+            for iD in range(iBMax, iBMin - 1, -2):
+                iTLo = _lBD[iD - 1 + _iOffset]
+                iTHi = _lBD[iD + 1 + _iOffset]
+                iX = iTLo if iTLo < iTHi else iTHi - 1
+                iY = iX - iD
+                while _iXOff < iX and _iYOff < iY and _lA[iX - 1] == _lB[iY - 1]:
+                    iX -= 1
+                    iY -= 1
+                _lBD[iD + _iOffset] = iX
+                if not bOdd and iFMin <= iD <= iFMax and iX <= _lFD[iD + _iOffset]:
+                    return (iX, iY, True, True)
+
+            # Heuristic: when too expensive, settle with the best diagonals found so far
+            if _bMinimal or iCost < _iTooExpensive:
+                continue
+            iFXYBest = -1
+            iFXBest = 0
+            for iD in range(iFMax, iFMin - 1, -2):
+                iX = min(_lFD[iD + _iOffset], _iXLim)
+                iY = iX - iD
+                if _iYLim < iY:
+                    iX = _iYLim + iD
+                    iY = _iYLim
+                if iFXYBest < iX + iY:
+                    iFXYBest = iX + iY
+                    iFXBest = iX
+            iBXYBest = iMax * 2
+            iBXBest = 0
+            for iD in range(iBMax, iBMin - 1, -2):
+                iX = max(_iXOff, _lBD[iD + _iOffset])
+                iY = iX - iD
+                if iY < _iYOff:
+                    iX = _iYOff + iD
+                    iY = _iYOff
+                if iX + iY < iBXYBest:
+                    iBXYBest = iX + iY
+                    iBXBest = iX
+            if (_iXLim + _iYLim) - iBXYBest < iFXYBest - (_iXOff + _iYOff):
+                return (iFXBest, iFXYBest - iFXBest, True, False)
+            return (iBXBest, iBXYBest - iBXBest, False, True)
+
+    def _shift(self, _lE, _lbChanged, _lbChangedOther):
+        """
+        Shift the boundaries of runs of changed lines, so as to merge adjacent runs
+        and align them with runs of changes in the other file.
+
+        @param  list       _lE              Lines equivalence classes
+        @param  bytearray  _lbChanged       Changed lines flags (offset by one)
+        @param  bytearray  _lbChangedOther  Changed lines flags of the other file (offset by one)
+        """
+
+        iLine = 0
+        iLineOther = 0
+        iEnd = len(_lE)
+        while True:
+
+            # Find the beginning of the next run of changes (and the corresponding point in the other file)
+            while iLine < iEnd and not _lbChanged[iLine + 1]:
+                while _lbChangedOther[iLineOther + 1]:
+                    iLineOther += 1
+                iLineOther += 1
+                iLine += 1
+            if iLine == iEnd:
+                break
+            iStart = iLine
+
+            # Find the end of this run of changes
+            iLine += 1
+            while _lbChanged[iLine + 1]:
+                iLine += 1
+            while _lbChangedOther[iLineOther + 1]:
+                iLineOther += 1
+
+            while True:
+                iRun = iLine - iStart
+
+                # Move the run backward (merging with previous runs)
+                while iStart and _lE[iStart - 1] == _lE[iLine - 1]:
+                    iStart -= 1
+                    _lbChanged[iStart + 1] = 1
+                    iLine -= 1
+                    _lbChanged[iLine + 1] = 0
+                    while _lbChanged[iStart]:
+                        iStart -= 1
+                    iLineOther -= 1
+                    while _lbChangedOther[iLineOther + 1]:
+                        iLineOther -= 1
+                iCorresponding = iLine if _lbChangedOther[iLineOther] else iEnd
+
+                # Move the run forward (merging with following runs)
+                while iLine != iEnd and _lE[iStart] == _lE[iLine]:
+                    _lbChanged[iStart + 1] = 0
+                    iStart += 1
+                    _lbChanged[iLine + 1] = 1
+                    iLine += 1
+                    while _lbChanged[iLine + 1]:
+                        iLine += 1
+                    iLineOther += 1
+                    while _lbChangedOther[iLineOther + 1]:
+                        iCorresponding = iLine
+                        iLineOther += 1
+
+                if iRun == iLine - iStart:
+                    break
+
+            # Move the run back to a corresponding run in the other file
+            while iCorresponding < iLine:
+                iStart -= 1
+                _lbChanged[iStart + 1] = 1
+                iLine -= 1
+                _lbChanged[iLine + 1] = 0
+                iLineOther -= 1
+                while _lbChangedOther[iLineOther + 1]:
+                    iLineOther -= 1
+
+    def _compare(self, _lA, _lB):
+        """
+        Return the changed lines flags for the given sequences.
+
+        @param  list  _lA  Lines equivalence classes (first file)
+        @param  list  _lB  Lines equivalence classes (second file)
+
+        @return tuple(bytearray,bytearray)  Changed lines flags (offset by one) for both files
+        """
+
+        lChangedA = bytearray(len(_lA) + 2)
+        lChangedB = bytearray(len(_lB) + 2)
+
+        # Discard confusing lines
+        (lA, lIndexesA, lB, lIndexesB) = self._discard(_lA, _lB, lChangedA, lChangedB)
+
+        # Compare
+        iTooExpensive = 1
+        iDiagonals = len(lA) + len(lB) + 3
+        while iDiagonals:
+            iTooExpensive <<= 1
+            iDiagonals >>= 2
+        iTooExpensive = max(self.__iCostLimit, iTooExpensive)
+        iOffset = len(lB) + 1
+        lFD = [0] * (len(lA) + len(lB) + 3)
+        lBD = [0] * (len(lA) + len(lB) + 3)
+        ltRanges = [(0, len(lA), 0, len(lB), False)]
+        while ltRanges:
+            (iXOff, iXLim, iYOff, iYLim, bMinimal) = ltRanges.pop()
+            while iXOff < iXLim and iYOff < iYLim and lA[iXOff] == lB[iYOff]:
+                iXOff += 1
+                iYOff += 1
+            while iXOff < iXLim and iYOff < iYLim and lA[iXLim - 1] == lB[iYLim - 1]:
+                iXLim -= 1
+                iYLim -= 1
+            if iXOff == iXLim:
+                for iY in range(iYOff, iYLim):
+                    lChangedB[lIndexesB[iY] + 1] = 1
+            elif iYOff == iYLim:
+                for iX in range(iXOff, iXLim):
+                    lChangedA[lIndexesA[iX] + 1] = 1
+            else:
+                (iXMid, iYMid, bMinimalLo, bMinimalHi) = self._diag(lA, lB, iXOff, iXLim, iYOff, iYLim, bMinimal, lFD, lBD, iOffset, iTooExpensive)
+                ltRanges += [(iXMid, iXLim, iYMid, iYLim, bMinimalHi), (iXOff, iXMid, iYOff, iYMid, bMinimalLo)]
+
+        # Shift changes boundaries
+        self._shift(_lA, lChangedA, lChangedB)
+        self._shift(_lB, lChangedB, lChangedA)
+
+        return (lChangedA, lChangedB)
+
+    def _changes(self, _lLinesA, _lLinesB):
+        """
+        Return the changes between the given lines.
+
+        @param  list  _lLinesA  First file lines
+        @param  list  _lLinesB  Second file lines
+
+        @return list  Changes: (first file line, deleted lines count, second file line, inserted lines count) tuples
+        """
+
+        iA = len(_lLinesA)
+        iB = len(_lLinesB)
+
+        # Identical ends (kept within context horizon)
+        iPrefix = 0
+        while iPrefix < iA and iPrefix < iB and _lLinesA[iPrefix] == _lLinesB[iPrefix]:
+            iPrefix += 1
+        iSuffix = 0
+        while iSuffix < iA - iPrefix and iSuffix < iB - iPrefix and _lLinesA[iA - iSuffix - 1] == _lLinesB[iB - iSuffix - 1]:
+            iSuffix += 1
+        iPrefix = max(0, iPrefix - self.__iContext)
+        iSuffix = max(0, iSuffix - self.__iContext)
+
+        # Changes
+        dClasses = {}
+        lA = [dClasses.setdefault(byLine, len(dClasses)) for byLine in _lLinesA[iPrefix:iA - iSuffix]]
+        lB = [dClasses.setdefault(byLine, len(dClasses)) for byLine in _lLinesB[iPrefix:iB - iSuffix]]
+        (lChangedA, lChangedB) = self._compare(lA, lB)
+        ltChanges = []
+        iLineA = 0
+        iLineB = 0
+        while iLineA < len(lA) or iLineB < len(lB):
+            if lChangedA[iLineA + 1] or lChangedB[iLineB + 1]:
+                (iStartA, iStartB) = (iLineA, iLineB)
+                while lChangedA[iLineA + 1]:
+                    iLineA += 1
+                while lChangedB[iLineB + 1]:
+                    iLineB += 1
+                ltChanges += [(iPrefix + iStartA, iLineA - iStartA, iPrefix + iStartB, iLineB - iStartB)]
+            iLineA += 1
+            iLineB += 1
+        return ltChanges
+
+    #
+    # Output
+    #
+
+    def stat(self, _sFileA, _sFileB, _sLabelA=None, _sLabelB=None, _sCommentPrefix=None):
+        """
+        Return the count of lines added and removed between the given files
+        (see diff() for arguments).
+
+        @return tuple(int,int)  Added and removed lines count (None if binary); None if no differences
+        """
+
+        (lLinesA, bBinaryA) = self._read(_sFileA, _sCommentPrefix)
+        (lLinesB, bBinaryB) = self._read(_sFileB, _sCommentPrefix)
+        if lLinesA == lLinesB:
+            return None
+        if bBinaryA or bBinaryB:
+            return (None, None)
+        ltChanges = self._changes(lLinesA, lLinesB)
+        return (sum(tChange[3] for tChange in ltChanges), sum(tChange[1] for tChange in ltChanges))
+
+    def diff(self, _sFileA, _sFileB, _sLabelA=None, _sLabelB=None, _sCommentPrefix=None):
+        """
+        Return the differences between the given files, in unified format;
+        missing files being treated as empty (equivalent to: diff -uN).
+        If a comment prefix is given, commented and empty lines are stripped off
+        both files beforehand.
+
+        @param  string  _sFileA          First file (path)
+        @param  string  _sFileB          Second file (path)
+        @param  string  _sLabelA         First file label (instead of its path and timestamp)
+        @param  string  _sLabelB         Second file label (idem)
+        @param  string  _sCommentPrefix  Comment prefix
+
+        @return bytes  Differences (empty if none)
+        """
+
+        # Lines
+        (lLinesA, bBinaryA) = self._read(_sFileA, _sCommentPrefix)
+        (lLinesB, bBinaryB) = self._read(_sFileB, _sCommentPrefix)
+        if lLinesA == lLinesB:
+            return b""
+        sEncoding = sys.getfilesystemencoding()
+        sHeaderA = _sLabelA if _sLabelA is not None else "%s\t%s" % (_sFileA, self._timestamp(_sFileA))
+        sHeaderB = _sLabelB if _sLabelB is not None else "%s\t%s" % (_sFileB, self._timestamp(_sFileB))
+        if bBinaryA or bBinaryB:
+            return ("Binary files %s and %s differ\n" % (_sLabelA or _sFileA, _sLabelB or _sFileB)).encode(sEncoding, "surrogateescape")
+        iA = len(lLinesA)
+        iB = len(lLinesB)
+        ltChanges = self._changes(lLinesA, lLinesB)
+
+        # Unified output
+        lOutput = [("--- %s\n+++ %s\n" % (sHeaderA, sHeaderB)).encode(sEncoding, "surrogateescape")]
+        iContext = self.__iContext
+        iChange = 0
+        while iChange < len(ltChanges):
+
+            # Hunk (changes less than 2 * context lines apart)
+            iChangeLast = iChange
+            while iChangeLast + 1 < len(ltChanges) and ltChanges[iChangeLast + 1][0] - (ltChanges[iChangeLast][0] + ltChanges[iChangeLast][1]) <= 2 * iContext:
+                iChangeLast += 1
+            iFirstA = max(0, ltChanges[iChange][0] - iContext)
+            iFirstB = max(0, ltChanges[iChange][2] - iContext)
+            iLastA = min(iA, ltChanges[iChangeLast][0] + ltChanges[iChangeLast][1] + iContext) - 1
+            iLastB = min(iB, ltChanges[iChangeLast][2] + ltChanges[iChangeLast][3] + iContext) - 1
+            lRanges = []
+            for (iFirst, iLast) in ((iFirstA, iLastA), (iFirstB, iLastB)):
+                if iLast < iFirst:
+                    lRanges += ["%d,0" % (iLast + 1)]
+                elif iLast == iFirst:
+                    lRanges += ["%d" % (iFirst + 1)]
+                else:
+                    lRanges += ["%d,%d" % (iFirst + 1, iLast - iFirst + 1)]
+            lOutput += [("@@ -%s +%s @@\n" % tuple(lRanges)).encode("ascii")]
+
+            # Lines
+            iLineA = iFirstA
+            iLineB = iFirstB
+            while iLineA <= iLastA or iLineB <= iLastB:
+                if iChange > iChangeLast or iLineA < ltChanges[iChange][0]:
+                    lLines = [(b" ", lLinesA[iLineA])]
+                    iLineA += 1
+                    iLineB += 1
+                else:
+                    (iStartA, iDeleted, iStartB, iInserted) = ltChanges[iChange]
+                    lLines = [(b"-", byLine) for byLine in lLinesA[iLineA:iLineA + iDeleted]] + [(b"+", byLine) for byLine in lLinesB[iLineB:iLineB + iInserted]]
+                    iLineA += iDeleted
+                    iLineB += iInserted
+                    iChange += 1
+                for (byType, byLine) in lLines:
+                    lOutput += [byType, byLine]
+                    if byLine[-1:] != b"\n":
+                        lOutput += [b"\n\\ No newline at end of file\n"]
+            iChange = iChangeLast + 1
+
+        return b"".join(lOutput)
+
+
+class GCfgInotify:
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Inotify Watcher
+    Minimal ('ctypes'-based) wrapper around the Linux inotify(7) API.
+    """
+
+    # Events (see <sys/inotify.h>)
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+
+    #------------------------------------------------------------------------------
+    # CONSTRUCTORS / DESTRUCTOR
+    #------------------------------------------------------------------------------
+
+    def __init__(self):
+        import ctypes
+        # Properties (internal)
+        self.__iFd = -1
+        self.__oLibC = ctypes.CDLL(None, use_errno=True)
+        self.__oLibC.inotify_init1.argtypes = [ctypes.c_int]
+        self.__oLibC.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.__oLibC.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.__iFd = self.__oLibC.inotify_init1(os.O_CLOEXEC)
+        if self.__iFd < 0:
+            iErrno = ctypes.get_errno()
+            raise EnvironmentError(iErrno, "Failed to initialize inotify; %s" % os.strerror(iErrno))
+
+    def __del__(self):
+        self.close()
+
+    #------------------------------------------------------------------------------
+    # METHODS
+    #------------------------------------------------------------------------------
+
+    def add(self, _sDirectory, _iMask):
+        """
+        Watch the given directory for the given events.
+
+        @param  string  _sDirectory  Directory (path)
+        @param  int     _iMask       Events mask
+
+        @return int  Watch descriptor
+        """
+
+        import ctypes
+        iWatch = self.__oLibC.inotify_add_watch(self.__iFd, os.fsencode(_sDirectory), _iMask | self.IN_ONLYDIR)
+        if iWatch < 0:
+            iErrno = ctypes.get_errno()
+            raise EnvironmentError(iErrno, "Failed to watch directory; %s" % os.strerror(iErrno))
+        return iWatch
+
+    def remove(self, _iWatch):
+        """
+        Stop watching the given watch descriptor.
+
+        @param  int  _iWatch  Watch descriptor
+        """
+
+        self.__oLibC.inotify_rm_watch(self.__iFd, _iWatch)
+
+    def read(self, _fTimeout=None):
+        """
+        Return the pending events, waiting for them up to the given timeout.
+
+        @param  float  _fTimeout  Timeout (seconds; None = forever)
+
+        @return list  (watch descriptor, events mask, name) tuples
+        """
+
+        import select
+        import struct
+        (lReady, _, _) = select.select([self.__iFd], [], [], _fTimeout)
+        if not lReady:
+            return []
+        byBuffer = os.read(self.__iFd, 65536)
+        ltEvents = []
+        iOffset = 0
+        while iOffset < len(byBuffer):
+            (iWatch, iMask, _, iLength) = struct.unpack_from("iIII", byBuffer, iOffset)
+            iOffset += 16
+            sName = os.fsdecode(byBuffer[iOffset:iOffset + iLength].rstrip(b"\x00"))
+            iOffset += iLength
+            ltEvents += [(iWatch, iMask, sName)]
+        return ltEvents
+
+    def close(self):
+        """
+        Close the inotify instance.
+        """
+
+        if self.__iFd >= 0:
+            os.close(self.__iFd)
+            self.__iFd = -1
+
+
+class GCfgTrace:
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Spans Tracer
+    Records (thread-aware) spans - library operations, subprocesses, filesystem-heavy
+    steps - and exports them as Chrome/Perfetto trace events (JSON), viewable with
+    'chrome://tracing' or <https://ui.perfetto.dev>.
+    """
+
+    #------------------------------------------------------------------------------
+    # CONSTRUCTORS / DESTRUCTOR
+    #------------------------------------------------------------------------------
+
+    def __init__(self, _sPath):
+        # Properties (arguments)
+        self.__sPath = _sPath
+
+        # Properties (internal)
+        self.__iPid = os.getpid()
+        self.__ldEvents = []
+
+    #------------------------------------------------------------------------------
+    # METHODS
+    #------------------------------------------------------------------------------
+
+    def span(self, _sName, _sCategory, _dArguments=None):
+        """
+        Return a context manager recording the given span (on exit).
+
+        @param  string  _sName       Span name
+        @param  string  _sCategory   Span category (e.g. 'api', 'shell', 'fs')
+        @param  dict    _dArguments  Span arguments (JSON-serializable)
+
+        @return object  Context manager (yielding the span arguments, which may be updated)
+        """
+
+        import contextlib
+
+        @contextlib.contextmanager
+        def _span():
+            dArguments = dict(_dArguments or {})
+            iStart_ns = time.perf_counter_ns()
+            try:
+                yield dArguments
+            except BaseException as e:
+                dArguments["error"] = str(e)
+                raise
+            finally:
+                iEnd_ns = time.perf_counter_ns()
+                # NOTE: list.append() is atomic (no lock required)
+                self.__ldEvents.append({
+                    "name": _sName,
+                    "cat": _sCategory,
+                    "ph": "X",
+                    "ts": iStart_ns / 1000,
+                    "dur": (iEnd_ns - iStart_ns) / 1000,
+                    "pid": self.__iPid,
+                    "tid": threading.get_ident(),
+                    "args": dArguments,
+                })
+        return _span()
+
+    def save(self):
+        """
+        Save (atomically) the recorded spans to the trace file; if the trace path is
+        a directory, the trace file is named after the process ID ('gcfg.<pid>.json').
+        """
+
+        import json
+        import tempfile
+        if not self.__ldEvents:
+            return
+        sPath = self.__sPath
+        if os.path.isdir(sPath):
+            sPath = os.path.join(sPath, "gcfg.%d.json" % self.__iPid)
+        ldEvents = [{
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.__iPid,
+            "args": {"name": "gcfg %s" % " ".join(sys.argv[1:])},
+        }] + sorted(self.__ldEvents, key=lambda d: d["ts"])
+        try:
+            (iFd, sPathTemp) = tempfile.mkstemp(prefix=".%s." % os.path.basename(sPath), dir=os.path.dirname(os.path.abspath(sPath)))
+            with os.fdopen(iFd, "w") as oFile:
+                json.dump({"traceEvents": ldEvents, "displayTimeUnit": "ms"}, oFile)
+            os.rename(sPathTemp, sPath)
+        except (OSError, TypeError, ValueError) as e:
+            sys.stderr.write("ERROR[trace]: Failed to save trace; %s\n" % str(e))
+
+
 class GCfgLib:
     """
     GIT-based Configuration Tracking Utility (GCFG) - Core Library
@@ -45,21 +1074,29 @@ class GCfgLib:
         self.__sAuthor = _sAuthor
         self.__sEmail = _sEmail
         self.__sRoot = _sRoot
-        # ... on *nix system, use 'pwd' as (current) working directory (without symlinks being dereferenced)
-        oPopen = subprocess.Popen("pwd", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        (bStdOut, bStdErr) = oPopen.communicate()
-        if (oPopen.returncode == 0):
-            self.__sWorkingDirectory = bStdOut.decode(sys.stdout.encoding).splitlines()[0]
-        else:
-            self.__sWorkingDirectory = os.getcwd()
 
         # Properties (internal)
-        self.__bDebug = False
-        self.__bSilent = False
         self.__asSubRepositories = {}
+        self.__doDatabases = {}
+        self.__oGitBackend = None
+        self.__oIndexLock = threading.Lock()
+        self.__dsSignatures = {}
+        self.__dtDigests = {}
+        self.__dtChecksums = {}
+        self.__oReadLock = threading.Lock()
+        self.__iBytesRead = 0
+        self.__bBatchSession = False
+        self.__diDevices = {}
         # ... regular expressions
         self.__rePathCron = re.compile(".*%scron\\..*%s.*" % (re.escape(os.sep), re.escape(os.sep)))
         self.__reFileText = re.compile("(^| )text( |$)")
+        # ... tracing (see 'GCFG_TRACE')
+        self.__oTrace = None
+        sTrace = os.getenv("GCFG_TRACE")
+        if sTrace:
+            self._traceInit(sTrace)
+        # ... (current) working directory and modes
+        self.reset()
 
     #------------------------------------------------------------------------------
     # METHODS
@@ -75,7 +1112,7 @@ class GCfgLib:
 
         @param  string  _sMessage  Error message
         """
-        sys.stderr.write("ERROR[%s]: %s\n" % (inspect.currentframe().f_back.f_code.co_name.lstrip("_"), _sMessage))
+        sys.stderr.write("ERROR[%s]: %s\n" % (sys._getframe(1).f_code.co_name.lstrip("_"), _sMessage))
 
     def _WARNING(self, _sMessage):
         """
@@ -84,7 +1121,7 @@ class GCfgLib:
         @param  string  _sMessage  Warning message
         """
         if not self.__bSilent:
-            sys.stderr.write("WARNING[%s]: %s\n" % (inspect.currentframe().f_back.f_code.co_name.lstrip("_"), _sMessage))
+            sys.stderr.write("WARNING[%s]: %s\n" % (sys._getframe(1).f_code.co_name.lstrip("_"), _sMessage))
 
     def _INFO(self, _sMessage):
         """
@@ -93,7 +1130,7 @@ class GCfgLib:
         @param  string  _sMessage  Informational message
         """
         if not self.__bSilent:
-            sys.stdout.write("INFO[%s]: %s\n" % (inspect.currentframe().f_back.f_code.co_name.lstrip("_"), _sMessage))
+            sys.stdout.write("INFO[%s]: %s\n" % (sys._getframe(1).f_code.co_name.lstrip("_"), _sMessage))
 
     def _DEBUG(self, _sMessage):
         """
@@ -102,12 +1139,86 @@ class GCfgLib:
         @param  string  _sMessage  Debug message
         """
         if self.__bDebug:
-            sys.stdout.write("DEBUG[%s]: %s\n" % (inspect.currentframe().f_back.f_code.co_name, _sMessage))
+            sys.stdout.write("DEBUG[%s]: %s\n" % (sys._getframe(1).f_code.co_name, _sMessage))
+
+    #
+    # Tracing
+    #
+
+    def _traceInit(self, _sPath):
+        """
+        Enable tracing, recording spans for each public operation, subprocess and
+        filesystem-heavy step; spans are saved - as a Chrome/Perfetto trace - to the
+        given path when the process exits.
+        Public operations are wrapped (per instance) only when tracing is enabled,
+        such as to leave the non-traced code paths untouched.
+
+        @param  string  _sPath  Trace file (or directory) path
+        """
+
+        import atexit
+        import functools
+        import inspect
+
+        self.__oTrace = GCfgTrace(_sPath)
+        atexit.register(self.__oTrace.save)
+
+        def _wrap(_sName, _fMethod):
+            if inspect.isgeneratorfunction(_fMethod):
+                @functools.wraps(_fMethod)
+                def _traced(*_lArguments, **_dArguments):
+                    with self._trace(_sName, "api", {"arguments": [str(m) for m in _lArguments]}):
+                        yield from _fMethod(*_lArguments, **_dArguments)
+            else:
+                @functools.wraps(_fMethod)
+                def _traced(*_lArguments, **_dArguments):
+                    with self._trace(_sName, "api", {"arguments": [str(m) for m in _lArguments]}):
+                        return _fMethod(*_lArguments, **_dArguments)
+            return _traced
+
+        for sName in dir(GCfgLib):
+            if sName[0] == "_" or sName[:3] in ("get", "set") or sName == "reset":
+                continue
+            fMethod = getattr(self, sName)
+            if callable(fMethod):
+                setattr(self, sName, _wrap(sName, fMethod))
+
+    def _trace(self, _sName, _sCategory, _dArguments=None):
+        """
+        Return a context manager recording the given span (if tracing is enabled).
+
+        @param  string  _sName       Span name
+        @param  string  _sCategory   Span category (among: 'api', 'shell', 'fs')
+        @param  dict    _dArguments  Span arguments
+
+        @return object  Context manager (yielding the span arguments dictionary, or None if not tracing)
+        """
+
+        if self.__oTrace is None:
+            import contextlib
+            return contextlib.nullcontext()
+        return self.__oTrace.span(_sName, _sCategory, _dArguments)
 
     #
     # API (helpers)
     #
 
+    def _getEmail(self):
+        """
+        Return the commit author email, defaulting - if none was specified - to
+        'username@hostname' (as seen by 'getpwuid' and 'gethostbyaddr').
+        The default is computed only when (first) needed, since the underlying
+        DNS lookup may be slow.
+
+        @return string  Commit author email
+        """
+
+        if self.__sEmail is None:
+            import pwd
+            import socket
+            self.__sEmail = "%s@%s" % (pwd.getpwuid(os.getuid())[0], socket.gethostbyaddr(socket.gethostname())[0])
+        return self.__sEmail
+
     def setDebug(self, _bDebug):
         """
         Show debug (and all other) messages.
@@ -128,6 +1239,52 @@ class GCfgLib:
         if not self.__bDebug:
             self.__bSilent = _bSilent
 
+    def setParanoid(self, _bParanoid):
+        """
+        Always compare the full content of 'copy'/'reflink'-linked files (ignoring
+        their cached stat signature).
+
+        @param  bool  _bParanoid  Paranoid status
+        """
+
+        self.__bParanoid = _bParanoid
+
+    def setDigest(self, _bDigest):
+        """
+        Compare 'copy'/'reflink'-linked files to the content digest of their GIT
+        sibling (files index), thus reading only the actual file (rather than both).
+        (superseded by paranoid mode)
+
+        @param  bool  _bDigest  Digest status
+        """
+
+        self.__bDigest = _bDigest
+
+    def reset(self):
+        """
+        Reset the (current) working directory and the debug, silent, paranoid and
+        digest modes, such as to re-use the library - along its opened databases and
+        GIT coprocesses - for successive commands (e.g. 'gcfg daemon').
+        """
+
+        # Working directory
+        # ... on *nix system, use $PWD as (current) working directory (without symlinks being dereferenced),
+        #     provided it actually matches the physical working directory
+        self.__sWorkingDirectory = os.getcwd()
+        sWorkingDirectory = os.getenv("PWD")
+        if sWorkingDirectory is not None and os.path.isabs(sWorkingDirectory):
+            try:
+                if os.path.samefile(sWorkingDirectory, self.__sWorkingDirectory):
+                    self.__sWorkingDirectory = os.path.normpath(sWorkingDirectory)
+            except OSError:
+                pass
+
+        # Modes
+        self.__bDebug = False
+        self.__bSilent = False
+        self.__bParanoid = False
+        self.__bDigest = False
+
     def _confirm(self, _sPrompt, _lOptions, _sOptionDefault=None):
         """
         Display the given prompt and available options, waits for valid input
@@ -152,7 +1309,7 @@ class GCfgLib:
                 lOptions += sOption.lower()
 
         # Prompt
-        sPrompt = "CONFIRM[%s]: %s [%s] ? " % (inspect.currentframe().f_back.f_code.co_name.lstrip("_"), _sPrompt, "/".join(lOptions))
+        sPrompt = "CONFIRM[%s]: %s [%s] ? " % (sys._getframe(1).f_code.co_name.lstrip("_"), _sPrompt, "/".join(lOptions))
 
         # Input
         while True:
@@ -177,6 +1334,22 @@ class GCfgLib:
             sDirname = "."
         return sDirname
 
+    def _device(self, _sDirectory):
+        """
+        Return the device (filesystem) the given directory belongs to.
+        During batch sessions, results are cached per directory.
+
+        @param  string  _sDirectory  Directory (path)
+
+        @return int  Device ID
+        """
+
+        if not self.__bBatchSession:
+            return os.stat(_sDirectory).st_dev
+        if _sDirectory not in self.__diDevices:
+            self.__diDevices[_sDirectory] = os.stat(_sDirectory).st_dev
+        return self.__diDevices[_sDirectory]
+
     def _mkdir(self, _sDirectory):
         """
         Create the given directory (recursively).
@@ -236,21 +1409,94 @@ class GCfgLib:
             self._ERROR("%s; %s" % (e.strerror, _sDirectory))
             raise EnvironmentError(e.errno, "Failed to remove directory")
 
-    def _cp(self, _sSource, _sDestination):
+    def _cp(self, _sSource, _sDestination, _bReflink=False):
         """
         Copy the specified source file/directory to the specified destination file/directory.
+        Regular files data are copied without transiting through user space whenever possible;
+        by order of preference: reflink (copy-on-write clone; e.g. btrfs, XFS), 'copy_file_range'
+        or 'sendfile' system calls, plain (buffered) copy.
 
         @param  string  _sSource       Source file/directory path
         @param  string  _sDestination  Destination file/directory path
+        @param  bool    _bReflink      Require the file data to be reflinked (shared)
         """
 
+        import shutil
         self._DEBUG("Copying file/directory; %s => %s" % (_sSource, _sDestination))
-        oStat = os.stat(_sSource)
-        shutil.copy2(_sSource, _sDestination)
-        try:
-            os.chown(_sDestination, oStat.st_uid, oStat.st_gid)
-        except OSError:
-            self._WARNING("Failed to preserve file ownership; %s => %s" % (_sSource, _sDestination))
+        with self._trace("cp", "fs", {"source": _sSource, "destination": _sDestination}) as dTrace:
+            oStat = os.stat(_sSource)
+            if stat.S_ISREG(oStat.st_mode):
+                if os.path.isdir(_sDestination):
+                    _sDestination = os.path.join(_sDestination, os.path.basename(_sSource))
+                sMethod = self._cpData(_sSource, _sDestination, oStat.st_size, _bReflink)
+                shutil.copystat(_sSource, _sDestination)
+                if dTrace is not None:
+                    dTrace.update(size=oStat.st_size, method=sMethod)
+            elif _bReflink:
+                raise EnvironmentError(errno.EOPNOTSUPP, "Cannot reflink non-regular file")
+            else:
+                shutil.copy2(_sSource, _sDestination)
+            try:
+                os.chown(_sDestination, oStat.st_uid, oStat.st_gid)
+            except OSError:
+                self._WARNING("Failed to preserve file ownership; %s => %s" % (_sSource, _sDestination))
+
+    def _cpData(self, _sSource, _sDestination, _iSize, _bReflink=False):
+        """
+        Copy the specified source file data to the specified destination file
+        (see '_cp' for the copy methods order of preference).
+
+        @param  string  _sSource       Source file path
+        @param  string  _sDestination  Destination file path
+        @param  int     _iSize         Source file size (bytes)
+        @param  bool    _bReflink      Require the file data to be reflinked (shared)
+
+        @return string  Copy method
+        """
+
+        import fcntl
+        import shutil
+        with open(_sSource, "rb") as fSource:
+            with open(_sDestination, "wb") as fDestination:
+                iSource = fSource.fileno()
+                iDestination = fDestination.fileno()
+
+                # Reflink
+                try:
+                    fcntl.ioctl(iDestination, GCFG_IOCTL_FICLONE, iSource)
+                    self._DEBUG("=> reflink")
+                    return "reflink"
+                except OSError as e:
+                    if _bReflink:
+                        raise EnvironmentError(e.errno, e.strerror)
+
+                # In-kernel copy
+                # NOTE: fall back to the next method only if nothing was copied yet
+                #       (both system calls are used with explicit source offsets; the file position is untouched)
+                iChunk = min(max(_iSize, 8388608), 1073741824)
+                for sMethod in ("copy_file_range", "sendfile"):
+                    if not hasattr(os, sMethod):
+                        continue
+                    iOffset = 0
+                    try:
+                        while True:
+                            if sMethod == "copy_file_range":
+                                iCopied = os.copy_file_range(iSource, iDestination, iChunk, iOffset, iOffset)
+                            else:
+                                iCopied = os.sendfile(iDestination, iSource, iOffset, iChunk)
+                            if not iCopied:
+                                break
+                            iOffset += iCopied
+                        self._DEBUG("=> %s" % sMethod)
+                        return sMethod
+                    except OSError as e:
+                        if iOffset or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.EPERM):
+                            raise
+
+                # Plain copy
+                shutil.copyfileobj(fSource, fDestination, 65536)
+                self._DEBUG("=> copy")
+                return "copy"
 
     def _mv(self, _sSource, _sDestination):
         """
@@ -260,13 +1506,15 @@ class GCfgLib:
         @param  string  _sDestination  Destination file/directory path
         """
 
+        import shutil
         self._DEBUG("Moving file/directory; %s => %s" % (_sSource, _sDestination))
-        oStat = os.stat(_sSource)
-        shutil.move(_sSource, _sDestination)
-        try:
-            os.chown(_sDestination, oStat.st_uid, oStat.st_gid)
-        except OSError:
-            self._WARNING("Failed to preserve file ownership; %s => %s" % (_sSource, _sDestination))
+        with self._trace("mv", "fs", {"source": _sSource, "destination": _sDestination}):
+            oStat = os.stat(_sSource)
+            shutil.move(_sSource, _sDestination)
+            try:
+                os.chown(_sDestination, oStat.st_uid, oStat.st_gid)
+            except OSError:
+                self._WARNING("Failed to preserve file ownership; %s => %s" % (_sSource, _sDestination))
 
     def _rm(self, _sFile):
         """
@@ -278,7 +1526,22 @@ class GCfgLib:
         self._DEBUG("Removing file; %s" % _sFile)
         os.unlink(_sFile)
 
-    def _shellCommand(self, _lCommand, _sWorkingDirectory=None, _bRedirectStdOut=True, _bIgnoreReturnCode=False):
+    def _bytesRead(self, _iBytes=0):
+        """
+        Account for (and return the total of) the bytes read when comparing files
+        content or computing their digest (see 'verifyCheck' metrics).
+        (thread-safe)
+
+        @param  int  _iBytes  Bytes read
+
+        @return int  Bytes read (total)
+        """
+
+        with self.__oReadLock:
+            self.__iBytesRead += _iBytes
+            return self.__iBytesRead
+
+    def _shellCommand(self, _lCommand, _sWorkingDirectory=None, _bRedirectStdOut=True, _bIgnoreReturnCode=False, _byInput=None, _dsEnvironment=None):
         """
         Execute the given shell command, within the given working directory,
         and returns the resulting standard output
@@ -287,26 +1550,31 @@ class GCfgLib:
         @param  string  _sWorkingDirectory  Directory to switch to before executing the command
         @param  bool    _bRedirectStdOut    Redirect standard output
         @param  bool    _bIgnoreReturnCode  Do not raise error in case of non-zero return code
+        @param  bytes   _byInput            Standard input (data)
+        @param  dict    _dsEnvironment      Additional environment variables
 
         @return string  Resulting standard output (if redirected)
         """
 
         # Execute shell command
+        import subprocess
         self._DEBUG("Executing shell command; %s: %s" % (_sWorkingDirectory, " ".join(_lCommand)))
-        if _bRedirectStdOut:
-            oPopen = subprocess.Popen(
-                _lCommand,
-                cwd=_sWorkingDirectory,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-        else:
+        dsEnvironment = None
+        if _dsEnvironment is not None:
+            dsEnvironment = dict(os.environ)
+            dsEnvironment.update(_dsEnvironment)
+        with self._trace(os.path.basename(_lCommand[0]), "shell", {"argv": list(_lCommand), "cwd": _sWorkingDirectory}) as dTrace:
             oPopen = subprocess.Popen(
                 _lCommand,
                 cwd=_sWorkingDirectory,
+                env=dsEnvironment,
+                stdin=subprocess.PIPE if _byInput is not None else None,
+                stdout=subprocess.PIPE if _bRedirectStdOut else None,
                 stderr=subprocess.PIPE
             )
-        (bStdOut, bStdErr) = oPopen.communicate()
+            (bStdOut, bStdErr) = oPopen.communicate(_byInput)
+            if dTrace is not None:
+                dTrace.update(returncode=oPopen.returncode)
         if not _bIgnoreReturnCode and oPopen.returncode != 0:
             raise EnvironmentError(oPopen.returncode, bStdErr.decode(sys.stderr.encoding))
         if bStdOut is not None:
@@ -314,6 +1582,23 @@ class GCfgLib:
         else:
             return None
 
+    def _output(self, _byOutput, _bRedirectStdOut=True):
+        """
+        Return (or write to the standard output) the given (in-process) command output.
+
+        @param  bytes  _byOutput         Command output
+        @param  bool   _bRedirectStdOut  Redirect standard output
+
+        @return string  Command output (if redirected)
+        """
+
+        if _bRedirectStdOut:
+            return _byOutput.decode(sys.stdout.encoding)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_byOutput)
+        sys.stdout.buffer.flush()
+        return None
+
     def getCanonicalPath(self, _sPath, _bAllowDirectory=False):
         """
         Return the canonical path matching the given input path.
@@ -362,7 +1647,7 @@ class GCfgLib:
         """
         Return the sub-repository path matching the given (actual) file.
 
-        @param  string  _sRepository  Sub-repository name (among: 'git', 'original', 'flag' or 'pkglist')
+        @param  string  _sRepository  Sub-repository name (among: 'git', 'original', 'flag', 'index' or 'pkglist')
         @param  string  _sFileActual  Actual file (canonical path)
 
         @return string  Absolute/canonical sub-repository file path
@@ -378,7 +1663,7 @@ class GCfgLib:
         Return the sub-repository path matching the given (actual) file.
         (including validation and exceptions handling)
 
-        @param  string  _sRepository  Sub-repository name (among: 'git', 'original', 'flag' or 'pkglist')
+        @param  string  _sRepository  Sub-repository name (among: 'git', 'original', 'flag', 'index' or 'pkglist')
         @param  string  _sFileActual  Actual file (path)
 
         @return string  Absolute/canonical sub-repository file path
@@ -427,18 +1712,45 @@ class GCfgLib:
             return (True, "hardlink")
 
         # Copy ?
+        # NOTE: reflinked files being distinct inodes, they are compared (and told apart) like copies
         self._DEBUG("Checking file is copy; %s" % _sFileActual)
+        sLink = "reflink" if self._indexLink(_sFileActual) == "reflink" else "copy"
         if not oStatGIT.st_size == oStatActual.st_size:
-            return (False, "copy")
-        with open(_sFileGIT, "rb", 65536) as fFileGIT:
-            with open(_sFileActual, "rb", 65536) as fFileActual:
-                while True:
-                    byReadGIT = fFileGIT.read(65536)
-                    byReadActual = fFileActual.read(65536)
-                    if not byReadGIT == byReadActual:
-                        return (False, "copy")
-                    if byReadGIT == b"":
-                        return (True, "copy")
+            return (False, sLink)
+        # ... stat signature (unchanged since last found identical)
+        sSignature = self._signature(oStatGIT, oStatActual)
+        if not self.__bParanoid and sSignature == self._indexSignature(_sFileActual):
+            self._DEBUG("=> stat signature unchanged; %s" % sSignature)
+            return (True, sLink)
+        # ... content
+        iTime_ns = time.time_ns()
+        sDigestGIT = None
+        if self.__bDigest and not self.__bParanoid:
+            sDigestGIT = self._indexDigest(_sFileActual, _sFileGIT, oStatGIT)
+        with self._trace("isLinked", "fs", {"file": _sFileActual, "size": oStatActual.st_size, "digest": sDigestGIT is not None}):
+            if sDigestGIT is not None:
+                self._DEBUG("Comparing file digest; %s" % _sFileActual)
+                if not self._digest(_sFileActual) == sDigestGIT:
+                    return (False, sLink)
+            else:
+                iRead = 0
+                try:
+                    with open(_sFileGIT, "rb", 65536) as fFileGIT:
+                        with open(_sFileActual, "rb", 65536) as fFileActual:
+                            while True:
+                                byReadGIT = fFileGIT.read(65536)
+                                byReadActual = fFileActual.read(65536)
+                                iRead += len(byReadGIT) + len(byReadActual)
+                                if not byReadGIT == byReadActual:
+                                    return (False, sLink)
+                                if byReadGIT == b"":
+                                    break
+                finally:
+                    self._bytesRead(iRead)
+        # ... (do not trust racily-clean files, which might change within the same timestamp granularity)
+        if max(oStatGIT.st_ctime_ns, oStatActual.st_ctime_ns) < iTime_ns - 2000000000:
+            self._indexSignature(_sFileActual, sSignature)
+        return (True, sLink)
 
     def isLinked(self, _sFileActual):
         """
@@ -459,23 +1771,62 @@ class GCfgLib:
             sFileGIT = self._getRepositoryPath("git", sFileActual)
 
             # Linked ?
-            return self._isLinked(sFileGIT, sFileActual)
+            tLinked = self._isLinked(sFileGIT, sFileActual)
+            self._indexFlush()
+            return tLinked
 
         except EnvironmentError as e:
             self._ERROR("%s; %s" % (e.strerror, _sFileActual))
             raise EnvironmentError(e.errno, "Failed to compare files")
 
+    def checksum(self, _sFileActual):
+        """
+        Return the content checksum (raw SHA-1) of the given actual file, provided
+        it is correctly linked with its GIT sibling; the checksum is retrieved from
+        the files index and (re-)computed only if the GIT file stat data changed.
+        (including exceptions handling)
+
+        @param  string  _sFileActual  Actual file (path)
+
+        @return string  Content checksum (hexadecimal); None if the file is not tracked or not linked
+        """
+
+        try:
+
+            # Paths
+            sFileActual = self.getCanonicalPath(_sFileActual)
+            sFileGIT = self._getRepositoryPath("git", sFileActual)
+
+            # Linked ?
+            if not os.path.exists(sFileGIT):
+                return None
+            (bLinked, _) = self._isLinked(sFileGIT, sFileActual)
+            if not bLinked:
+                self._indexFlush()
+                return None
+
+            # Checksum
+            sChecksum = self._indexChecksum(sFileActual, sFileGIT, os.stat(sFileGIT))
+            self._indexFlush()
+            return sChecksum
+
+        except EnvironmentError as e:
+            self._ERROR("%s; %s" % (e.strerror, _sFileActual))
+            raise EnvironmentError(e.errno, "Failed to retrieve file checksum")
+
     def _link(self, _sFileGIT, _sFileActual, _sLink=None, _bBatch=False, _bForce=False):
         """
         Link the given GIT file with the given actual file, after validating and using
         the given link type.
-        By default (if the link type is ommitted), 'hardlink' will be used, unless:
+        By default (if the link type is ommitted), 'hardlink' will be used (or 'reflink' if
+        the file was previously reflinked), unless:
          - the file to track is in a special directory; e.g. cron-related directory => 'symlink'
          - the link crosses filesystem boundaries => 'copy'
+        Should reflinks not be supported by the underlying filesystem, 'copy' will be used.
 
         @param  string  _sFileGIT     File (canonical path) within GIT sub-repository
         @param  string  _sFileActual  Actual file (canonical path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch       Batch mode (no confirmation prompts)
         @param  bool    _bForce       Forced batch mode
 
@@ -495,8 +1846,8 @@ class GCfgLib:
         self._DEBUG("Validating link type; %s" % _sLink)
         sLink_validated = _sLink
         if sLink_validated is None:
-            sLink_validated = "hardlink"
-        if os.stat(sDirGIT).st_dev != os.stat(sDirActual).st_dev:
+            sLink_validated = "reflink" if self._indexLink(_sFileActual) == "reflink" else "hardlink"
+        if self._device(sDirGIT) != self._device(sDirActual):
             sLink_validated = "copy"
         elif self.__rePathCron.search(_sFileActual) is not None:
             sLink_validated = "symlink"
@@ -524,7 +1875,7 @@ class GCfgLib:
         elif bLinked:
             return None
 
-        # Inconsistency ('copy'-linked files differ or missing GIT/actual file)
+        # Inconsistency ('copy'/'reflink'-linked files differ or missing GIT/actual file)
         bUseFileActual = None
         if not bLinked and os.path.exists(_sFileGIT):
             if not _bBatch:
@@ -550,7 +1901,7 @@ class GCfgLib:
                         bUseFileActual = False
                         break
                     elif sConfirm == "d":
-                        self._shellCommand(["diff", "-uN", "--label", "GIT", _sFileGIT, _sFileActual], None, False, True)
+                        self._output(GCfgDiff().diff(_sFileGIT, _sFileActual, "GIT"), False)
             else:
                 if not _bForce:
                     raise EnvironmentError(errno.EPERM, "Cannot update differing files (unless forced)")
@@ -587,11 +1938,22 @@ class GCfgLib:
             os.link(_sFileGIT, _sFileActual)
         elif sLink_validated == "symlink":
             os.symlink(_sFileGIT, _sFileActual)
+        elif sLink_validated == "reflink":
+            try:
+                self._cp(_sFileGIT, _sFileActual, True)
+            except EnvironmentError as e:
+                self._WARNING("Reflink not supported; %s (%s)" % (_sFileActual, e.strerror))
+                self._WARNING("Link type overridden; reflink => copy")
+                sLink_validated = "copy"
+                self._cp(_sFileGIT, _sFileActual)
         elif sLink_validated == "copy":
             self._cp(_sFileGIT, _sFileActual)
         else:
             # Something is very wrong...
             raise Exception("Invalid link type; %s" % sLink_validated)
+
+        # Index
+        self._indexUpdate(_sFileActual, sLink_validated)
         return sLink_validated
 
     def link(self, _sFileActual, _sLink=None, _bBatch=False, _bForce=False):
@@ -601,10 +1963,11 @@ class GCfgLib:
         By default (if the link type is ommitted), 'hardlink' will be used, unless:
          - the file to track is in a special directory; e.g. cron-related directory => "symlink"
          - the link crosses filesystem boundaries => "copy"
+        Should reflinks not be supported by the underlying filesystem, "copy" will be used.
         (including informational messages and exceptions handling)
 
         @param  string  _sFileActual  Actual file (path)
-        @param  string  _sLink        Link type (among: "hardlink", "symlink", "copy" or None)
+        @param  string  _sLink        Link type (among: "hardlink", "symlink", "copy", "reflink" or None)
         @param  bool    _bBatch       Batch mode (no confirmation prompts)
         @param  bool    _bForce       Forced batch mode
 
@@ -640,19 +2003,426 @@ class GCfgLib:
             self._ERROR("%s; %s" % (e.strerror, _sFileActual))
             raise EnvironmentError(e.errno, "Failed to link file to its GIT sibling")
 
-    def _gitCommand(self, _lArguments, _bRedirectStdOut=True):
+    def _gitCommand(self, _lArguments, _bRedirectStdOut=True, _byInput=None, _dsEnvironment=None):
         """
         Execute the GIT command with the given arguments, within the GIT sub-repository.
 
-        @param  list  _lArguments       GIT command arguments
-        @param  bool  _bRedirectStdOut  Redirect standard output
+        @param  list   _lArguments       GIT command arguments
+        @param  bool   _bRedirectStdOut  Redirect standard output
+        @param  bytes  _byInput          Standard input (data)
+        @param  dict   _dsEnvironment    Additional environment variables
 
         @return string  Resulting standard output (if redirected)
         """
 
         # Execute shell command
         lCommand = ["git"] + _lArguments
-        return self._shellCommand(lCommand, self.__asSubRepositories["git"], _bRedirectStdOut)
+        return self._shellCommand(lCommand, self.__asSubRepositories["git"], _bRedirectStdOut, False, _byInput, _dsEnvironment)
+
+    def _getGitBackend(self):
+        """
+        Return the GIT backend for the GIT sub-repository (created if needs be).
+
+        @return GCfgGitBackend  GIT backend
+        """
+
+        if self.__oGitBackend is None:
+            self.__oGitBackend = GCfgGitBackend(self.__asSubRepositories["git"], self._trace if self.__oTrace is not None else None)
+        return self.__oGitBackend
+
+    def getGitBackend(self):
+        """
+        Return the GIT backend for the GIT sub-repository (created if needs be),
+        providing fork-less objects lookups/reads (e.g. tags, blobs) and
+        streaming status.
+        (including validation and exceptions handling)
+
+        @return GCfgGitBackend  GIT backend
+        """
+
+        try:
+            if "git" not in self.__asSubRepositories:
+                raise EnvironmentError(errno.ENOENT, "Configuration repository not checked")
+            return self._getGitBackend()
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to retrieve GIT backend")
+
+    def _digest(self, _sFile):
+        """
+        Return the content digest of the given file, as GIT blob ID (SHA-1 of
+        'blob <size>\\0<content>'; see 'git hash-object').
+
+        @param  string  _sFile  File (path)
+
+        @return string  Content digest (hexadecimal)
+        """
+
+        import hashlib
+        self._DEBUG("Computing file digest; %s" % _sFile)
+        oHash = hashlib.sha1()
+        with open(_sFile, "rb", 65536) as fFile:
+            iSize = os.fstat(fFile.fileno()).st_size
+            oHash.update(b"blob %d\x00" % iSize)
+            while True:
+                byRead = fFile.read(65536)
+                if byRead == b"":
+                    break
+                oHash.update(byRead)
+        self._bytesRead(iSize)
+        return oHash.hexdigest()
+
+    def _checksum(self, _sFile):
+        """
+        Return the content checksum of the given file, as raw SHA-1 (see 'sha1sum').
+
+        @param  string  _sFile  File (path)
+
+        @return string  Content checksum (hexadecimal)
+        """
+
+        import hashlib
+        self._DEBUG("Computing file checksum; %s" % _sFile)
+        oHash = hashlib.sha1()
+        with open(_sFile, "rb", 65536) as fFile:
+            while True:
+                byRead = fFile.read(65536)
+                if byRead == b"":
+                    break
+                oHash.update(byRead)
+        return oHash.hexdigest()
+
+    def _database(self, _sRepository):
+        """
+        Return the given database (connection), opening it - and creating
+        or upgrading its schema - if needs be.
+
+        @param  string  _sRepository  Sub-repository name (among: 'index' or 'flag')
+
+        @return sqlite3.Connection  Database connection
+        """
+
+        if _sRepository not in self.__doDatabases:
+            sPath = self.__asSubRepositories[_sRepository]
+            llSchema = {"index": GCFG_INDEX_SCHEMA, "flag": GCFG_FLAG_SCHEMA}[_sRepository]
+            self._DEBUG("Opening database; %s" % sPath)
+            try:
+                oDatabase = sqlite3.connect(sPath, timeout=60, check_same_thread=False)
+                iVersion = oDatabase.execute("PRAGMA user_version").fetchone()[0]
+                for iVersion_next in range(iVersion + 1, len(llSchema) + 1):
+                    self._DEBUG("Upgrading database schema; %s: %d -> %d" % (sPath, iVersion_next - 1, iVersion_next))
+                    for sStatement in llSchema[iVersion_next - 1]:
+                        oDatabase.execute(sStatement)
+                    oDatabase.execute("PRAGMA user_version = %d" % iVersion_next)
+                oDatabase.commit()
+            except sqlite3.Error as e:
+                raise EnvironmentError(errno.EIO, "Invalid database; %s" % str(e))
+            self.__doDatabases[_sRepository] = oDatabase
+        return self.__doDatabases[_sRepository]
+
+    def _databaseCommit(self, _oDatabase=None):
+        """
+        Commit pending changes to the given database (or all opened databases),
+        unless a batch session is ongoing (in which case changes are committed
+        once, at the end of the session).
+
+        @param  sqlite3.Connection  _oDatabase  Database connection
+        """
+
+        if self.__bBatchSession:
+            return
+        if _oDatabase is not None:
+            _oDatabase.commit()
+        else:
+            for oDatabase in self.__doDatabases.values():
+                oDatabase.commit()
+
+    def _index(self):
+        """
+        Return the files index (database connection).
+
+        @return sqlite3.Connection  Files index (database connection)
+        """
+
+        return self._database("index")
+
+    def _indexEntry(self, _sFileActual, _sLink=None, _tEntry=None):
+        """
+        Return the files index entry for the given file, based on its GIT sibling.
+        The link type, when not specified, is derived from the actual file (without
+        comparing files content) or the existing entry.
+        The content digest is re-used from the existing entry unless the GIT file
+        stat data (device, inode, size and modification time) changed.
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  tuple   _tEntry       Existing index entry (path, link, dev, ino, size, mtime_ns, digest)
+
+        @return tuple  Index entry (path, link, dev, ino, size, mtime_ns, digest)
+        """
+
+        # Paths
+        sFileGIT = self._getRepositoryPath("git", _sFileActual)
+        oStatGIT = os.stat(sFileGIT)
+
+        # Link type
+        sLink = _sLink
+        if sLink is None:
+            if os.path.islink(_sFileActual):
+                sLink = "symlink"
+            else:
+                try:
+                    oStatActual = os.stat(_sFileActual)
+                    if oStatGIT.st_dev == oStatActual.st_dev and oStatGIT.st_ino == oStatActual.st_ino:
+                        sLink = "hardlink"
+                except OSError:
+                    pass
+            if sLink is None and _tEntry is not None:
+                sLink = _tEntry[1]
+            if sLink is None:
+                sLink = "copy"
+
+        # Digest
+        if _tEntry is not None and _tEntry[6] is not None and _tEntry[2:6] == (oStatGIT.st_dev, oStatGIT.st_ino, oStatGIT.st_size, oStatGIT.st_mtime_ns):
+            sDigest = _tEntry[6]
+        else:
+            sDigest = self._digest(sFileGIT)
+
+        return (_sFileActual, sLink, oStatGIT.st_dev, oStatGIT.st_ino, oStatGIT.st_size, oStatGIT.st_mtime_ns, sDigest)
+
+    def _indexUpdate(self, _sFileActual, _sLink=None):
+        """
+        Update the files index entry for the given file.
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        """
+
+        self._DEBUG("Updating files index; %s" % _sFileActual)
+        self._indexFlush()
+        oIndex = self._index()
+        try:
+            tEntry = oIndex.execute("SELECT path, link, dev, ino, size, mtime_ns, digest FROM files WHERE path = ?", (_sFileActual, )).fetchone()
+            oIndex.execute("INSERT INTO files (path, link, dev, ino, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (path) DO UPDATE SET link = excluded.link, dev = excluded.dev, ino = excluded.ino, size = excluded.size, mtime_ns = excluded.mtime_ns, digest = excluded.digest, checksum = CASE WHEN files.digest = excluded.digest THEN files.checksum ELSE NULL END", self._indexEntry(_sFileActual, _sLink, tEntry))
+            self._databaseCommit(oIndex)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update files index; %s" % str(e))
+
+    def _signature(self, _oStatGIT, _oStatActual):
+        """
+        Return the stat signature of the given GIT and actual files.
+
+        @param  os.stat_result  _oStatGIT     GIT file stat data
+        @param  os.stat_result  _oStatActual  Actual file stat data
+
+        @return string  Stat signature
+        """
+
+        return "/".join(["%d:%d:%d:%d:%d" % (o.st_dev, o.st_ino, o.st_size, o.st_mtime_ns, o.st_ctime_ns) for o in (_oStatGIT, _oStatActual)])
+
+    def _indexSignature(self, _sFileActual, _sSignature=None):
+        """
+        Return (or set) the stat signature of the given file, when last found
+        identical to its GIT sibling.
+        New signatures are kept pending until the files index is flushed.
+        (thread-safe)
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sSignature   Stat signature (to set)
+
+        @return string  Stat signature (None if unknown)
+        """
+
+        with self.__oIndexLock:
+            if _sSignature is not None:
+                self.__dsSignatures[_sFileActual] = _sSignature
+                return _sSignature
+            if _sFileActual in self.__dsSignatures:
+                return self.__dsSignatures[_sFileActual]
+            try:
+                tEntry = self._index().execute("SELECT signature FROM files WHERE path = ?", (_sFileActual, )).fetchone()
+            except sqlite3.Error as e:
+                raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+            if tEntry is None:
+                return None
+            return tEntry[0]
+
+    def _indexLink(self, _sFileActual):
+        """
+        Return the link type of the given file, as recorded in the files index.
+        (thread-safe)
+
+        @param  string  _sFileActual  Actual file (canonical path)
+
+        @return string  Link type (None if unknown)
+        """
+
+        with self.__oIndexLock:
+            try:
+                tEntry = self._index().execute("SELECT link FROM files WHERE path = ?", (_sFileActual, )).fetchone()
+            except sqlite3.Error as e:
+                raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+            if tEntry is None:
+                return None
+            return tEntry[0]
+
+    def _indexDigest(self, _sFileActual, _sFileGIT, _oStatGIT):
+        """
+        Return the content digest of the GIT sibling of the given file, from the
+        files index; the digest is (re-)computed only if the GIT file stat data
+        (device, inode, size and modification time) changed.
+        New digests are kept pending until the files index is flushed.
+        (thread-safe)
+
+        @param  string          _sFileActual  Actual file (canonical path)
+        @param  string          _sFileGIT     File (canonical path) within GIT sub-repository
+        @param  os.stat_result  _oStatGIT     GIT file stat data
+
+        @return string  Content digest (None if the file is not indexed)
+        """
+
+        tStat = (_oStatGIT.st_dev, _oStatGIT.st_ino, _oStatGIT.st_size, _oStatGIT.st_mtime_ns)
+        with self.__oIndexLock:
+            if _sFileActual in self.__dtDigests:
+                tEntry = self.__dtDigests[_sFileActual]
+            else:
+                try:
+                    tEntry = self._index().execute("SELECT dev, ino, size, mtime_ns, digest FROM files WHERE path = ?", (_sFileActual, )).fetchone()
+                except sqlite3.Error as e:
+                    raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+            if tEntry is None:
+                return None
+            if tEntry[4] is not None and tuple(tEntry[0:4]) == tStat:
+                return tEntry[4]
+        iTime_ns = time.time_ns()
+        sDigest = self._digest(_sFileGIT)
+        # ... (do not trust racily-clean files, which might change within the same timestamp granularity)
+        if _oStatGIT.st_ctime_ns < iTime_ns - 2000000000:
+            with self.__oIndexLock:
+                self.__dtDigests[_sFileActual] = tStat + (sDigest, )
+        return sDigest
+
+    def _indexChecksum(self, _sFileActual, _sFileGIT, _oStatGIT):
+        """
+        Return the content checksum of the GIT sibling of the given file, from the
+        files index; the checksum is keyed by the content digest and (re-)computed
+        only if the latter changed (see _indexDigest()).
+        New checksums are kept pending until the files index is flushed.
+        (thread-safe)
+
+        @param  string          _sFileActual  Actual file (canonical path)
+        @param  string          _sFileGIT     File (canonical path) within GIT sub-repository
+        @param  os.stat_result  _oStatGIT     GIT file stat data
+
+        @return string  Content checksum (None if the file is not indexed)
+        """
+
+        sDigest = self._indexDigest(_sFileActual, _sFileGIT, _oStatGIT)
+        if sDigest is None:
+            return None
+        with self.__oIndexLock:
+            if _sFileActual in self.__dtChecksums:
+                tEntry = self.__dtChecksums[_sFileActual]
+            else:
+                try:
+                    tEntry = self._index().execute("SELECT digest, checksum FROM files WHERE path = ?", (_sFileActual, )).fetchone()
+                except sqlite3.Error as e:
+                    raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+            if tEntry is not None and tEntry[1] is not None and tEntry[0] == sDigest:
+                return tEntry[1]
+        sChecksum = self._checksum(_sFileGIT)
+        with self.__oIndexLock:
+            self.__dtChecksums[_sFileActual] = (sDigest, sChecksum)
+        return sChecksum
+
+    def _indexFlush(self):
+        """
+        Write pending stat signatures, content digests and checksums to the files index.
+        """
+
+        with self.__oIndexLock:
+            if not self.__dsSignatures and not self.__dtDigests and not self.__dtChecksums:
+                return
+            self._DEBUG("Flushing files index signatures/digests/checksums; %d/%d/%d entries" % (len(self.__dsSignatures), len(self.__dtDigests), len(self.__dtChecksums)))
+            oIndex = self._index()
+            try:
+                oIndex.executemany("UPDATE files SET dev = ?1, ino = ?2, size = ?3, mtime_ns = ?4, checksum = CASE WHEN digest = ?5 THEN checksum ELSE NULL END, digest = ?5 WHERE path = ?6", [tEntry + (sFileActual, ) for (sFileActual, tEntry) in self.__dtDigests.items()])
+                oIndex.executemany("UPDATE files SET signature = ? WHERE path = ?", [(sSignature, sFileActual) for (sFileActual, sSignature) in self.__dsSignatures.items()])
+                # ... (checksums are only valid along the digest they were computed with)
+                oIndex.executemany("UPDATE files SET checksum = ? WHERE path = ? AND digest = ?", [(sChecksum, sFileActual, sDigest) for (sFileActual, (sDigest, sChecksum)) in self.__dtChecksums.items()])
+                self._databaseCommit(oIndex)
+            except sqlite3.Error as e:
+                raise EnvironmentError(errno.EIO, "Failed to update files index; %s" % str(e))
+            self.__dsSignatures = {}
+            self.__dtDigests = {}
+            self.__dtChecksums = {}
+
+    def _indexRemove(self, _sFileActual):
+        """
+        Remove the files index entry for the given file.
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        """
+
+        self._DEBUG("Removing files index entry; %s" % _sFileActual)
+        self._indexFlush()
+        oIndex = self._index()
+        try:
+            oIndex.execute("DELETE FROM files WHERE path = ?", (_sFileActual, ))
+            self._databaseCommit(oIndex)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update files index; %s" % str(e))
+
+    def _indexChanged(self):
+        """
+        Return the list of files which (may) have changed since last linked or
+        verified, comparing their current stat data with the files index:
+         - GIT file device, inode, size and modification time
+         - 'hardlink': actual file device and inode
+         - 'symlink': actual file link target
+         - 'copy'/'reflink': stat signature (unchanged since last found identical)
+
+        @return list  Files (actual canonical paths)
+        """
+
+        self._indexFlush()
+        try:
+            ltEntries = self._index().execute("SELECT path, link, dev, ino, size, mtime_ns, signature FROM files").fetchall()
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+        lFilesActual = []
+        for (sFileActual, sLink, iDevice, iInode, iSize, iMtime_ns, sSignature) in ltEntries:
+            sFileGIT = self._getRepositoryPath("git", sFileActual)
+            try:
+                oStatGIT = os.stat(sFileGIT)
+                if (oStatGIT.st_dev, oStatGIT.st_ino, oStatGIT.st_size, oStatGIT.st_mtime_ns) == (iDevice, iInode, iSize, iMtime_ns):
+                    if sLink == "symlink":
+                        if os.readlink(sFileActual) == sFileGIT:
+                            continue
+                    else:
+                        oStatActual = os.lstat(sFileActual)
+                        if sLink == "hardlink":
+                            if (oStatActual.st_dev, oStatActual.st_ino) == (iDevice, iInode):
+                                continue
+                        elif not self.__bParanoid and sSignature == self._signature(oStatGIT, oStatActual):
+                            continue
+            except OSError:
+                pass
+            lFilesActual += [sFileActual]
+        self._DEBUG("Changed files; %d/%d" % (len(lFilesActual), len(ltEntries)))
+        return lFilesActual
+
+    def _indexList(self):
+        """
+        Return the list of files in the files index.
+
+        @return list  Files (actual canonical paths)
+        """
+
+        try:
+            return [tEntry[0] for tEntry in self._index().execute("SELECT path FROM files")]
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
 
     def _saveFileOriginal(self, _sFileOriginal, _sFileSource, _bBatch=False, _bForce=False):
         """
@@ -754,6 +2524,41 @@ class GCfgLib:
     # API (commands)
     #
 
+    def _migrateFlags(self, _sDirectory):
+        """
+        Migrate the given (legacy) flags sub-repository - one flags file per tracked
+        file - to the flags store, and remove it once done.
+
+        @param  string  _sDirectory  Flags sub-repository (directory path)
+        """
+
+        # Retrieve flags
+        self._DEBUG("Retrieving (legacy) flags; %s" % _sDirectory)
+        ltFlags = []
+        for (sDirectory, lDirectories, lFiles) in os.walk(_sDirectory):
+            for sFile in lFiles:
+                sFileFlag = os.path.join(sDirectory, sFile)
+                if sFileFlag == os.path.join(_sDirectory, ".placeholder"):
+                    continue
+                sFileActual = os.path.join(os.sep, os.path.relpath(sFileFlag, _sDirectory))
+                with open(sFileFlag, "r") as fFileFlag:
+                    ltFlags += [(sFileActual, sFlag) for sFlag in fFileFlag.read().splitlines() if sFlag]
+
+        # Store flags
+        self._DEBUG("Migrating flags to flags store; %d flag(s)" % len(ltFlags))
+        oDatabase = self._database("flag")
+        try:
+            oDatabase.executemany("INSERT OR IGNORE INTO flags (path, flag) VALUES (?, ?)", ltFlags)
+            oDatabase.commit()
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to migrate flags; %s" % str(e))
+
+        # Remove flags sub-repository
+        import shutil
+        self._DEBUG("Removing (legacy) flags sub-repository; %s" % _sDirectory)
+        shutil.rmtree(_sDirectory)
+        self._INFO("Flags successfully migrated to flags store; %d flag(s)" % len(ltFlags))
+
     def _check(self, _bInitialize=False, _bBatch=False):
         """
         Check/initialize the configuration repository (and various sub-repositories).
@@ -768,12 +2573,13 @@ class GCfgLib:
             "root": sPath,
             "git": os.path.join(sPath, "git"),
             "original": os.path.join(sPath, "original"),
-            "flag": os.path.join(sPath, "flag"),
+            "flag": os.path.join(sPath, "flags.db"),
+            "index": os.path.join(sPath, "index.db"),
             "pkglist": os.path.join(sPath, "pkglist")
         }
 
         # Check sub-directories
-        for sRepository in ("git", "original", "flag"):
+        for sRepository in ("git", "original"):
             sPath = self.__asSubRepositories[sRepository]
             self._DEBUG("Checking sub-repository directory; %s" % sPath)
             if not os.path.exists(sPath):
@@ -781,7 +2587,7 @@ class GCfgLib:
                     self._DEBUG("Creating sub-repository directory; %s" % sPath)
                     os.mkdir(sPath)
                     # ... placeholder (prevent recursive deletion)
-                    if sRepository != "git":
+                    if sRepository == "original":
                         sPlaceholder = os.path.join(sPath, ".placeholder")
                         with open(sPlaceholder, "w"):
                             pass
@@ -807,6 +2613,33 @@ class GCfgLib:
         if not os.access(sPath, os.W_OK | os.X_OK):
             raise EnvironmentError(errno.EACCES, "Cannot write to directory")
 
+        # Files index
+        # (always (re-)created if missing, since it is entirely derived from the GIT sub-repository)
+        sPath = self.__asSubRepositories["index"]
+        self._DEBUG("Checking files index; %s" % sPath)
+        if not os.path.exists(sPath):
+            self._DEBUG("Creating files index; %s" % sPath)
+            self._reindex()
+        if not os.path.isfile(sPath):
+            raise EnvironmentError(errno.ENOENT, "Existing path is not a file")
+        if not os.access(sPath, os.W_OK):
+            raise EnvironmentError(errno.EACCES, "Cannot write to file")
+
+        # Flags store
+        sPath = self.__asSubRepositories["flag"]
+        self._DEBUG("Checking flags store; %s" % sPath)
+        sPath_legacy = os.path.join(self.__asSubRepositories["root"], "flag")
+        if os.path.isdir(sPath_legacy):
+            # ... migrate (legacy) flags sub-repository (one file per tracked file)
+            self._migrateFlags(sPath_legacy)
+        if not os.path.exists(sPath):
+            self._DEBUG("Creating flags store; %s" % sPath)
+            self._database("flag")
+        if not os.path.isfile(sPath):
+            raise EnvironmentError(errno.ENOENT, "Existing path is not a file")
+        if not os.access(sPath, os.W_OK):
+            raise EnvironmentError(errno.EACCES, "Cannot write to file")
+
         # Packages listing
         sPath = self.__asSubRepositories["pkglist"]
         self._DEBUG("Checking packages listing file; %s" % sPath)
@@ -859,14 +2692,35 @@ class GCfgLib:
 
         return True
 
-    def _verify(self, _sFileActual=None, _sLink=None, _bBatch=False, _bForce=False):
+    def _verifyLinked(self, _sFileActual):
         """
-        Verify the given file (or all files if ommitted) are correctly linked.
+        Return whether the given file is correctly linked, without ever modifying it
+        (errors being reported as not linked files, for subsequent processing).
 
         @param  string  _sFileActual  Actual file (canonical path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
-        @param  bool    _bBatch       Batch mode (no confirmation prompts)
-        @param  bool    _bForce       Forced batch mode
+
+        @return bool  Match status
+        """
+
+        try:
+            return self._isLinked(self._getRepositoryPath("git", _sFileActual), _sFileActual)[0]
+        except EnvironmentError:
+            return False
+
+    def _verify(self, _sFileActual=None, _sLink=None, _bBatch=False, _bForce=False, _iJobs=1, _bIncremental=False):
+        """
+        Verify the given file (or all files if ommitted) are correctly linked.
+        When verifying all files using parallel jobs, links are first checked
+        (read-only) in parallel, and only inconsistent files are (serially) fixed.
+        When verifying all files incrementally, only files which changed since
+        last linked or verified (according to the files index) are checked.
+
+        @param  string  _sFileActual   Actual file (canonical path)
+        @param  string  _sLink         Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool    _bBatch        Batch mode (no confirmation prompts)
+        @param  bool    _bForce        Forced batch mode
+        @param  int     _iJobs         Parallel jobs (0 = CPUs count)
+        @param  bool    _bIncremental  Incremental mode
         """
 
         # Verify one particular file
@@ -875,18 +2729,42 @@ class GCfgLib:
 
         # Verify all files
         else:
-            for sFileActual in sorted(self._list()):
+            if _bIncremental:
+                lFilesActual = sorted(self._indexChanged())
+                lFilesChanged = lFilesActual
+            else:
+                lFilesActual = sorted(self._list())
+            if not _iJobs:
+                _iJobs = os.cpu_count() or 1
+            if _iJobs > 1:
+                import concurrent.futures
+                self._DEBUG("Checking files links; %d file(s), %d job(s)" % (len(lFilesActual), _iJobs))
+                with concurrent.futures.ThreadPoolExecutor(_iJobs) as oExecutor:
+                    lbLinked = list(oExecutor.map(self._verifyLinked, lFilesActual))
+                lFilesActual = [sFileActual for (sFileActual, bLinked) in zip(lFilesActual, lbLinked) if not bLinked]
+                self._DEBUG("=> %d inconsistent file(s)" % len(lFilesActual))
+            for sFileActual in lFilesActual:
                 self.link(sFileActual, None, _bBatch, _bForce)
+            # ... refresh the files index for changed (now verified) files
+            if _bIncremental:
+                for sFileActual in lFilesChanged:
+                    if os.path.exists(self._getRepositoryPath("git", sFileActual)):
+                        self._indexUpdate(sFileActual)
+
+        # Files index
+        self._indexFlush()
 
-    def verify(self, _sFileActual=None, _sLink=None, _bBatch=False, _bForce=False):
+    def verify(self, _sFileActual=None, _sLink=None, _bBatch=False, _bForce=False, _iJobs=1, _bIncremental=False):
         """
         Verify the given file (or all files if ommitted) are correctly linked.
         (including validation, informational messages and exceptions handling)
 
-        @param  string  _sFileActual  Actual file (path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
-        @param  bool    _bBatch       Batch mode (no confirmation prompts)
-        @param  bool    _bForce       Forced batch mode
+        @param  string  _sFileActual   Actual file (path)
+        @param  string  _sLink         Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool    _bBatch        Batch mode (no confirmation prompts)
+        @param  bool    _bForce        Forced batch mode
+        @param  int     _iJobs         Parallel jobs (0 = CPUs count), when verifying all files
+        @param  bool    _bIncremental  Incremental mode (only files changed since last verified), when verifying all files
         """
 
         if _bForce:
@@ -905,89 +2783,455 @@ class GCfgLib:
                 raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
 
             # Verify
-            self._verify(sFileActual, _sLink, _bBatch, _bForce)
+            self._verify(sFileActual, _sLink, _bBatch, _bForce, _iJobs, _bIncremental)
 
         except EnvironmentError as e:
             self._ERROR("%s; %s" % (e.strerror, _sFileActual))
             raise EnvironmentError(e.errno, "Failed to verify configuration repository consistency")
 
-    def _list(self, _sFlag=None):
+    def _verifyStatus(self, _tEntry):
         """
-        Return the list of files in the configuration repository,
+        Return the link status of the given files index entry, without ever modifying
+        the file, among:
+         - 'ok': correctly linked
+         - 'broken-hardlink', 'broken-symlink': link broken (or replaced); unlike
+           '_isLinked', this includes files whose content is still identical
+           (e.g. hardlink broken by an editor)
+         - 'copy-differs': 'copy'/'reflink'-linked file differs from its GIT sibling
+         - 'missing-actual', 'missing-git': actual or GIT file is missing
+         - 'error': file could not be checked (e.g. permission denied)
+        (thread-safe)
+
+        @param  tuple  _tEntry  Files index entry (path, link)
+
+        @return tuple  (file, link type, status)
+        """
+
+        (sFileActual, sLink) = _tEntry
+        sFileGIT = self._getRepositoryPath("git", sFileActual)
+        try:
+            if not os.path.exists(sFileGIT):
+                return (sFileActual, sLink, "missing-git")
+            if not os.path.lexists(sFileActual):
+                return (sFileActual, sLink, "missing-actual")
+            (bLinked, sLink_actual) = self._isLinked(sFileGIT, sFileActual)
+        except EnvironmentError as e:
+            self._DEBUG("=> %s; %s" % (e.strerror, sFileActual))
+            return (sFileActual, sLink, "error")
+        if sLink is None:
+            sLink = sLink_actual
+        if bLinked and sLink_actual == sLink:
+            return (sFileActual, sLink, "ok")
+        if sLink in ("hardlink", "symlink"):
+            return (sFileActual, sLink, "broken-%s" % sLink)
+        return (sFileActual, sLink, "copy-differs")
+
+    def _verifyCheck(self, _sFileActual=None, _iJobs=1):
+        """
+        Check the given file (or all files if ommitted) are correctly linked, in a
+        read-only (and never interactive) way; only the files index signatures/digests
+        cache is updated, such as for subsequent checks to rely on the same fast paths
+        (stat signatures, content digests) as 'verify'.
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  int     _iJobs        Parallel jobs (0 = CPUs count)
+
+        @return list  (file, link type, status) tuples (sorted by path; see '_verifyStatus')
+        """
+
+        # Files (and link type)
+        self._indexFlush()
+        try:
+            if _sFileActual is not None:
+                ltEntries = self._index().execute("SELECT path, link FROM files WHERE path = ?", (_sFileActual, )).fetchall()
+                if not ltEntries:
+                    ltEntries = [(_sFileActual, None)]
+            else:
+                ltEntries = self._index().execute("SELECT path, link FROM files ORDER BY path").fetchall()
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+
+        # Check
+        if not _iJobs:
+            _iJobs = os.cpu_count() or 1
+        self._DEBUG("Checking files links; %d file(s), %d job(s)" % (len(ltEntries), _iJobs))
+        if _iJobs > 1 and len(ltEntries) > 1:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(_iJobs) as oExecutor:
+                ltStatuses = list(oExecutor.map(self._verifyStatus, ltEntries))
+        else:
+            ltStatuses = [self._verifyStatus(tEntry) for tEntry in ltEntries]
+
+        # Files index
+        self._indexFlush()
+
+        return ltStatuses
+
+    def _metrics(self, _ltStatuses, _fDuration, _iBytesRead):
+        """
+        Return the configuration repository metrics, in the Prometheus text exposition
+        format (as expected by the node_exporter textfile collector):
+         - gcfg_files_tracked{link}: tracked files, by link type
+         - gcfg_files_drifted{link}: not correctly linked files, by link type
+         - gcfg_files_uncommitted: files with uncommitted GIT changes
+         - gcfg_files_flagged{flag}: flagged files, by flag
+         - gcfg_files_edited: @EDITED files
+         - gcfg_verify_duration_seconds, gcfg_verify_read_bytes, gcfg_verify_timestamp_seconds:
+           check duration, bytes read (files content) and (completion) timestamp
+
+        @param  list   _ltStatuses  (file, link type, status) tuples (see '_verifyCheck')
+        @param  float  _fDuration   Check duration (seconds)
+        @param  int    _iBytesRead  Bytes read
+
+        @return string  Metrics
+        """
+
+        def _label(_sValue):
+            return _sValue.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+        # Links
+        diTracked = dict.fromkeys(["hardlink", "symlink", "copy", "reflink"], 0)
+        diDrifted = dict(diTracked)
+        for (_, sLink, sStatus) in _ltStatuses:
+            sLink = sLink or "copy"
+            diTracked[sLink] = diTracked.get(sLink, 0) + 1
+            if sStatus != "ok":
+                diDrifted[sLink] = diDrifted.get(sLink, 0) + 1
+
+        # GIT status
+        iUncommitted = 0
+        for (_, sStatus) in self._getGitBackend().status():
+            if sStatus != "!!":
+                iUncommitted += 1
+
+        # Flags
+        try:
+            diFlagged = dict(self._database("flag").execute("SELECT flag, COUNT(*) FROM flags GROUP BY flag ORDER BY flag").fetchall())
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read flags store; %s" % str(e))
+
+        # Metrics
+        lMetrics = [
+            "# HELP gcfg_files_tracked Tracked files, by link type",
+            "# TYPE gcfg_files_tracked gauge",
+        ]
+        lMetrics += ["gcfg_files_tracked{link=\"%s\"} %d" % (_label(sLink), iCount) for (sLink, iCount) in sorted(diTracked.items())]
+        lMetrics += [
+            "# HELP gcfg_files_drifted Not correctly linked (drifted or broken) files, by link type",
+            "# TYPE gcfg_files_drifted gauge",
+        ]
+        lMetrics += ["gcfg_files_drifted{link=\"%s\"} %d" % (_label(sLink), iCount) for (sLink, iCount) in sorted(diDrifted.items())]
+        lMetrics += [
+            "# HELP gcfg_files_uncommitted Files with uncommitted GIT changes",
+            "# TYPE gcfg_files_uncommitted gauge",
+            "gcfg_files_uncommitted %d" % iUncommitted,
+            "# HELP gcfg_files_flagged Flagged files, by flag",
+            "# TYPE gcfg_files_flagged gauge",
+        ]
+        lMetrics += ["gcfg_files_flagged{flag=\"%s\"} %d" % (_label(sFlag), iCount) for (sFlag, iCount) in diFlagged.items()]
+        lMetrics += [
+            "# HELP gcfg_files_edited Files flagged as @EDITED",
+            "# TYPE gcfg_files_edited gauge",
+            "gcfg_files_edited %d" % diFlagged.get("@EDITED", 0),
+            "# HELP gcfg_verify_duration_seconds Duration of the last check",
+            "# TYPE gcfg_verify_duration_seconds gauge",
+            "gcfg_verify_duration_seconds %.6f" % _fDuration,
+            "# HELP gcfg_verify_read_bytes Bytes read (files content) by the last check",
+            "# TYPE gcfg_verify_read_bytes gauge",
+            "gcfg_verify_read_bytes %d" % _iBytesRead,
+            "# HELP gcfg_verify_timestamp_seconds Completion time of the last check",
+            "# TYPE gcfg_verify_timestamp_seconds gauge",
+            "gcfg_verify_timestamp_seconds %.3f" % time.time(),
+        ]
+        return "\n".join(lMetrics) + "\n"
+
+    def verifyCheck(self, _sFileActual=None, _iJobs=1, _sFileMetrics=None):
+        """
+        Check the given file (or all files if ommitted) are correctly linked, in a
+        read-only (and never interactive) way, optionally writing the configuration
+        repository metrics to the given file (atomically; see '_metrics').
+        (including validation, debug messages and exceptions handling)
+
+        @param  string  _sFileActual   Actual file (path)
+        @param  int     _iJobs         Parallel jobs (0 = CPUs count)
+        @param  string  _sFileMetrics  Metrics file (path; e.g. node_exporter textfile collector '*.prom' file)
+
+        @return list  (file, link type, status) tuples (sorted by path; see '_verifyStatus')
+        """
+
+        try:
+
+            # Paths
+            sFileActual = None
+            if _sFileActual is not None:
+                sFileActual = self.getCanonicalPath(_sFileActual)
+                sFileGIT = self._getRepositoryPath("git", sFileActual)
+
+            # Check
+            if _sFileActual is not None and not os.path.exists(sFileGIT) and self._indexLink(sFileActual) is None:
+                raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
+
+            # Verify
+            fStart = time.monotonic()
+            iBytesRead = self._bytesRead()
+            ltStatuses = self._verifyCheck(sFileActual, _iJobs)
+            for (sFile, _, sStatus) in ltStatuses:
+                if sStatus != "ok":
+                    self._DEBUG("File is not correctly linked (%s); %s" % (sStatus, sFile))
+
+            # Metrics
+            if _sFileMetrics is not None:
+                self._write(
+                    os.path.abspath(_sFileMetrics),
+                    self._metrics(ltStatuses, time.monotonic() - fStart, self._bytesRead() - iBytesRead)
+                )
+
+        except EnvironmentError as e:
+            self._ERROR("%s; %s" % (e.strerror, _sFileActual))
+            raise EnvironmentError(e.errno, "Failed to check configuration repository consistency")
+
+        return ltStatuses
+
+    def _watchCheck(self, _sFileActual, _sFlag=None, _bForce=False):
+        """
+        Check the given (watched) file is correctly linked, relinking it if its
+        content did not change (e.g. hardlink broken by an editor replacing the
+        file) or - if forced - using its new content; otherwise, the file is
+        flagged with the given flag (for later review) or merely reported.
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sFlag        Flag for files needing review (None = report only)
+        @param  bool    _bForce       Relink changed files (using their new content)
+        """
+
+        # Check
+        sFileGIT = self._getRepositoryPath("git", _sFileActual)
+        if not os.path.isfile(sFileGIT):
+            return
+        sLink_index = self._indexLink(_sFileActual)
+        (bLinked, sLink_actual) = self._isLinked(sFileGIT, _sFileActual)
+        if bLinked and (sLink_index is None or sLink_actual == sLink_index):
+            return
+
+        # Relink
+        if bLinked:
+            self._WARNING("File link broken (content unchanged); %s (%s => %s)" % (_sFileActual, sLink_index, sLink_actual))
+            self.link(_sFileActual, sLink_index, True, True)
+            return
+        sChange = "changed" if os.path.lexists(_sFileActual) else "missing"
+        if _bForce:
+            self._WARNING("File %s; %s" % (sChange, _sFileActual))
+            self.link(_sFileActual, sLink_index, True, True)
+        elif _sFlag is not None:
+            self._WARNING("File %s (flagged for review); %s (%s)" % (sChange, _sFileActual, _sFlag))
+            self._flag(_sFileActual, _sFlag)
+        else:
+            self._WARNING("File %s; %s" % (sChange, _sFileActual))
+
+    def _watch(self, _sFlag=None, _bForce=False, _fDelay=0.1):
+        """
+        Watch (inotify) the directories of all files in the configuration repository
+        - both actual and GIT sides - and check changed files as soon as they are
+        (re-)written, replaced, moved or deleted; files are checked once no further
+        events have been received for the given delay (such as to let editors finish
+        writing them).
+        This method never returns (unless interrupted).
+
+        @param  string  _sFlag   Flag for files needing review (None = report only)
+        @param  bool    _bForce  Relink changed files (using their new content)
+        @param  float   _fDelay  Events settling delay (seconds)
+        """
+
+        # Inotify
+        oInotify = GCfgInotify()
+        iMask = GCfgInotify.IN_CLOSE_WRITE | GCfgInotify.IN_MOVED_TO | GCfgInotify.IN_MOVED_FROM | GCfgInotify.IN_CREATE | GCfgInotify.IN_DELETE
+        dsDirectories = {}
+        sRepositoryGIT = self.__asSubRepositories["git"]
+
+        def watchDirectory(_sDirectory):
+            try:
+                dsDirectories[oInotify.add(_sDirectory, iMask)] = _sDirectory
+            except EnvironmentError as e:
+                self._WARNING("%s; %s" % (e.strerror, _sDirectory))
+
+        def watchRepositoryGIT(_sDirectory):
+            for (sDirectory, lDirectories, _) in os.walk(_sDirectory):
+                if sDirectory == sRepositoryGIT and ".git" in lDirectories:
+                    lDirectories.remove(".git")
+                watchDirectory(sDirectory)
+
+        # Watch directories
+        lFilesActual = self._indexList()
+        for sDirectory in sorted(set(self._dirpath(sFileActual) for sFileActual in lFilesActual)):
+            if os.path.isdir(sDirectory):
+                watchDirectory(sDirectory)
+        watchRepositoryGIT(sRepositoryGIT)
+        self._INFO("Watching configuration repository; %d file(s), %d directories" % (len(lFilesActual), len(dsDirectories)))
+
+        # Events loop
+        try:
+            setFilesActual = set()
+            while True:
+                ltEvents = oInotify.read(_fDelay if setFilesActual else None)
+
+                # ... check changed files (once events settled)
+                if not ltEvents:
+                    for sFileActual in sorted(setFilesActual):
+                        try:
+                            self._watchCheck(sFileActual, _sFlag, _bForce)
+                        except EnvironmentError as e:
+                            self._ERROR("%s; %s" % (e.strerror, sFileActual))
+                    self._indexFlush()
+                    setFilesActual = set()
+                    continue
+
+                # ... collect changed files
+                for (iWatch, iEvents, sName) in ltEvents:
+                    if iEvents & GCfgInotify.IN_Q_OVERFLOW:
+                        self._WARNING("Events queue overflow; checking all files")
+                        setFilesActual.update(self._indexList())
+                        continue
+                    if iEvents & GCfgInotify.IN_IGNORED:
+                        dsDirectories.pop(iWatch, None)
+                        continue
+                    sDirectory = dsDirectories.get(iWatch)
+                    if sDirectory is None or not sName:
+                        continue
+                    sPath = os.path.join(sDirectory, sName)
+                    if sDirectory == sRepositoryGIT or sDirectory.startswith(sRepositoryGIT + os.sep):
+                        if iEvents & GCfgInotify.IN_ISDIR:
+                            if iEvents & (GCfgInotify.IN_CREATE | GCfgInotify.IN_MOVED_TO) and sName != ".git":
+                                watchRepositoryGIT(sPath)
+                            continue
+                        sFileActual = os.path.join(os.sep, os.path.relpath(sPath, sRepositoryGIT))
+                        # ... (newly added file)
+                        sDirectoryActual = self._dirpath(sFileActual)
+                        if sDirectoryActual not in dsDirectories.values() and os.path.isdir(sDirectoryActual):
+                            watchDirectory(sDirectoryActual)
+                    elif iEvents & GCfgInotify.IN_ISDIR:
+                        continue
+                    else:
+                        sFileActual = sPath
+                    setFilesActual.add(sFileActual)
+
+        finally:
+            oInotify.close()
+
+    def watch(self, _sFlag=None, _bForce=False):
+        """
+        Watch the configuration repository and check changed files in real-time.
+        (including validation, informational messages and exceptions handling)
+
+        @param  string  _sFlag   Flag for files needing review (None = report only)
+        @param  bool    _bForce  Relink changed files (using their new content)
+        """
+
+        try:
+
+            # Check flag
+            if _sFlag is not None and any((c not in "_-abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ01234567890") for c in _sFlag):
+                raise EnvironmentError(errno.EINVAL, "Invalid flag")
+
+            # Watch
+            self._watch(_sFlag, _bForce)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to watch configuration repository")
+
+    def _iterList(self, _sFlag=None):
+        """
+        Yield the files in the configuration repository (sorted by path),
         along all flags (flag=@FLAGS) or matching any given flag.
+        Files are streamed from the files index (or flags store), only the
+        GIT status of changed files being held in memory (flag=@FLAGS or @GIT:XY).
 
         @param  string   _sFlag  File flag to match (or @FLAGS to display all flags)
 
-        @return dict|list  Dictionnary associating files to their corresponding (list of) flags
+        @return generator  (file, list of flags - or None) tuples
         """
 
-        # Handle flags
-        dlFiles = None
-        dlFiles_flags = None
+        # Retrieve files GIT status
         dsFiles_git = None
-        if _sFlag is not None:
-            if _sFlag == "@FLAGS" or _sFlag[:5] == "@GIT:":
-                # Retrieve files GIT status
-                self._DEBUG("Retrieving files GIT status")
-                sFiles_git = self._shellCommand(["git", "status", "--porcelain"], self.__asSubRepositories["git"])
-                # ... flags
-                dsFiles_git = {}
-                for sGIT in sFiles_git.splitlines():
-                    sFileActual = "/%s" % sGIT[3:]
-                    dsFiles_git[sFileActual] = "@GIT:%s" % sGIT[:2].replace(" ", "_")
-
-            if _sFlag[:5] == "@GIT:":
-                # Match GIT flags
-                self._DEBUG("Matching files GIT status; %s" % _sFlag)
-                lFiles = self._shellCommand(["find", ".", "-type", "f", "-not", "-path", "./.git/*"], self.__asSubRepositories["git"]).splitlines()
-                lFiles = [s.lstrip(".") for s in lFiles]
-                dlFiles = {}
-                for sFileActual in lFiles:
-                    if sFileActual in dsFiles_git:
-                        if _sFlag == dsFiles_git[sFileActual]:
-                            dlFiles[sFileActual] = None
-                    else:
-                        if _sFlag == "@GIT:__":
-                            dlFiles[sFileActual] = None
+        if _sFlag is not None and (_sFlag == "@FLAGS" or _sFlag[:5] == "@GIT:"):
+            self._DEBUG("Retrieving files GIT status")
+            dsFiles_git = {}
+            for (sGIT, sStatus) in self._getGitBackend().status():
+                dsFiles_git["/%s" % sGIT] = "@GIT:%s" % sStatus.replace(" ", "_")
 
-            elif _sFlag == "@FLAGS":
-                # Retrieve files flags
-                sRepositoryFlag = self.__asSubRepositories["flag"]
-                self._DEBUG("Retrieving files flags")
-                lFiles = self._shellCommand(["find", ".", "-type", "f", "-not", "-name", ".placeholder"], sRepositoryFlag).splitlines()
-                # ... flags
-                dlFiles_flags = {}
-                for sFileFlag in lFiles:
-                    sFileActual = sFileFlag.lstrip(".")
-                    with open(os.path.join(sRepositoryFlag, sFileFlag), "r") as fFileFlag:
-                        dlFiles_flags[sFileActual] = sorted(fFileFlag.read().splitlines())
-            else:
-                # Find all files matching flag
+        try:
+
+            # Find all files matching flag
+            if _sFlag is not None and _sFlag != "@FLAGS" and _sFlag[:5] != "@GIT:":
                 self._DEBUG("Matching files flags; %s" % _sFlag)
-                lFiles = self._shellCommand(["find", ".", "-type", "f", "-not", "-name", ".placeholder", "-exec", "grep", "-q", "^%s$" % _sFlag, "{}", ";", "-print"], self.__asSubRepositories["flag"]).splitlines()
-                dlFiles = dict.fromkeys([s.lstrip(".") for s in lFiles])
+                for tFlag in self._database("flag").execute("SELECT path FROM flags WHERE flag = ? ORDER BY path", (_sFlag, )):
+                    yield (tFlag[0], None)
+                return
 
-        # List
-        if dlFiles is None:
             # Retrieve list of all GIT files
             self._DEBUG("Retrieving GIT files list")
-            lFiles = self._shellCommand(["find", ".", "-type", "f", "-not", "-path", "./.git/*"], self.__asSubRepositories["git"]).splitlines()
-            dlFiles = dict.fromkeys([s.lstrip(".") for s in lFiles])
-
-        # Add flags
-        if _sFlag == "@FLAGS":
-            self._DEBUG("Adding flags")
-            for sFileActual in dlFiles:
-                dlFiles[sFileActual] = []
-                if sFileActual in dlFiles_flags:
-                    dlFiles[sFileActual] += dlFiles_flags[sFileActual]
-                if sFileActual in dsFiles_git:
-                    dlFiles[sFileActual] += [dsFiles_git[sFileActual]]
-                else:
-                    dlFiles[sFileActual] += ["@GIT:__"]
+            oFiles = self._index().execute("SELECT path FROM files ORDER BY path")
 
-        # Done
-        return dlFiles
+            # Match GIT flags
+            if _sFlag is not None and _sFlag[:5] == "@GIT:":
+                self._DEBUG("Matching files GIT status; %s" % _sFlag)
+                for (sFileActual, ) in oFiles:
+                    if dsFiles_git.get(sFileActual, "@GIT:__") == _sFlag:
+                        yield (sFileActual, None)
+
+            # Add flags (merging the - identically sorted - files and flags)
+            elif _sFlag == "@FLAGS":
+                self._DEBUG("Adding flags")
+                oFlags = self._database("flag").execute("SELECT path, flag FROM flags ORDER BY path, flag")
+                tFlag = oFlags.fetchone()
+                for (sFileActual, ) in oFiles:
+                    lFlags = []
+                    while tFlag is not None and tFlag[0] <= sFileActual:
+                        if tFlag[0] == sFileActual:
+                            lFlags += [tFlag[1]]
+                        tFlag = oFlags.fetchone()
+                    lFlags += [dsFiles_git.get(sFileActual, "@GIT:__")]
+                    yield (sFileActual, lFlags)
+
+            # List
+            else:
+                for (sFileActual, ) in oFiles:
+                    yield (sFileActual, None)
+
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read files index or flags store; %s" % str(e))
+
+    def iterList(self, _sFlag=None):
+        """
+        Yield the files in the configuration repository (sorted by path),
+        along all flags (flag=@FLAGS) or matching any given flag.
+        (including exceptions handling)
+
+        @param  string   _sFlag  File flag to match (or @FLAGS to display all flags)
+
+        @return generator  (file, list of flags - or None) tuples
+        """
+
+        try:
+
+            # List files
+            yield from self._iterList(_sFlag)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to list files in the configuration repository")
+
+    def _list(self, _sFlag=None):
+        """
+        Return the list of files in the configuration repository,
+        along all flags (flag=@FLAGS) or matching any given flag.
+
+        @param  string   _sFlag  File flag to match (or @FLAGS to display all flags)
+
+        @return dict|list  Dictionnary associating files to their corresponding (list of) flags
+        """
+
+        return dict(self._iterList(_sFlag))
 
     def list(self, _sFlag=None):
         """
@@ -1009,6 +3253,67 @@ class GCfgLib:
             self._ERROR(e.strerror)
             raise EnvironmentError(e.errno, "Failed to list files in the configuration repository")
 
+    def _reindex(self):
+        """
+        Rebuild the files index from the GIT sub-repository.
+        Content digests are re-used for files whose stat data did not change.
+
+        @return tuple(int,int)  Count of indexed and removed entries
+        """
+
+        # Existing entries
+        oIndex = self._index()
+        try:
+            dtEntries = {}
+            for tEntry in oIndex.execute("SELECT path, link, dev, ino, size, mtime_ns, digest FROM files"):
+                dtEntries[tEntry[0]] = tEntry
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read files index; %s" % str(e))
+
+        # Walk the GIT sub-repository
+        sRepositoryGIT = self.__asSubRepositories["git"]
+        self._DEBUG("Walking GIT sub-repository; %s" % sRepositoryGIT)
+        ltEntries = []
+        for (sDirectory, lDirectories, lFiles) in os.walk(sRepositoryGIT):
+            if sDirectory == sRepositoryGIT and ".git" in lDirectories:
+                lDirectories.remove(".git")
+            for sFile in lFiles:
+                if not os.path.isfile(os.path.join(sDirectory, sFile)):
+                    continue
+                sFileActual = os.path.join(os.sep, os.path.relpath(os.path.join(sDirectory, sFile), sRepositoryGIT))
+                ltEntries += [self._indexEntry(sFileActual, None, dtEntries.pop(sFileActual, None))]
+
+        # Update index
+        self._DEBUG("Rebuilding files index; %d entries (%d removed)" % (len(ltEntries), len(dtEntries)))
+        try:
+            oIndex.executemany("INSERT INTO files (path, link, dev, ino, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (path) DO UPDATE SET link = excluded.link, dev = excluded.dev, ino = excluded.ino, size = excluded.size, mtime_ns = excluded.mtime_ns, digest = excluded.digest, checksum = CASE WHEN files.digest = excluded.digest THEN files.checksum ELSE NULL END", ltEntries)
+            oIndex.executemany("DELETE FROM files WHERE path = ?", [(s, ) for s in dtEntries])
+            self._databaseCommit(oIndex)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update files index; %s" % str(e))
+
+        # Done
+        return (len(ltEntries), len(dtEntries))
+
+    def reindex(self):
+        """
+        Rebuild the files index from the GIT sub-repository.
+        (including informational messages and exceptions handling)
+
+        @return tuple(int,int)  Count of indexed and removed entries
+        """
+
+        try:
+
+            # Rebuild index
+            (iIndexed, iRemoved) = self._reindex()
+            self._INFO("Files index successfully rebuilt; %d file(s) indexed (%d stale removed)" % (iIndexed, iRemoved))
+            return (iIndexed, iRemoved)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to rebuild the files index")
+
     def _add(self, _sFileActual, _sFileOriginal=None, _sLink=None, _bBatch=False, _bForce=False):
         """
         Add the given file to the configuration respository.
@@ -1017,7 +3322,7 @@ class GCfgLib:
 
         @param  string  _sFileActual    Actual file (canonical path)
         @param  string  _sFileOriginal  Original file (path)
-        @param  string  _sLink          Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink          Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch         Batch mode (no confirmation prompts)
         @param  bool    _bForce         Forced batch mode
 
@@ -1043,7 +3348,7 @@ class GCfgLib:
 
         @param  string       _sFileActual     Actual file (path)
         @param  string|bool  _sbFileOriginal  Original file (path); or, if True, use the actual file as original (or don't if False)
-        @param  string       _sLink           Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string       _sLink           Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool         _bBatch          Batch mode (no confirmation prompts)
         @param  bool         _bForce          Forced batch mode
 
@@ -1111,7 +3416,7 @@ class GCfgLib:
 
         @param  string  _sFileActual  Actual file (canonical path)
         @param  string  _sFileSource  Source file (path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch       Batch mode (no confirmation prompts)
         @param  bool    _bForce       Forced batch mode
 
@@ -1153,7 +3458,7 @@ class GCfgLib:
 
         @param  string  _sFileActual  Actual file (path)
         @param  string  _sFileSource  Source file (path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch       Batch mode (no confirmation prompts)
         @param  bool    _bForce       Forced batch mode
 
@@ -1196,7 +3501,7 @@ class GCfgLib:
 
         @param  string  _sFileActual       Actual file (canonical path)
         @param  string  _sFileDestination  Destination file (canonical path)
-        @param  string  _sLink             Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink             Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch            Batch mode (no confirmation prompts)
         @param  bool    _bForce            Forced batch mode
 
@@ -1207,11 +3512,9 @@ class GCfgLib:
         # ...source
         sFileGIT_src = self._getRepositoryPath("git", _sFileActual)
         sFileOriginal_src = self._getRepositoryPath("original", _sFileActual)
-        sFileFlag_src = self._getRepositoryPath("flag", _sFileActual)
         # ...destination
         #sFileGIT_dst = self._getRepositoryPath("git", _sFileDestination)
         sFileOriginal_dst = self._getRepositoryPath("original", _sFileDestination)
-        sFileFlag_dst = self._getRepositoryPath("flag", _sFileDestination)
 
         # Link
         (bLinked, sLink) = self._isLinked(sFileGIT_src, _sFileActual)
@@ -1223,11 +3526,10 @@ class GCfgLib:
         if not self.copy(_sFileDestination, _sFileActual, _sLink, _bBatch, _bForce):
             return False
 
-        # Copy flags file
-        if os.path.exists(sFileFlag_src):
-            self._DEBUG("Copying flags file; %s -> %s" % (sFileFlag_src, sFileFlag_dst))
-            self.mkdir(self._dirpath(sFileFlag_dst))
-            self._cp(sFileFlag_src, sFileFlag_dst)
+        # Copy flags
+        for sFlag in self._flagged(_sFileActual):
+            self._DEBUG("Copying flag; %s -> %s (%s)" % (_sFileActual, _sFileDestination, sFlag))
+            self._flag(_sFileDestination, sFlag)
 
         # Source original file
         if os.path.exists(sFileOriginal_src):
@@ -1254,7 +3556,7 @@ class GCfgLib:
 
         @param  string  _sFileActual       Actual file (path)
         @param  string  _sFileDestination  Destination file (path)
-        @param  string  _sLink             Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink             Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
         @param  bool    _bBatch            Batch mode (no confirmation prompts)
         @param  bool    _bForce            Forced batch mode
 
@@ -1305,19 +3607,22 @@ class GCfgLib:
         # Paths
         sFileGIT = self._getRepositoryPath("git", _sFileActual)
         sFileOriginal = self._getRepositoryPath("original", _sFileActual)
-        sFileFlag = self._getRepositoryPath("flag", _sFileActual)
 
         # Remove GIT file
         self._DEBUG("Removing GIT file and parent directory; %s" % sFileGIT)
         if os.path.exists(sFileGIT):
             self._rm(sFileGIT)
         self.rmdir(os.path.dirname(sFileGIT))
+        self._indexRemove(_sFileActual)
 
         # Remove file flags
-        self._DEBUG("Removing flags file and parent directory; %s" % sFileFlag)
-        if os.path.exists(sFileFlag):
-            self._rm(sFileFlag)
-        self.rmdir(os.path.dirname(sFileFlag))
+        self._DEBUG("Removing file flags; %s" % _sFileActual)
+        try:
+            oDatabase = self._database("flag")
+            oDatabase.execute("DELETE FROM flags WHERE path = ?", (_sFileActual, ))
+            self._databaseCommit(oDatabase)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update flags store; %s" % str(e))
 
         # Remove actual file
         self._DEBUG("Removing file; %s" % _sFileActual)
@@ -1405,7 +3710,7 @@ class GCfgLib:
         The file will be flagged as '@EDITED' if modified.
 
         @param  string  _sFileActual  Actual file (canonical path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
 
         @return bool  True if the file was actually edited
         """
@@ -1419,6 +3724,7 @@ class GCfgLib:
         # Edited ?
         if oStat_before.st_mtime != oStat_after.st_mtime:
             self._flag(_sFileActual, "@EDITED")
+            self._indexUpdate(_sFileActual)
             return True
         return False
 
@@ -1429,7 +3735,7 @@ class GCfgLib:
         (including validation, informational messages and exceptions handling)
 
         @param  string  _sFileActual  Actual file (path)
-        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy' or None)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
 
         @return bool  True if the file was actually removed
         """
@@ -1525,26 +3831,14 @@ class GCfgLib:
         @param  string   _sFlag        File flag
         """
 
-        # Paths
-        sFileFlag = self._getRepositoryPath("flag", _sFileActual)
-
-        # Check
-        if not os.path.exists(sFileFlag):
-            sDirFlag = self._dirpath(sFileFlag)
-            if not os.path.exists(sDirFlag):
-                self._mkdir(sDirFlag)
-
         # Flag
-        lFlags = []
-        if os.path.exists(sFileFlag):
-            self._DEBUG("Reading flag file; %s" % sFileFlag)
-            with open(sFileFlag, "r") as fFileFlag:
-                lFlags = fFileFlag.read().splitlines()
-        lFlags += [_sFlag]
-        lFlags = sorted(set(lFlags))
-        self._DEBUG("Writing flag file; %s" % sFileFlag)
-        with open(sFileFlag, "w") as fFileFlag:
-            fFileFlag.write("\n".join(lFlags))
+        self._DEBUG("Adding flag; %s (%s)" % (_sFileActual, _sFlag))
+        try:
+            oDatabase = self._database("flag")
+            oDatabase.execute("INSERT OR IGNORE INTO flags (path, flag) VALUES (?, ?)", (_sFileActual, _sFlag))
+            self._databaseCommit(oDatabase)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update flags store; %s" % str(e))
 
     def flag(self, _sFileActual, _sFlag, _bForce=False):
         """
@@ -1585,30 +3879,14 @@ class GCfgLib:
         @param  string   _sFlag        File flag
         """
 
-        # Paths
-        sFileFlag = self._getRepositoryPath("flag", _sFileActual)
-
-        # Check
-        if not os.path.exists(sFileFlag):
-            return
-
         # Flag
-        self._DEBUG("Reading flags file; %s" % sFileFlag)
-        with open(sFileFlag, "r") as fFileFlag:
-            lFlags = fFileFlag.read().splitlines()
-        lFlags = sorted(set(lFlags))
+        self._DEBUG("Removing flag; %s (%s)" % (_sFileActual, _sFlag))
         try:
-            lFlags.remove(_sFlag)
-        except ValueError:
-            pass
-        if lFlags:
-            self._DEBUG("Writing flags file; %s" % sFileFlag)
-            with open(sFileFlag, "w") as fFileFlag:
-                fFileFlag.write("\n".join(lFlags))
-        else:
-            self._DEBUG("Removing empty flags file; %s" % sFileFlag)
-            self._rm(sFileFlag)
-            self._rmdir(os.path.dirname(sFileFlag))
+            oDatabase = self._database("flag")
+            oDatabase.execute("DELETE FROM flags WHERE path = ? AND flag = ?", (_sFileActual, _sFlag))
+            self._databaseCommit(oDatabase)
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to update flags store; %s" % str(e))
 
     def unflag(self, _sFileActual, _sFlag):
         """
@@ -1647,24 +3925,15 @@ class GCfgLib:
         @return bool|list  True if flag matches, False otherwise or flags list if no flag is given
         """
 
-        # Paths
-        sFileFlag = self._getRepositoryPath("flag", _sFileActual)
-
-        # Check
-        if not os.path.exists(sFileFlag):
-            if _sFlag is not None:
-                return False
-            return []
-
         # Flag
-        self._DEBUG("Reading flag file; %s" % sFileFlag)
-        with open(sFileFlag, "r") as fFileFlag:
-            lFlags = fFileFlag.read().splitlines()
-        if _sFlag is not None:
-            if _sFlag in lFlags:
-                return True
-            return False
-        return lFlags
+        self._DEBUG("Reading flags; %s" % _sFileActual)
+        try:
+            oDatabase = self._database("flag")
+            if _sFlag is not None:
+                return oDatabase.execute("SELECT 1 FROM flags WHERE path = ? AND flag = ?", (_sFileActual, _sFlag)).fetchone() is not None
+            return [t[0] for t in oDatabase.execute("SELECT flag FROM flags WHERE path = ? ORDER BY flag", (_sFileActual, ))]
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to read flags store; %s" % str(e))
 
     def flagged(self, _sFileActual, _sFlag):
         """
@@ -1767,17 +4036,10 @@ class GCfgLib:
 
         # Differences
         if _sCommentPrefix is None:
-            sDifferences = self._shellCommand(["diff", "-uN", "--label", "ORIGINAL", sFileOriginal, _sFileActual], None, _bRedirectStdOut, True)
+            byDifferences = GCfgDiff().diff(sFileOriginal, _sFileActual, "ORIGINAL")
         else:
-            with tempfile.NamedTemporaryFile() as fFileOriginal_tmp:
-                with tempfile.NamedTemporaryFile() as fFileActual_tmp:
-                    sCommentRexExp = "^[[:space:]]*(%s|$)" % re.escape(_sCommentPrefix)
-                    fFileOriginal_tmp.write(self._shellCommand(["grep", "-Ev", sCommentRexExp, sFileOriginal], None, True, True).encode(sys.stdout.encoding))
-                    fFileActual_tmp.write(self._shellCommand(["grep", "-Ev", sCommentRexExp, _sFileActual], None, True, True).encode(sys.stdout.encoding))
-                    fFileOriginal_tmp.flush()
-                    fFileActual_tmp.flush()
-                    sDifferences = self._shellCommand(["diff", "-uN", "--label", "ORIGINAL", "--label", _sFileActual, fFileOriginal_tmp.name, fFileActual_tmp.name], None, _bRedirectStdOut, True)
-        return sDifferences
+            byDifferences = GCfgDiff().diff(sFileOriginal, _sFileActual, "ORIGINAL", _sFileActual, _sCommentPrefix)
+        return self._output(byDifferences, _bRedirectStdOut)
 
     def delta(self, _sFileActual, _sCommentPrefix=None, _bRedirectStdOut=True):
         """
@@ -1789,47 +4051,287 @@ class GCfgLib:
         @param  string  _sCommentPrefix   Comment prefix
         @param  bool    _bRedirectStdOut  Redirect standard output
 
-        @return string  Differences (diff -uN) output (if redirected)
+        @return string  Differences (diff -uN) output (if redirected)
+        """
+
+        try:
+
+            # Paths
+            sFileActual = self.getCanonicalPath(_sFileActual)
+            sFileGIT = self._getRepositoryPath("git", sFileActual)
+
+            # Check
+            if not os.path.exists(sFileGIT):
+                raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
+
+            # Remove flag
+            return self._delta(sFileActual, _sCommentPrefix, _bRedirectStdOut)
+
+        except EnvironmentError as e:
+            self._ERROR("%s; %s" % (e.strerror, _sFileActual))
+            raise EnvironmentError(e.errno, "Failed to retrieve the file differences")
+
+    def _deltaAll(self, _sFlag=None, _sCommentPrefix=None, _bStat=False, _iJobs=1):
+        """
+        Yield the differences between all files (matching the given flag) that have
+        an original content and the latter, in path order (files without differences
+        being skipped).
+        When using parallel jobs, differences are computed by as many processes.
+
+        @param  string  _sFlag           File flag to match
+        @param  string  _sCommentPrefix  Comment prefix
+        @param  bool    _bStat           Yield added/removed lines count (instead of differences)
+        @param  int     _iJobs           Parallel jobs (0 = CPUs count)
+
+        @return generator  (file, differences - diff -uN - or added/removed lines count) tuples
+        """
+
+        # Files (with an original content)
+        lFilesActual = []
+        lFilesOriginal = []
+        for (sFileActual, lFlags) in self._iterList(_sFlag):
+            sFileOriginal = self._getRepositoryPath("original", sFileActual)
+            if os.path.exists(sFileOriginal):
+                lFilesActual += [sFileActual]
+                lFilesOriginal += [sFileOriginal]
+        self._DEBUG("Computing differences; %d file(s)" % len(lFilesActual))
+
+        # Differences
+        oDiff = GCfgDiff()
+        fDiff = oDiff.stat if _bStat else oDiff.diff
+        llArguments = [
+            lFilesOriginal,
+            lFilesActual,
+            ["ORIGINAL"] * len(lFilesActual),
+            [sFileActual if _sCommentPrefix is not None else None for sFileActual in lFilesActual],
+            [_sCommentPrefix] * len(lFilesActual),
+        ]
+        if not _iJobs:
+            _iJobs = os.cpu_count() or 1
+        if _iJobs > 1 and len(lFilesActual) > 1:
+            import concurrent.futures
+            oExecutor = concurrent.futures.ProcessPoolExecutor(_iJobs)
+            iDifferences = oExecutor.map(fDiff, *llArguments, chunksize=max(1, min(64, len(lFilesActual) // (_iJobs * 4))))
+        else:
+            oExecutor = None
+            iDifferences = map(fDiff, *llArguments)
+        try:
+            for (sFileActual, mDifferences) in zip(lFilesActual, iDifferences):
+                if not mDifferences:
+                    continue
+                if not _bStat:
+                    mDifferences = mDifferences.decode(sys.stdout.encoding)
+                yield (sFileActual, mDifferences)
+        finally:
+            if oExecutor is not None:
+                oExecutor.shutdown(cancel_futures=True)
+
+    def deltaAll(self, _sFlag=None, _sCommentPrefix=None, _bStat=False, _iJobs=1):
+        """
+        Yield the differences between all files (matching the given flag) that have
+        an original content and the latter, in path order (files without differences
+        being skipped).
+        (including exceptions handling)
+
+        @param  string  _sFlag           File flag to match
+        @param  string  _sCommentPrefix  Comment prefix
+        @param  bool    _bStat           Yield added/removed lines count (instead of differences)
+        @param  int     _iJobs           Parallel jobs (0 = CPUs count)
+
+        @return generator  (file, differences - diff -uN - or added/removed lines count) tuples
+        """
+
+        try:
+
+            # Differences
+            yield from self._deltaAll(_sFlag, _sCommentPrefix, _bStat, _iJobs)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to retrieve the files differences")
+
+    def _packages(self, _sStatus=GCFG_PACKAGES_STATUS, _sExtendedStates=GCFG_PACKAGES_EXTENDED_STATES):
+        """
+        Return the list of (manually installed) packages, read from the given
+        packages status and extended states files; equivalent to 'apt-mark showmanual'
+        (packages of foreign architectures being suffixed with ':<architecture>').
+
+        @param  string  _sStatus          Packages status file (path)
+        @param  string  _sExtendedStates  Packages extended states file (path)
+
+        @return list  Packages (sorted)
+        """
+
+        def stanzas(_sFile):
+            # ... (Package, Architecture, Status, Auto-Installed) fields of each stanza
+            self._DEBUG("Reading packages state; %s" % _sFile)
+            try:
+                with open(_sFile, "r", encoding="utf-8", errors="surrogateescape") as fFile:
+                    sContent = fFile.read()
+            except FileNotFoundError:
+                return
+            for sStanza in sContent.split("\n\n"):
+                dsFields = {}
+                for sLine in sStanza.split("\n"):
+                    if sLine[:1] in ("P", "A", "S") and ": " in sLine:
+                        (sField, sValue) = sLine.split(": ", 1)
+                        dsFields[sField] = sValue.strip()
+                if "Package" in dsFields:
+                    yield dsFields
+
+        # Installed packages
+        ltPackages = []
+        sArchitecture = None
+        for dsFields in stanzas(_sStatus):
+            lsStatus = dsFields.get("Status", "").split()
+            if len(lsStatus) != 3 or lsStatus[2] in ("not-installed", "config-files"):
+                continue
+            ltPackages.append((dsFields["Package"], dsFields.get("Architecture", "all")))
+            if dsFields["Package"] == "dpkg":
+                sArchitecture = dsFields.get("Architecture")
+
+        # Automatically installed packages
+        # (architecture-independent packages being recorded with the native architecture)
+        stAuto = set()
+        for dsFields in stanzas(_sExtendedStates):
+            if dsFields.get("Auto-Installed") == "1":
+                stAuto.add((dsFields["Package"], dsFields.get("Architecture", sArchitecture)))
+
+        # Manually installed packages
+        lPackages = []
+        for (sPackage, sPackageArchitecture) in ltPackages:
+            if sPackageArchitecture == "all":
+                sPackageArchitecture = sArchitecture
+            if (sPackage, sPackageArchitecture) in stAuto:
+                continue
+            if sPackageArchitecture is not None and sPackageArchitecture != sArchitecture:
+                sPackage = "%s:%s" % (sPackage, sPackageArchitecture)
+            lPackages.append(sPackage)
+        return sorted(set(lPackages))
+
+    def _cache(self, _sName, _sSignature, _sData=None):
+        """
+        Return (or set) the given cached data, provided it matches the given signature.
+
+        @param  string  _sName       Cached data name
+        @param  string  _sSignature  Signature (of the data the cached data is derived from)
+        @param  string  _sData       Cached data (to set)
+
+        @return string  Cached data (None if missing or stale)
+        """
+
+        oIndex = self._index()
+        try:
+            if _sData is not None:
+                oIndex.execute("INSERT INTO cache (name, signature, data) VALUES (?, ?, ?) ON CONFLICT (name) DO UPDATE SET signature = excluded.signature, data = excluded.data", (_sName, _sSignature, _sData))
+                self._databaseCommit(oIndex)
+                return _sData
+            tEntry = oIndex.execute("SELECT data FROM cache WHERE name = ? AND signature = ?", (_sName, _sSignature)).fetchone()
+        except sqlite3.Error as e:
+            raise EnvironmentError(errno.EIO, "Failed to access files index cache; %s" % str(e))
+        if tEntry is None:
+            return None
+        return tEntry[0]
+
+    def _packagesState(self):
+        """
+        Return the stat signature (device, inode, size and modification time) of the
+        packages state files.
+
+        @return tuple(string,bool)  Stat signature and racy status (if the files might change within the same timestamp granularity)
         """
 
-        try:
+        lsSignature = []
+        iTime_ns = time.time_ns()
+        bRacy = False
+        for sFile in (GCFG_PACKAGES_STATUS, GCFG_PACKAGES_EXTENDED_STATES):
+            try:
+                oStat = os.stat(sFile)
+                lsSignature.append("%d:%d:%d:%d" % (oStat.st_dev, oStat.st_ino, oStat.st_size, oStat.st_mtime_ns))
+                bRacy = bRacy or oStat.st_ctime_ns >= iTime_ns - 2000000000
+            except FileNotFoundError:
+                lsSignature.append("-")
+        return ("/".join(lsSignature), bRacy)
+
+    def _packagesListing(self, _sSignature, _bRacy=False):
+        """
+        Return the (manually installed) packages listing, from the cache (in the files
+        index) unless the packages state files stat signature changed.
 
-            # Paths
-            sFileActual = self.getCanonicalPath(_sFileActual)
-            sFileGIT = self._getRepositoryPath("git", sFileActual)
+        @param  string  _sSignature  Packages state files stat signature
+        @param  bool    _bRacy       Racy status (do not cache racily-clean packages state)
 
-            # Check
-            if not os.path.exists(sFileGIT):
-                raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
+        @return string  Packages listing
+        """
 
-            # Remove flag
-            return self._delta(sFileActual, _sCommentPrefix, _bRedirectStdOut)
+        sListing = self._cache("pkglist", _sSignature)
+        if sListing is None:
+            sListing = "".join(["%s\n" % sPackage for sPackage in self._packages()])
+            if not _bRacy:
+                self._cache("pkglist", _sSignature, sListing)
+        else:
+            self._DEBUG("=> packages state unchanged; %s" % _sSignature)
+        return sListing
 
-        except EnvironmentError as e:
-            self._ERROR("%s; %s" % (e.strerror, _sFileActual))
-            raise EnvironmentError(e.errno, "Failed to retrieve the file differences")
+    def _write(self, _sFile, _sContent):
+        """
+        Write the given content to the given file, atomically (via a temporary file
+        renamed over the target file, whose permissions and ownership are preserved).
+
+        @param  string  _sFile     File (path)
+        @param  string  _sContent  Content
+        """
+
+        import tempfile
+        (iFile, sFileTemporary) = tempfile.mkstemp(prefix=".%s." % os.path.basename(_sFile), dir=os.path.dirname(_sFile))
+        try:
+            with os.fdopen(iFile, "w") as fFile:
+                fFile.write(_sContent)
+            if os.path.exists(_sFile):
+                oStat = os.stat(_sFile)
+                os.chmod(sFileTemporary, stat.S_IMODE(oStat.st_mode))
+                if os.geteuid() == 0:
+                    os.chown(sFileTemporary, oStat.st_uid, oStat.st_gid)
+            else:
+                iUmask = os.umask(0o022)
+                os.umask(iUmask)
+                os.chmod(sFileTemporary, 0o666 & ~iUmask)
+            os.replace(sFileTemporary, _sFile)
+        except OSError:
+            if os.path.exists(sFileTemporary):
+                os.remove(sFileTemporary)
+            raise
 
     def _pkglist(self, _sPath=None):
         """
         Return (or saves) the list of (manually installed) packages.
+        The listing is cached (in the files index) and re-computed only if the packages
+        state files stat data (device, inode, size and modification time) changed.
+        The packages listing file is (re-)written only if its content changed.
 
         @param  string   _sPath  File to save the packages listing to
 
         @return string  Packages listing (if not path is specified)
         """
 
-        # Execute shell command
-        lCommand = ["apt-mark", "showmanual"]
-        sStdOut = self._shellCommand(lCommand)
+        # Packages listing
+        sListing = self._packagesListing(*self._packagesState())
 
         # Save packages listing file
         if _sPath is not None:
+            try:
+                with open(_sPath, "r") as fPackageListing:
+                    if fPackageListing.read() == sListing:
+                        self._DEBUG("Packages listing file unchanged; %s" % _sPath)
+                        return None
+            except FileNotFoundError:
+                pass
             self._DEBUG("Saving packages listing file; %s" % _sPath)
             with open(_sPath, "w") as fPackageListing:
-                fPackageListing.write(sStdOut)
+                fPackageListing.write(sListing)
             return None
         else:
-            return sStdOut
+            return sListing
 
     def pkglist(self, _sPath=None):
         """
@@ -1850,6 +4352,98 @@ class GCfgLib:
             self._ERROR("%s; %s" % (e.strerror, _sPath))
             raise EnvironmentError(e.errno, "Failed to retrieve/save packages listing file")
 
+    def _pkgsave(self, _bIncremental=False, _sFileChanges=None):
+        """
+        Save the list of (manually installed) packages to the packages listing file,
+        atomically (along its GIT sibling, if tracked) and only if it changed.
+        In incremental mode, nothing is done unless the packages state changed since
+        last saved.
+
+        @param  bool    _bIncremental  Incremental mode
+        @param  string  _sFileChanges  File to record (append) added/removed packages to
+
+        @return tuple(list,list)  Added and removed packages
+        """
+
+        sPath = self.__asSubRepositories["pkglist"]
+
+        # Packages state
+        (sSignature, bRacy) = self._packagesState()
+        if _bIncremental and self._cache("pkgsave", sSignature) is not None:
+            self._DEBUG("Packages state unchanged since last saved; %s" % sSignature)
+            return ([], [])
+
+        # Packages listing
+        sListing = self._packagesListing(sSignature, bRacy)
+        sListing_saved = ""
+        if os.path.exists(sPath):
+            with open(sPath, "r") as fPackageListing:
+                sListing_saved = fPackageListing.read()
+        lPackagesAdded = []
+        lPackagesRemoved = []
+        if sListing != sListing_saved:
+            stPackages = set(sListing.splitlines())
+            stPackages_saved = set(sListing_saved.splitlines())
+            lPackagesAdded = sorted(stPackages - stPackages_saved)
+            lPackagesRemoved = sorted(stPackages_saved - stPackages)
+            self._DEBUG("Saving packages listing file; %s (+%d/-%d)" % (sPath, len(lPackagesAdded), len(lPackagesRemoved)))
+
+            # Save packages listing file (and its GIT sibling)
+            sFileGIT = self._getRepositoryPath("git", sPath)
+            if os.path.exists(sFileGIT):
+                self._indexFlush()
+                sLink = self._indexLink(sPath) or self._isLinked(sFileGIT, sPath)[1]
+                self._write(sFileGIT, sListing)
+                if sLink == "hardlink":
+                    sFileTemporary = os.path.join(os.path.dirname(sPath), ".%s.%d" % (os.path.basename(sPath), os.getpid()))
+                    os.link(sFileGIT, sFileTemporary)
+                    os.replace(sFileTemporary, sPath)
+                elif sLink != "symlink":
+                    self._write(sPath, sListing)
+                self._indexUpdate(sPath, sLink)
+            else:
+                self._write(sPath, sListing)
+
+            # Record changes
+            if _sFileChanges is not None and (lPackagesAdded or lPackagesRemoved):
+                sTimestamp = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+                with open(_sFileChanges, "a") as fChanges:
+                    fChanges.write("".join(["%s +%s\n" % (sTimestamp, s) for s in lPackagesAdded] + ["%s -%s\n" % (sTimestamp, s) for s in lPackagesRemoved]))
+        else:
+            self._DEBUG("Packages listing file unchanged; %s" % sPath)
+
+        # Packages state (last saved)
+        if not bRacy:
+            self._cache("pkgsave", sSignature, sListing)
+        return (lPackagesAdded, lPackagesRemoved)
+
+    def pkgsave(self, _bIncremental=False, _sFileChanges=None):
+        """
+        Save the list of (manually installed) packages to the packages listing file.
+        (including validation, informational messages and exceptions handling)
+
+        @param  bool    _bIncremental  Incremental mode (do nothing unless the packages state changed since last saved)
+        @param  string  _sFileChanges  File to record (append) added/removed packages to
+
+        @return tuple(list,list)  Added and removed packages
+        """
+
+        try:
+
+            # Validation
+            if "pkglist" not in self.__asSubRepositories:
+                raise EnvironmentError(errno.ENOENT, "Configuration repository not checked")
+
+            # Save packages listing file
+            (lPackagesAdded, lPackagesRemoved) = self._pkgsave(_bIncremental, _sFileChanges)
+            if lPackagesAdded or lPackagesRemoved:
+                self._INFO("Packages listing file successfully saved; +%d/-%d package(s)" % (len(lPackagesAdded), len(lPackagesRemoved)))
+            return (lPackagesAdded, lPackagesRemoved)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to save packages listing file")
+
     def _git(self, _sCommand, _lArguments, _bRedirectStdOut=True):
         """
         Execute the given GIT command for the given file.
@@ -1870,11 +4464,37 @@ class GCfgLib:
         # ... default commit author
         if _sCommand == "commit":
             if "--author" not in _lArguments:
-                _lArguments += ["--author", "%s <%s>" % (self.__sAuthor, self.__sEmail)]
+                _lArguments += ["--author", "%s <%s>" % (self.__sAuthor, self._getEmail())]
 
         # Execute the GIT command
         return self._gitCommand([_sCommand] + _lArguments, _bRedirectStdOut)
 
+    def _gitReadOnly(self, _sCommand, _lArguments):
+        """
+        Return whether the given GIT command is read-only (modifying neither the
+        repository nor its working tree).
+
+        @param  string  _sCommand    GIT (sub-)command
+        @param  string  _lArguments  Additional arguments
+
+        @return bool  True if the command is read-only
+        """
+
+        if _sCommand in GCFG_GIT_COMMANDS_READONLY:
+            return True
+        lPositionals = [s for s in _lArguments if s[:1] != "-"]
+        if _sCommand in ("branch", "tag"):
+            return "-l" in _lArguments or "--list" in _lArguments or not lPositionals
+        if _sCommand == "reflog":
+            return lPositionals[:1] in ([], ["show"])
+        if _sCommand == "stash":
+            return lPositionals[:1] in (["list"], ["show"])
+        if _sCommand == "remote":
+            return lPositionals[:1] in ([], ["show"], ["get-url"])
+        if _sCommand == "config":
+            return any(s in ("-l", "--list") or s.startswith("--get") for s in _lArguments)
+        return False
+
     def git(self, _lArguments, _bRedirectStdOut=True):
         """
         Execute 'git' with the given arguments.
@@ -1889,9 +4509,6 @@ class GCfgLib:
 
         try:
 
-            # Verify repository
-            self.verify(_bBatch=_bRedirectStdOut)
-
             # Parse command line
             lArguments = []
             sCommand = None
@@ -1901,14 +4518,101 @@ class GCfgLib:
                         sCommand = s
                         continue
                 lArguments += [s]
+            bReadOnly = self._gitReadOnly(sCommand, lArguments)
+
+            # Verify repository (files changed since last verified)
+            if not bReadOnly:
+                self.verify(_bBatch=_bRedirectStdOut, _bIncremental=True)
 
             # GIT command
-            return self._git(sCommand, lArguments, _bRedirectStdOut)
+            sOutput = self._git(sCommand, lArguments, _bRedirectStdOut)
+
+            # Files index (GIT sub-repository working tree may have been modified)
+            if not bReadOnly and sCommand not in GCFG_GIT_COMMANDS_NOWORKTREE:
+                self._reindex()
+            return sOutput
 
         except EnvironmentError as e:
             self._ERROR(e.strerror)
             raise EnvironmentError(e.errno, "Failed to execute GIT command")
 
+    def _checkpoint(self, _sMessage, _sTag=None):
+        """
+        Commit the GIT sub-repository changes (and tag the resulting commit).
+        Using GIT plumbing commands, only the paths reported as changed by GIT status
+        are staged, the commit being created and references updated in a single pass.
+
+        @param  string  _sMessage  Commit message
+        @param  string  _sTag      Tag name
+
+        @return string  Commit ID
+        """
+
+        oGitBackend = self._getGitBackend()
+
+        # Verify repository (files changed since last verified)
+        self._verify(_bBatch=True, _bIncremental=True)
+
+        # Stage changed paths
+        lPaths = [sPath for (sPath, sStatus) in oGitBackend.status() if sStatus[1] != " " and sStatus != "!!"]
+        self._DEBUG("Staging changed paths; %d path(s)" % len(lPaths))
+        if lPaths:
+            self._gitCommand(["update-index", "--add", "--remove", "-z", "--stdin"], True, b"".join([sPath.encode(sys.getfilesystemencoding(), "surrogateescape") + b"\0" for sPath in lPaths]))
+
+        # Commit
+        sTree = self._gitCommand(["write-tree"]).strip()
+        tParent = oGitBackend.info("HEAD")
+        if tParent is not None and oGitBackend.info("HEAD^{tree}")[0] == sTree:
+            self._DEBUG("No changes to commit; %s" % tParent[0])
+            sCommit = tParent[0]
+            lUpdates = []
+        else:
+            lCommand = ["commit-tree", sTree, "-m", _sMessage]
+            if tParent is not None:
+                lCommand += ["-p", tParent[0]]
+            sEmail = self._getEmail()
+            sCommit = self._gitCommand(lCommand, True, None, {"GIT_AUTHOR_NAME": self.__sAuthor, "GIT_AUTHOR_EMAIL": sEmail}).strip()
+            lUpdates = ["update HEAD %s %s" % (sCommit, tParent[0] if tParent is not None else "")]
+
+        # References (HEAD and tag; atomically)
+        if _sTag is not None:
+            lUpdates += ["create refs/tags/%s %s" % (_sTag, sCommit)]
+        if lUpdates:
+            self._gitCommand(["update-ref", "-m", "commit: %s" % _sMessage.splitlines()[0] if _sMessage else "commit", "--stdin"], True, ("\n".join(lUpdates) + "\n").encode(sys.getfilesystemencoding(), "surrogateescape"))
+        return sCommit
+
+    def checkpoint(self, _sMessage, _sTag=None):
+        """
+        Commit the GIT sub-repository changes (and tag the resulting commit),
+        at a cost proportional to the number of changed files.
+        (including validation, informational messages and exceptions handling)
+
+        @param  string  _sMessage  Commit message
+        @param  string  _sTag      Tag name
+
+        @return string  Commit ID
+        """
+
+        try:
+
+            # Validation
+            if "git" not in self.__asSubRepositories:
+                raise EnvironmentError(errno.ENOENT, "Configuration repository not checked")
+            if _sTag is not None and (not _sTag or any(c in _sTag for c in " \t\n~^:?*[\\") or ".." in _sTag or _sTag[0] in "-/." or _sTag[-1] in "/." or _sTag.endswith(".lock")):
+                raise EnvironmentError(errno.EINVAL, "Invalid tag name; %s" % _sTag)
+            # ... (before anything gets staged or committed)
+            if _sTag is not None and self._getGitBackend().info("refs/tags/%s" % _sTag) is not None:
+                raise EnvironmentError(errno.EEXIST, "Tag already exists; %s" % _sTag)
+
+            # Checkpoint
+            sCommit = self._checkpoint(_sMessage, _sTag)
+            self._INFO("Configuration checkpoint successfully committed; %s" % sCommit)
+            return sCommit
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to commit configuration checkpoint")
+
     def _a2ps(self, _sFilePostscript, _sFlag=None, _bBatch=False, _bForce=False):
         """
         Create a Postscript document with all (text) files in the configuration repository.
@@ -1920,22 +4624,17 @@ class GCfgLib:
         """
 
         # Retrieve the files list, along their type
+        import subprocess
         self._DEBUG("Retrieving GIT files list")
-        oPopen = subprocess.Popen(
-            ["find", ".", "-type", "f", "-not", "-path", "./.git/*", "-print0"],
-            cwd=self._getRepositoryPath("git"),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        bFiles = "".join(["./%s\0" % s.lstrip(os.sep) for s in self._indexList()]).encode(sys.stdout.encoding)
         oPopen_sub = subprocess.Popen(
             ["xargs", "-0", "file", "-N"],
             cwd=self._getRepositoryPath("git"),
-            stdin=oPopen.stdout,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
-        oPopen.stdout.close()
-        (bStdOut, bStdErr) = oPopen_sub.communicate()
+        (bStdOut, bStdErr) = oPopen_sub.communicate(bFiles)
         if oPopen_sub.returncode != 0:
             raise EnvironmentError(oPopen_sub.returncode, bStdErr.decode(sys.stderr.encoding))
         dlFiles = {}
@@ -1945,11 +4644,14 @@ class GCfgLib:
 
         # Filter non-text files out
         self._DEBUG("Filtering (text) files; flag=%s" % _sFlag)
+        dFiles_flagged = None
+        if _sFlag is not None:
+            dFiles_flagged = self._list(_sFlag)
         lFiles = []
         for sFile, sType in dlFiles.items():
             if self.__reFileText.search(sType) is None:
                 continue
-            if _sFlag is not None and not self._flagged(sFile, _sFlag):
+            if dFiles_flagged is not None and sFile not in dFiles_flagged:
                 continue
             lFiles += [sFile]
 
@@ -1995,3 +4697,333 @@ class GCfgLib:
         except EnvironmentError as e:
             self._ERROR("%s; %s" % (e.strerror, _sFilePostscript))
             raise EnvironmentError(e.errno, "Failed to create Postcript file")
+
+    #
+    # API (batch commands)
+    #
+
+    def _getCanonicalPaths(self, _lPaths):
+        """
+        Return the canonical paths matching the given input (file) paths,
+        resolving each parent directory only once.
+
+        @param  list  _lPaths  Files paths
+
+        @return dict  Canonical path - or EnvironmentError if invalid - for each input path
+        """
+
+        dsParents = {}
+        dmPaths = {}
+        for sPath in _lPaths:
+            if sPath in dmPaths:
+                continue
+
+            # Parent directory
+            sParent = self._dirpath(sPath)
+            if not sParent:
+                sParent = "."
+            if sParent not in dsParents:
+                try:
+                    if stat.S_ISDIR(os.stat(sParent).st_mode):
+                        dsParents[sParent] = os.path.normpath(os.path.join(self.__sWorkingDirectory, sParent))
+                    else:
+                        dsParents[sParent] = None
+                except OSError:
+                    dsParents[sParent] = None
+
+            # File
+            try:
+                oStat = os.stat(sPath)
+            except OSError:
+                oStat = None
+            if oStat is not None and not stat.S_ISREG(oStat.st_mode):
+                dmPaths[sPath] = EnvironmentError(errno.ENOENT, "Invalid path")
+            elif dsParents[sParent] is None:
+                dmPaths[sPath] = EnvironmentError(errno.ENOENT, "No such file or directory")
+            else:
+                dmPaths[sPath] = os.path.join(dsParents[sParent], os.path.basename(sPath))
+
+        return dmPaths
+
+    def _batch(self, _lFilesActual, _fOperation, *_lArguments):
+        """
+        Apply the given operation to each of the given files, within a batch session:
+         - canonical paths are resolved once per parent directory
+         - files are processed directory by directory (filesystem data being cached)
+         - databases changes are committed once, at the end of the session
+        Errors are reported per file, without interrupting the session.
+
+        @param  list      _lFilesActual  Actual files (paths)
+        @param  function  _fOperation    Operation, called with each file canonical and input paths, followed by the given arguments
+        @param  list      _lArguments    Operation (additional) arguments
+
+        @return list  Summary result for each file: (path, success, result or error message)
+        """
+
+        # Paths
+        dmFilesActual = self._getCanonicalPaths(_lFilesActual)
+        lFilesActual = sorted([s for s in dmFilesActual if isinstance(dmFilesActual[s], str)], key=lambda s: dmFilesActual[s])
+
+        # Operation
+        dtResults = {}
+        for sFileActual in dmFilesActual:
+            if not isinstance(dmFilesActual[sFileActual], str):
+                self._ERROR("%s; %s" % (dmFilesActual[sFileActual].strerror, sFileActual))
+                dtResults[sFileActual] = (sFileActual, False, dmFilesActual[sFileActual].strerror)
+        self.__bBatchSession = True
+        try:
+            for sFileActual in lFilesActual:
+                try:
+                    dtResults[sFileActual] = (sFileActual, True, _fOperation(dmFilesActual[sFileActual], sFileActual, *_lArguments))
+                except EnvironmentError as e:
+                    self._ERROR("%s; %s" % (e.strerror, sFileActual))
+                    dtResults[sFileActual] = (sFileActual, False, e.strerror)
+        finally:
+            self.__bBatchSession = False
+            self.__diDevices = {}
+            try:
+                self._indexFlush()
+                self._databaseCommit()
+            except sqlite3.Error as e:
+                raise EnvironmentError(errno.EIO, "Failed to commit databases changes; %s" % str(e))
+
+        # Done
+        return [dtResults[s] for s in _lFilesActual]
+
+    def _batchAdd(self, _sFileActual, _sPath, _sbFileOriginal=None, _sLink=None, _bForce=False):
+        """
+        Add the given file to the GIT sub-repository (batch session operation).
+
+        @param  string            _sFileActual     Actual file (canonical path)
+        @param  string            _sPath           Actual file (input path)
+        @param  string|bool|dict  _sbFileOriginal  See addMany()
+        @param  string            _sLink           Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool              _bForce          Forced batch mode
+
+        @return bool  True if the file was actually added
+        """
+
+        # Paths
+        sFileGIT = self._getRepositoryPath("git", _sFileActual)
+        sFileOriginal = self._getRepositoryPath("original", _sFileActual)
+        if isinstance(_sbFileOriginal, dict):
+            sFileOriginal_source = _sbFileOriginal.get(_sPath)
+        elif isinstance(_sbFileOriginal, bool):
+            sFileOriginal_source = _sPath if _sbFileOriginal else None
+        else:
+            sFileOriginal_source = _sbFileOriginal
+
+        # Check
+        if os.path.exists(sFileGIT) and not _bForce:
+            return False
+        if sFileOriginal_source is not None:
+            try:
+                os.stat(sFileOriginal_source)
+            except EnvironmentError as e:
+                raise EnvironmentError(e.errno, "Missing or unreadable original file")
+            if os.path.exists(sFileOriginal) and not _bForce:
+                raise EnvironmentError(errno.EPERM, "Cannot update original file (unless forced)")
+
+        # Add file
+        if sFileOriginal_source is not None:
+            self._saveFileOriginal(sFileOriginal, sFileOriginal_source, True, _bForce)
+        self._saveFileGIT(sFileGIT, _sFileActual, _sLink, True, _bForce)
+        self._INFO("File successfully added to configuration repository; %s" % _sPath)
+        return True
+
+    def addMany(self, _lFilesActual, _sbFileOriginal=None, _sLink=None, _bForce=False):
+        """
+        Add or create the given files to the GIT sub-repository, in batch mode.
+        (including validation, informational messages and exceptions handling)
+
+        @param  list              _lFilesActual    Actual files (paths)
+        @param  string|bool|dict  _sbFileOriginal  Original file (path); or, if True, use each actual file as original (or don't if False); or original file (path) for each actual file (path)
+        @param  string            _sLink           Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool              _bForce          Forced batch mode
+
+        @return list  Summary result for each file: (path, success, True if the file was actually added - or error message)
+        """
+
+        try:
+            return self._batch(_lFilesActual, self._batchAdd, _sbFileOriginal, _sLink, _bForce)
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to add files to configuration repository")
+
+    def _batchLink(self, _sFileActual, _sPath, _sLink=None, _bForce=False):
+        """
+        Link the given actual file to its GIT sibling (batch session operation).
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sPath        Actual file (input path)
+        @param  string  _sLink        Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool    _bForce       Forced batch mode
+
+        @return string  Created link type; None no link was created
+        """
+
+        sLink = self._link(self._getRepositoryPath("git", _sFileActual), _sFileActual, _sLink, True, _bForce)
+        if sLink is not None:
+            self._INFO("File successfully linked to its GIT sibling; %s (%s)" % (_sPath, sLink))
+        return sLink
+
+    def linkMany(self, _lFilesActual, _sLink=None, _bForce=False):
+        """
+        Link the given actual files to their GIT sibling, in batch mode.
+        Contrary to link(), files whose path is invalid are NOT removed
+        (but reported as failed).
+        (including validation, informational messages and exceptions handling)
+
+        @param  list    _lFilesActual  Actual files (paths)
+        @param  string  _sLink         Link type (among: 'hardlink', 'symlink', 'copy', 'reflink' or None)
+        @param  bool    _bForce        Forced batch mode
+
+        @return list  Summary result for each file: (path, success, created link type - or error message)
+        """
+
+        try:
+            return self._batch(_lFilesActual, self._batchLink, _sLink, _bForce)
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to link files to their GIT sibling")
+
+    def _batchFlag(self, _sFileActual, _sPath, _sFlag, _bUnflag=False):
+        """
+        Add (or remove) the given flag to (from) the given file (batch session operation).
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sPath        Actual file (input path)
+        @param  string  _sFlag        File flag
+        @param  bool    _bUnflag      Remove flag (instead of adding it)
+
+        @return bool  True
+        """
+
+        # Check
+        if not os.path.exists(self._getRepositoryPath("git", _sFileActual)):
+            raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
+
+        # Add/remove flag
+        if _bUnflag:
+            self._unflag(_sFileActual, _sFlag)
+        else:
+            self._flag(_sFileActual, _sFlag)
+        return True
+
+    def flagMany(self, _lFilesActual, _sFlag, _bForce=False):
+        """
+        Add the given flag to the given files.
+        (including validation, informational messages and exceptions handling)
+
+        @param  list    _lFilesActual  Actual files (paths)
+        @param  string  _sFlag         File flag
+        @param  bool    _bForce        Forced mode (allow any flag)
+
+        @return list  Summary result for each file: (path, success, True - or error message)
+        """
+
+        try:
+
+            # Check flag
+            if not _bForce and any((c not in "_-abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ01234567890") for c in _sFlag):
+                raise EnvironmentError(errno.EINVAL, "Invalid flag; %s" % _sFlag)
+
+            # Add flag
+            return self._batch(_lFilesActual, self._batchFlag, _sFlag)
+
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to add flag to files")
+
+    def unflagMany(self, _lFilesActual, _sFlag):
+        """
+        Remove the given flag from the given files.
+        (including validation, informational messages and exceptions handling)
+
+        @param  list    _lFilesActual  Actual files (paths)
+        @param  string  _sFlag         File flag
+
+        @return list  Summary result for each file: (path, success, True - or error message)
+        """
+
+        try:
+            return self._batch(_lFilesActual, self._batchFlag, _sFlag, True)
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to remove flag from files")
+
+    def _batchRemove(self, _sFileActual, _sPath, _bForce=False):
+        """
+        Remove the given file from the configuration repository (batch session operation).
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sPath        Actual file (input path)
+        @param  bool    _bForce       Forced batch mode
+
+        @return bool  True if the file was actually removed
+        """
+
+        # Check
+        if not os.path.exists(self._getRepositoryPath("git", _sFileActual)):
+            if not _bForce:
+                raise EnvironmentError(errno.ENOENT, "No such file (in configuration repository)")
+        elif not _bForce and self._flagged(_sFileActual, "@EDITED"):
+            raise EnvironmentError(errno.EPERM, "Cannot remove @EDITED file (unless forced)")
+
+        # Remove file
+        bRemoved = self._remove(_sFileActual, True, _bForce)
+        if bRemoved:
+            if os.path.exists(_sFileActual):
+                self._INFO("Original file successfully restored; %s" % _sPath)
+            else:
+                self._INFO("File successfully removed; %s" % _sPath)
+        return bRemoved
+
+    def removeMany(self, _lFilesActual, _bForce=False):
+        """
+        Remove the given files from the configuration repository, in batch mode.
+        (including validation, informational messages and exceptions handling)
+
+        @param  list  _lFilesActual  Actual files (paths)
+        @param  bool  _bForce        Forced batch mode
+
+        @return list  Summary result for each file: (path, success, True if the file was actually removed - or error message)
+        """
+
+        try:
+            return self._batch(_lFilesActual, self._batchRemove, _bForce)
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to remove files")
+
+    def _batchStatus(self, _sFileActual, _sPath):
+        """
+        Return the status of the given file (batch session operation).
+
+        @param  string  _sFileActual  Actual file (canonical path)
+        @param  string  _sPath        Actual file (input path)
+
+        @return tuple(bool,string,list,string)  Match status, link type (None if untracked), flags and GIT file (canonical path)
+        """
+
+        sFileGIT = self._getRepositoryPath("git", _sFileActual)
+        if not os.path.exists(sFileGIT):
+            return (False, None, [], sFileGIT)
+        (bLinked, sLink) = self._isLinked(sFileGIT, _sFileActual)
+        return (bLinked, sLink, self._flagged(_sFileActual), sFileGIT)
+
+    def statusMany(self, _lFilesActual):
+        """
+        Return the status - link match status and type, flags - of the given files.
+        (including exceptions handling)
+
+        @param  list  _lFilesActual  Actual files (paths)
+
+        @return list  Summary result for each file: (path, success, status - see _batchStatus() - or error message)
+        """
+
+        try:
+            return self._batch(_lFilesActual, self._batchStatus)
+        except EnvironmentError as e:
+            self._ERROR(e.strerror)
+            raise EnvironmentError(e.errno, "Failed to retrieve files status")
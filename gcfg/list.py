@@ -87,9 +87,7 @@ class GCfgList(GCfgBin):
         oGCfgLib.setDebug(self._oArguments.debug)
         if not oGCfgLib.check():
             return errno.EPERM
-        dlFiles = oGCfgLib.list(self._oArguments.flag)
-        for sFile in sorted(dlFiles):
-            lFlags = dlFiles[sFile]
+        for (sFile, lFlags) in oGCfgLib.iterList(self._oArguments.flag):
             if lFlags is not None:
                 sys.stdout.write("%s:%s\n" % (sFile, ",".join(lFlags)))
             else:
@@ -50,9 +50,21 @@ class GCfgPkgSave(GCfgBin):
             textwrap.dedent(r"""
                 synopsis:
                   Save the list of (manually) installed packages.
+                  In incremental mode (e.g. from an APT 'DPkg::Post-Invoke' hook), nothing
+                  is done unless the packages state changed since last saved.
             """)
         )
 
+        # Additional arguments
+        self._oArgumentParser.add_argument(
+            "-i", "--incremental", action="store_true",
+            help="do nothing unless the packages state changed since last saved"
+        )
+        self._oArgumentParser.add_argument(
+            "-c", "--changes", type=str, metavar="<file>",
+            help="record (append) added/removed packages to the given file"
+        )
+
     #------------------------------------------------------------------------------
     # METHODS
     #------------------------------------------------------------------------------
@@ -81,5 +93,5 @@ class GCfgPkgSave(GCfgBin):
         oGCfgLib.setSilent(self._oArguments.silent)
         if not oGCfgLib.check():
             return errno.EPERM
-        oGCfgLib.pkglist(oGCfgLib.getRepositoryPath("pkglist"))
+        oGCfgLib.pkgsave(self._oArguments.incremental, self._oArguments.changes)
         return 0
@@ -18,6 +18,7 @@
 #
 
 import errno
+import sys
 import textwrap
 
 from gcfg import GCfgBin
@@ -50,6 +51,14 @@ class GCfgVerify(GCfgBin):
             textwrap.dedent(r"""
                 synopsis:
                   Verify the consistency of the configuration repository (links)
+
+                check mode (--check):
+                  Check the consistency of the configuration repository, without ever
+                  modifying files or prompting for confirmation; inconsistent files are
+                  reported along their status (broken-hardlink, broken-symlink,
+                  copy-differs, missing-actual, missing-git, error), followed by the
+                  count of files per status.
+                  Exit code is 1 if inconsistencies are found (0 otherwise).
             """)
         )
 
@@ -57,6 +66,23 @@ class GCfgVerify(GCfgBin):
         self._addOptionBatch(self._oArgumentParser)
         self._addOptionForce(self._oArgumentParser)
         self._addOptionLink(self._oArgumentParser)
+        self._addOptionJobs(self._oArgumentParser)
+        self._oArgumentParser.add_argument(
+            "-P", "--paranoid", action="store_true",
+            help="always compare the full content of copy-linked files (ignoring cached stat signatures)"
+        )
+        self._oArgumentParser.add_argument(
+            "-D", "--digest", action="store_true",
+            help="compare copy-linked files to their GIT sibling digest (files index), reading only the actual file"
+        )
+        self._oArgumentParser.add_argument(
+            "-C", "--check", action="store_true",
+            help="check links in a read-only (and never interactive) way and report inconsistent files"
+        )
+        self._oArgumentParser.add_argument(
+            "-M", "--metrics-file", type=str, metavar="<path>",
+            help="write the configuration repository metrics to the given (node_exporter textfile) file (implies --check)"
+        )
         self._oArgumentParser.add_argument(
             "file", type=str, metavar="<file>", nargs="?",
             help="specific file to verify (or force to change link type)"
@@ -88,12 +114,29 @@ class GCfgVerify(GCfgBin):
         oGCfgLib = self._getLibrary()
         oGCfgLib.setDebug(self._oArguments.debug)
         oGCfgLib.setSilent(self._oArguments.silent)
+        oGCfgLib.setParanoid(self._oArguments.paranoid)
+        oGCfgLib.setDigest(self._oArguments.digest)
         if not oGCfgLib.check():
             return errno.EPERM
+        if self._oArguments.check or self._oArguments.metrics_file is not None:
+            ltStatuses = oGCfgLib.verifyCheck(
+                self._oArguments.file,
+                self._oArguments.jobs,
+                self._oArguments.metrics_file
+            )
+            diStatuses = dict.fromkeys(["ok", "broken-hardlink", "broken-symlink", "copy-differs", "missing-actual", "missing-git", "error"], 0)
+            for (sFile, _, sStatus) in ltStatuses:
+                diStatuses[sStatus] += 1
+                if sStatus != "ok":
+                    sys.stdout.write("%s: %s\n" % (sStatus, sFile))
+            if not self._oArguments.silent or diStatuses["ok"] != len(ltStatuses):
+                sys.stdout.write("%s\n" % ", ".join(["%s=%d" % (sStatus, iCount) for (sStatus, iCount) in diStatuses.items()]))
+            return 0 if diStatuses["ok"] == len(ltStatuses) else 1
         oGCfgLib.verify(
             self._oArguments.file,
             self._oArguments.link,
             self._oArguments.batch,
-            self._oArguments.force
+            self._oArguments.force,
+            self._oArguments.jobs
         )
         return 0
@@ -24,12 +24,16 @@ directory may be specified when configuring the utility). This directory holds:
  * an "original" (sub-)repository ('/etc/gcfg/original'), used to keep a
    copy of original files
 
- * a "flag" (sub-)repository ('/etc/gcfg/flag'), used to associate flags
-   to files
+ * a flags store ('/etc/gcfg/flags.db'), used to associate flags to files
+   (the legacy "flag" sub-directory of earlier versions is migrated automatically)
 
  * a packages listing file ('/etc/gcfg/pkglist'), which lists all the packages
    that are marked as "manually" installed
 
+ * a files index ('/etc/gcfg/index.db'), which records each tracked file along
+   its link type, stat data and content digest; it is entirely derived from the
+   GIT (sub-)repository and may be rebuilt at any time using 'gcfg reindex'
+
 Before issuing any 'gcfg' commands, one may first configure the utility environ-
 ment (GCFG_* variables) using the 'source gcfg' command.
 
@@ -0,0 +1,78 @@
+# -*- mode:python; tab-width:4; c-basic-offset:4; intent-tabs-mode:nil; -*-
+# ex: filetype=python tabstop=4 softtabstop=4 shiftwidth=4 expandtab autoindent smartindent
+
+#
+# GIT-based Configuration Tracking Utility (GCFG)
+# Copyright (C) 2015 Cedric Dufour <http://cedric.dufour.name>
+# Author: Cedric Dufour <http://cedric.dufour.name>
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is free software:
+# you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, Version 3.
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is distributed in the hope
+# that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the GNU General Public License for more details.
+#
+
+import errno
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from gcfg import GCfgLib
+
+
+#------------------------------------------------------------------------------
+# CLASSES
+#------------------------------------------------------------------------------
+
+class GCfgTestCheckpoint(unittest.TestCase):
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Checkpoint (plumbing-based commit)
+    """
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp(prefix="gcfg-test.")
+        self.sRoot = os.path.join(self.sDirectory, "gcfg")
+        self.sFile = os.path.join(self.sDirectory, "foobar.conf")
+        with open(self.sFile, "w") as oFile:
+            oFile.write("foo=bar\n")
+        self.oGCfgLib = GCfgLib("test", "test@localhost", self.sRoot)
+        self.oGCfgLib.setSilent(True)
+        self.assertTrue(self.oGCfgLib.check(_bInitialize=True, _bBatch=True))
+        self.oGCfgLib.add(self.sFile, _bBatch=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def _git(self, *_lArguments):
+        return subprocess.run(
+            ["git"] + list(_lArguments),
+            cwd=os.path.join(self.sRoot, "git"), stdout=subprocess.PIPE, check=True
+        ).stdout.decode().strip()
+
+    def test_tag(self):
+        sCommit = self.oGCfgLib.checkpoint("First", "first")
+        self.assertEqual(self._git("rev-parse", "HEAD"), sCommit)
+        self.assertEqual(self._git("rev-parse", "refs/tags/first"), sCommit)
+
+    def test_tag_exists(self):
+        sCommit = self.oGCfgLib.checkpoint("First", "first")
+        with open(self.sFile, "a") as oFile:
+            oFile.write("bar=foo\n")
+        with self.assertRaises(EnvironmentError) as oContext:
+            self.oGCfgLib.checkpoint("Second", "first")
+        self.assertEqual(oContext.exception.errno, errno.EEXIST)
+        # ... nothing committed, tagged or staged
+        self.assertEqual(self._git("rev-parse", "HEAD"), sCommit)
+        self.assertEqual(self._git("rev-parse", "refs/tags/first"), sCommit)
+        self.assertEqual(self._git("diff", "--cached", "--name-only"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# -*- mode:python; tab-width:4; c-basic-offset:4; intent-tabs-mode:nil; -*-
+# ex: filetype=python tabstop=4 softtabstop=4 shiftwidth=4 expandtab autoindent smartindent
+
+#
+# GIT-based Configuration Tracking Utility (GCFG)
+# Copyright (C) 2015 Cedric Dufour <http://cedric.dufour.name>
+# Author: Cedric Dufour <http://cedric.dufour.name>
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is free software:
+# you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, Version 3.
+#
+# The GIT-based Configuration Tracking Utility (GCFG) is distributed in the hope
+# that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the GNU General Public License for more details.
+#
+
+import os
+import unittest
+
+from gcfg import GCfgLib
+
+
+# Constants
+GCFG_TESTS_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+#------------------------------------------------------------------------------
+# CLASSES
+#------------------------------------------------------------------------------
+
+class GCfgTestPackages(unittest.TestCase):
+    """
+    GIT-based Configuration Tracking Utility (GCFG) - Packages inventory ('apt-mark showmanual' equivalent)
+    """
+
+    def setUp(self):
+        self.oGCfgLib = GCfgLib("test", "test@localhost", "/nonexistent")
+        self.sStatus = os.path.join(GCFG_TESTS_FIXTURES, "dpkg-status")
+        self.sExtendedStates = os.path.join(GCFG_TESTS_FIXTURES, "extended_states")
+
+    def test_manual(self):
+        self.assertEqual(
+            self.oGCfgLib._packages(self.sStatus, self.sExtendedStates),
+            ["bash", "dpkg", "libc6:i386", "python3-doc"]
+        )
+
+    def test_foreign_architecture(self):
+        lPackages = self.oGCfgLib._packages(self.sStatus, self.sExtendedStates)
+        # ... manual foreign-architecture package suffixed; automatic one left out
+        self.assertIn("libc6:i386", lPackages)
+        self.assertNotIn("libfoo1:i386", lPackages)
+        # ... automatic native-architecture sibling left out
+        self.assertNotIn("libc6", lPackages)
+
+    def test_architecture_all(self):
+        lPackages = self.oGCfgLib._packages(self.sStatus, self.sExtendedStates)
+        # ... automatic 'Architecture: all' package, recorded under the native architecture
+        self.assertNotIn("tzdata", lPackages)
+        # ... manual 'Architecture: all' package, never suffixed
+        self.assertIn("python3-doc", lPackages)
+
+    def test_not_installed(self):
+        lPackages = self.oGCfgLib._packages(self.sStatus, self.sExtendedStates)
+        self.assertNotIn("oldpkg", lPackages)   # config-files
+        self.assertNotIn("gonepkg", lPackages)  # not-installed
+
+    def test_no_extended_states(self):
+        self.assertEqual(
+            self.oGCfgLib._packages(self.sStatus, os.path.join(GCFG_TESTS_FIXTURES, "nonexistent")),
+            ["bash", "dpkg", "libc6", "libc6:i386", "libfoo1:i386", "python3-doc", "tzdata"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()